@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Benchmark: building a PhAdorbVariant with full validation vs. PhAdorbVariant.from_trusted().
+
+Run from the repository root with:
+    >>> python -m benchmarks.bench_variant_construction [number-of-repeats]
+"""
+
+import sys
+import timeit
+
+from ph_adorb.variant import PhAdorbVariant
+from tests.variant_factory import example_variant_fields
+
+
+def main(_repeats: int = 20) -> None:
+    fields = example_variant_fields()
+    validated = min(timeit.repeat(lambda: PhAdorbVariant(**fields), number=1, repeat=_repeats))
+    trusted = min(timeit.repeat(lambda: PhAdorbVariant.from_trusted(**fields), number=1, repeat=_repeats))
+    variant = PhAdorbVariant.from_trusted(**fields)
+    cloned = min(timeit.repeat(lambda: variant.clone(price_of_carbon=0.5), number=1, repeat=_repeats))
+
+    print(f"PhAdorbVariant(...)              : {validated * 1_000:10.3f} ms")
+    print(f"PhAdorbVariant.from_trusted(...) : {trusted * 1_000:10.3f} ms")
+    print(f"Speedup                          : {validated / trusted:10.1f} x")
+    print(f"PhAdorbVariant.clone(...)        : {cloned * 1_000:10.3f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -10,11 +10,18 @@ greenhouse gas emissions, and a renewable-energy system-transition cost based on
 electrical service capacity.
 """
 
+from __future__ import annotations
+
 import logging
-import pandas as pd
+from typing import TYPE_CHECKING, Sequence
+
+import numpy as np
 
 from ph_adorb.yearly_values import YearlyCost, YearlyPresentValueFactor
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 # -- Constants
@@ -25,6 +32,21 @@ USA_NATIONAL_TRANSITION_COST = 4.5e12
 NAMEPLATE_CAPACITY_INCREASE_GW = 1_600
 USA_TRANSITION_COST_FACTOR = USA_NATIONAL_TRANSITION_COST / (NAMEPLATE_CAPACITY_INCREASE_GW * 1e9)
 
+# -- Discount rates and factors
+ENERGY_DISCOUNT_RATE = 0.02
+OPERATIONAL_CO2_DISCOUNT_RATE = 0.075
+EMBODIED_CO2_DISCOUNT_RATE = 0.0
+EMBODIED_CO2_FACTOR = 0.75
+
+# -- The columns of the yearly ADORB costs table, in order.
+ADORB_COLUMNS = (
+    "pv_direct_energy",
+    "pv_operational_CO2",
+    "pv_direct_MR",
+    "pv_embodied_CO2",
+    "pv_e_trans",
+)
+
 
 # ---------------------------------------------------------------------------------------
 
@@ -171,6 +193,84 @@ def grid_transition_cost_PV(_pv_factor: YearlyPresentValueFactor, _peak_electric
     return transition_PV_cost
 
 
+def present_value_factors(_analysis_duration_years: int, _discount_rate: float) -> np.ndarray:
+    """Return an array of the present value factors for each year of the analysis duration."""
+    return (1 + _discount_rate) ** np.arange(1, _analysis_duration_years + 1, dtype=float)
+
+
+def sum_yearly_costs_by_year(_yearly_costs: Sequence[YearlyCost], _analysis_duration_years: int) -> np.ndarray:
+    """Return an array with the total of all the YearlyCosts for each year of the analysis duration."""
+    totals_ = np.zeros(_analysis_duration_years)
+    for yearly_cost in _yearly_costs:
+        if 0 <= yearly_cost.year < _analysis_duration_years:
+            totals_[yearly_cost.year] += yearly_cost.cost
+    return totals_
+
+
+def install_ADORB_columns(
+    _analysis_duration_years: int,
+    _yearly_install_costs: np.ndarray,
+    _yearly_embodied_CO2_costs: np.ndarray,
+) -> np.ndarray:
+    """Return an array (years x 2) with the 'pv_direct_MR' and 'pv_embodied_CO2' ADORB columns.
+
+    These two columns are linear in the yearly install and embodied-CO2 costs, so the columns for
+    a whole Variant are the sum of the columns for each of its items.
+    """
+    n = _analysis_duration_years
+    columns_ = np.empty((n, 2))
+    columns_[:, 0] = np.asarray(_yearly_install_costs, dtype=float)[:n] / present_value_factors(n, ENERGY_DISCOUNT_RATE)
+    columns_[:, 1] = (
+        EMBODIED_CO2_FACTOR
+        * np.asarray(_yearly_embodied_CO2_costs, dtype=float)[:n]
+        / present_value_factors(n, EMBODIED_CO2_DISCOUNT_RATE)
+    )
+    return columns_
+
+
+def calculate_annual_ADORB_costs_array(
+    _analysis_duration_years: int,
+    _annual_total_cost_electric: float,
+    _annual_total_cost_gas: float,
+    _annual_hourly_CO2_electric: Sequence[float] | np.ndarray,
+    _annual_total_CO2_gas: float,
+    _yearly_install_costs: np.ndarray,
+    _yearly_embodied_CO2_costs: np.ndarray,
+    _peak_electrical_W: float,
+    _price_of_carbon: float,
+) -> np.ndarray:
+    """Returns an array (years x ADORB_COLUMNS) with the yearly costs from the ADORB analysis.
+
+    This is the NumPy-only core of the ADORB calculation. The yearly install and embodied-CO2
+    costs are passed as arrays of the totals for each year of the analysis duration.
+    """
+    logger.info(f"calculate_annual_ADORB_costs_array({_analysis_duration_years} years)")
+
+    n = _analysis_duration_years
+    years = np.arange(1, n + 1)
+    pv_energy = present_value_factors(n, ENERGY_DISCOUNT_RATE)
+    pv_operational_CO2 = present_value_factors(n, OPERATIONAL_CO2_DISCOUNT_RATE)
+
+    annual_CO2 = np.asarray(_annual_hourly_CO2_electric, dtype=float)[:n] + _annual_total_CO2_gas
+    transition_cost_factors = np.where(
+        years > USA_NUM_YEARS_TO_TRANSITION, 0.0, USA_TRANSITION_COST_FACTOR / USA_NUM_YEARS_TO_TRANSITION
+    )
+
+    yearly_ = np.empty((n, len(ADORB_COLUMNS)))
+    yearly_[:, 0] = (_annual_total_cost_electric + _annual_total_cost_gas) / pv_energy
+    yearly_[:, 1] = annual_CO2 * _price_of_carbon / pv_operational_CO2
+    yearly_[:, 2:4] = install_ADORB_columns(n, _yearly_install_costs, _yearly_embodied_CO2_costs)
+    yearly_[:, 4] = transition_cost_factors * _peak_electrical_W / pv_energy
+    return yearly_
+
+
+def ADORB_costs_array_to_DataFrame(_yearly_costs: np.ndarray) -> pd.DataFrame:
+    """Return the yearly ADORB costs array as a DataFrame. Note: pandas is only imported when called."""
+    import pandas as pd
+
+    return pd.DataFrame(_yearly_costs, columns=list(ADORB_COLUMNS))
+
+
 def calculate_annual_ADORB_costs(
     _analysis_duration_years: int,
     _annual_total_cost_electric: float,
@@ -183,34 +283,15 @@ def calculate_annual_ADORB_costs(
     _price_of_carbon: float,
 ) -> pd.DataFrame:
     """Returns a DataFrame with the yearly costs from the ADORB analysis."""
-
-    # --  Define the column names
-    columns = [
-        "pv_direct_energy",
-        "pv_operational_CO2",
-        "pv_direct_MR",
-        "pv_embodied_CO2",
-        "pv_e_trans",
-    ]
-
-    # -- Create the row data
-    rows: list[pd.Series] = []
-    for n in range(0, _analysis_duration_years):
-        logger.info(f"Calculating year {n} costs:")
-
-        new_row: pd.Series[float] = pd.Series(
-            {
-                columns[0]: energy_purchase_cost_PV(
-                    present_value_factor(n, 0.02), _annual_total_cost_electric, _annual_total_cost_gas
-                ),
-                columns[1]: energy_CO2_cost_PV(
-                    present_value_factor(n, 0.075), _annual_hourly_CO2_electric, _annual_total_CO2_gas, _price_of_carbon
-                ),
-                columns[2]: measure_purchase_cost_PV(present_value_factor(n, 0.02), _all_yearly_install_costs),
-                columns[3]: measure_CO2_cost_PV(present_value_factor(n, 0.0), _all_yearly_embodied_kgCO2),
-                columns[4]: grid_transition_cost_PV(present_value_factor(n, 0.02), _peak_electrical_W),
-            }
-        )
-        rows.append(new_row)
-
-    return pd.DataFrame(rows, columns=columns)
+    yearly_costs = calculate_annual_ADORB_costs_array(
+        _analysis_duration_years,
+        _annual_total_cost_electric,
+        _annual_total_cost_gas,
+        _annual_hourly_CO2_electric,
+        _annual_total_CO2_gas,
+        sum_yearly_costs_by_year(_all_yearly_install_costs, _analysis_duration_years),
+        sum_yearly_costs_by_year(_all_yearly_embodied_kgCO2, _analysis_duration_years),
+        _peak_electrical_W,
+        _price_of_carbon,
+    )
+    return ADORB_costs_array_to_DataFrame(yearly_costs)
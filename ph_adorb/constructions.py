@@ -4,12 +4,27 @@
 """Assembly (wall, floor, etc..) Constructions, and Collection classes."""
 
 import json
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
+from typing import Sequence
 
+import numpy as np
 from pydantic import BaseModel, PrivateAttr
 
+from ph_adorb.library import DEFAULT_LIBRARY_CACHE_DIR, load_json_library
+from ph_adorb.versioned_model import VersionedModel
 
-class PhAdorbConstruction(BaseModel):
+FT2_PER_M2 = 10.7639
+
+
+@lru_cache(maxsize=4096)
+def _clean_name(_name: str) -> str:
+    """Return the normalized name used to match Construction names (upper-case, no spaces)."""
+    return _name.upper().replace(" ", "_")
+
+
+class PhAdorbConstruction(VersionedModel):
     """A single Construction."""
 
     display_name: str
@@ -23,10 +38,10 @@ class PhAdorbConstruction(BaseModel):
 
     @property
     def quantity_ft2(self) -> float:
-        return self.area_m2 * 10.7639
+        return self.area_m2 * FT2_PER_M2
 
     def set_quantity_ft2(self, _value: float) -> None:
-        self.area_m2 = _value / 10.7639
+        self.area_m2 = _value / FT2_PER_M2
 
     @property
     def cost(self) -> float:
@@ -56,53 +71,194 @@ class PhAdorbConstruction(BaseModel):
         return self.duplicate()
 
 
+@dataclass(frozen=True)
+class PhAdorbConstructionArrays:
+    """Columnar (one NumPy array per attribute) view of a Construction Collection, in the collection's order."""
+
+    names: tuple[str, ...]
+    area_m2: np.ndarray
+    cost_per_m2: np.ndarray
+    CO2_kg_per_m2: np.ndarray
+    lifetime_years: np.ndarray
+    labor_fraction: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def cost(self) -> np.ndarray:
+        """Total Cost of each Construction (quantity * cost_per_m2)."""
+        return self.area_m2 * self.cost_per_m2
+
+    @property
+    def CO2_kg(self) -> np.ndarray:
+        """Total CO2 of each Construction (quantity * CO2_kg_per_m2)."""
+        return self.area_m2 * self.CO2_kg_per_m2
+
+    @property
+    def material_fraction(self) -> np.ndarray:
+        return 1.0 - self.labor_fraction
+
+
 class PhAdorbConstructionCollection(BaseModel):
     """A collection of Constructions."""
 
     _constructions: dict[str, PhAdorbConstruction] = PrivateAttr(default_factory=dict)
+    _sorted_items: list[tuple[str, PhAdorbConstruction]] | None = PrivateAttr(default=None)
+    _arrays: PhAdorbConstructionArrays | None = PrivateAttr(default=None)
+    _arrays_versions: tuple[int, ...] = PrivateAttr(default=())
+    _name_index: dict[str, list[PhAdorbConstruction]] | None = PrivateAttr(default=None)
+    _shared: bool = PrivateAttr(default=False)
 
     def add_construction(self, _construction: PhAdorbConstruction) -> None:
+        self._own_items()
         self._constructions[_construction.display_name] = _construction
+        self._sorted_items = None
+        self._arrays = None
+        self._name_index = None
+
+    def duplicate(self) -> "PhAdorbConstructionCollection":
+        """Return a new collection with copies of all the Constructions. The (immutable) cached arrays are shared."""
+        collection_ = PhAdorbConstructionCollection()
+        collection_._constructions = {k: v.copy() for k, v in self._constructions.items()}
+        collection_._arrays = self._arrays
+        collection_._arrays_versions = self._arrays_versions
+        return collection_
+
+    def share(self) -> "PhAdorbConstructionCollection":
+        """Return a new (copy-on-write) collection which shares this collection's Constructions.
+
+        While shared, the Constructions are read-only. Either collection copies them (once) before it is
+        first changed, or before one of its Constructions is returned by .get_construction() to be edited.
+        """
+        if not self._shared:
+            for construction in self._constructions.values():
+                construction.set_shared()
+            self._shared = True
+        collection_ = PhAdorbConstructionCollection()
+        collection_._constructions = self._constructions
+        collection_._sorted_items = self._sorted_items
+        collection_._arrays = self._arrays
+        collection_._arrays_versions = self._arrays_versions
+        collection_._name_index = self._name_index
+        collection_._shared = True
+        return collection_
+
+    def _own_items(self) -> None:
+        """Copy the (read-only) shared Constructions, before this collection is changed. See: .share()"""
+        if self._shared:
+            self._constructions = {k: v.copy() for k, v in self._constructions.items()}
+            self._sorted_items = None
+            self._name_index = None
+            self._shared = False
 
     def get_construction(self, key: str) -> PhAdorbConstruction:
+        self._own_items()
         return self._constructions[key]
 
+    def _get_sorted_items(self) -> list[tuple[str, PhAdorbConstruction]]:
+        """Return the (key, item) pairs sorted by display_name. Cached until the collection is changed."""
+        if self._sorted_items is None:
+            self._sorted_items = sorted(self._constructions.items(), key=lambda x: x[1].display_name)
+        return self._sorted_items
+
+    def fingerprint(self) -> tuple:
+        """Return a hashable fingerprint of every Construction's field values, which changes if any of them change."""
+        return tuple((k, tuple(v.__dict__.values())) for k, v in self._get_sorted_items())
+
     def keys(self) -> list[str]:
-        return [k for k, v in sorted(self._constructions.items(), key=lambda x: x[1].display_name)]
+        return [k for k, _ in self._get_sorted_items()]
 
     def values(self) -> list[PhAdorbConstruction]:
-        return list(sorted(self._constructions.values(), key=lambda x: x.display_name))
+        return [v for _, v in self._get_sorted_items()]
 
     def __iter__(self):
-        return iter(sorted(self._constructions.values(), key=lambda x: x.display_name))
+        return (v for _, v in self._get_sorted_items())
 
     def __len__(self) -> int:
         return len(self._constructions)
 
+    def to_arrays(self) -> PhAdorbConstructionArrays:
+        """Return the columnar NumPy view of the Constructions.
+
+        Cached until the collection is changed, or any of its Constructions is edited in place (ie: a new .area_m2).
+        """
+        items = self.values()
+        versions = tuple(c.version for c in items)
+        if self._arrays is None or versions != self._arrays_versions:
+            self._arrays_versions = versions
+            self._arrays = PhAdorbConstructionArrays(
+                names=tuple(c.display_name for c in items),
+                area_m2=np.fromiter((c.area_m2 for c in items), dtype=float, count=len(items)),
+                cost_per_m2=np.fromiter((c.cost_per_m2 for c in items), dtype=float, count=len(items)),
+                CO2_kg_per_m2=np.fromiter((c.CO2_kg_per_m2 for c in items), dtype=float, count=len(items)),
+                lifetime_years=np.fromiter((c.lifetime_years for c in items), dtype=int, count=len(items)),
+                labor_fraction=np.fromiter((c.labor_fraction for c in items), dtype=float, count=len(items)),
+            )
+        return self._arrays
+
+    @property
+    def total_cost(self) -> float:
+        """Total Cost of all the Constructions."""
+        return float(self.to_arrays().cost.sum())
+
+    @property
+    def total_CO2_kg(self) -> float:
+        """Total CO2 of all the Constructions."""
+        return float(self.to_arrays().CO2_kg.sum())
+
     def __contains__(self, key: str | PhAdorbConstruction) -> bool:
         if isinstance(key, PhAdorbConstruction):
             return key in self._constructions.values()
         return key in self._constructions
 
+    def _get_name_index(self) -> dict[str, list[PhAdorbConstruction]]:
+        """Return the {normalized-name: [Constructions]} index. Cached until the collection is changed.
+
+        Several Constructions may share the same normalized name (ie: 'Wall A' and 'WALL_A').
+        """
+        if self._name_index is None:
+            self._name_index = {}
+            for c in self._constructions.values():
+                self._name_index.setdefault(_clean_name(c.display_name), []).append(c)
+        return self._name_index
+
+    def _set_areas_m2_in_place(self, _constructions: list[PhAdorbConstruction], _areas_m2: list[float]) -> None:
+        """Set the area (m2) of each Construction in place, and update the cached arrays to match."""
+        up_to_date = self._arrays is not None and self._arrays_versions == tuple(c.version for c in self.values())
+        for construction, area_m2 in zip(_constructions, _areas_m2):
+            construction.area_m2 = area_m2
+        if up_to_date:
+            items = self.values()
+            self._arrays_versions = tuple(c.version for c in items)
+            self._arrays = replace(
+                self._arrays, area_m2=np.fromiter((c.area_m2 for c in items), dtype=float, count=len(items))
+            )
+
     def set_constructions_ft2_quantities(self, _construction_quantities_ft2: dict[str, float]) -> None:
-        """Set the quantity (ft2) of each Construction.
+        """Set the quantity (ft2) of each Construction, in place.
 
         Args:
             * _construction_quantities (dict[str, float]): A dictionary of Construction
-                names, with their quantities (ft2).
+                names, with their quantities (ft2). Names are matched ignoring case and
+                spaces / underscores.
         """
-
-        def _clean_name(n: str) -> str:
-            return n.upper().replace(" ", "_")
-
-        _construction_quantities_ft2 = {_clean_name(k): v for k, v in _construction_quantities_ft2.items()}
-
-        old_constructions = list(self._constructions.values())
-        self._constructions = {}
-        for construction in old_constructions:
-            new_construction = construction.duplicate()
-            new_construction.set_quantity_ft2(_construction_quantities_ft2[_clean_name(construction.display_name)])
-            self.add_construction(new_construction)
+        self._own_items()
+        quantities_ft2 = {_clean_name(k): v for k, v in _construction_quantities_ft2.items()}
+        constructions, areas_m2 = [], []
+        for name, named_constructions in self._get_name_index().items():
+            area_m2 = quantities_ft2[name] / FT2_PER_M2
+            constructions.extend(named_constructions)
+            areas_m2.extend(area_m2 for _ in named_constructions)
+        self._set_areas_m2_in_place(constructions, areas_m2)
+
+    def set_areas_m2(self, _areas_m2: Sequence[float] | np.ndarray) -> None:
+        """Set the area (m2) of each Construction, in place, from an array in the collection's (sorted) order."""
+        areas_m2 = np.asarray(_areas_m2, dtype=float)
+        if areas_m2.shape != (len(self),):
+            raise ValueError(f"Expected an array of {len(self)} areas, got one with shape: {areas_m2.shape}")
+        self._own_items()
+        self._set_areas_m2_in_place(self.values(), areas_m2.tolist())
 
 
 def write_constructions_to_json_file(_file_path: Path, _constructions: dict[str, PhAdorbConstruction]) -> None:
@@ -111,8 +267,11 @@ def write_constructions_to_json_file(_file_path: Path, _constructions: dict[str,
         json.dump([_.dict() for _ in _constructions.values()], json_file, indent=4)
 
 
-def load_constructions_from_json_file(_file_path: Path) -> dict[str, PhAdorbConstruction]:
-    """Load all of the Construction-Types from a JSON file."""
-    with open(_file_path, "r") as json_file:
-        all_constructions = (PhAdorbConstruction(**item) for item in json.load(json_file))
-        return {_.display_name: _ for _ in all_constructions}
+def load_constructions_from_json_file(
+    _file_path: Path, _trusted: bool = False, _cache_dir: Path | None = DEFAULT_LIBRARY_CACHE_DIR
+) -> dict[str, PhAdorbConstruction]:
+    """Load all of the Construction-Types from a JSON file.
+
+    Set '_trusted=True' to skip the validation of a published library and use its binary cache.
+    """
+    return load_json_library(_file_path, PhAdorbConstruction, "display_name", _trusted, _cache_dir)
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""A columnar ledger of every install (CO2-Measures, Constructions, Equipment) over the analysis duration.
+
+The ledger holds one row per install, stored as parallel NumPy arrays (category, item, year,
+install-cost, embodied kgCO2, embodied CO2-cost), and supports fast group-by-year, group-by-item
+and group-by-category totals. Both the ADORB cost calculation and the preview tables read from it.
+"""
+
+from dataclasses import dataclass
+from typing import Mapping
+
+import numpy as np
+
+from ph_adorb.replacement_schedule import ReplacementSchedule, sum_by_year
+
+LEDGER_COLUMNS = ("install_cost", "embodied_kgCO2", "embodied_CO2_cost")
+
+
+@dataclass(frozen=True)
+class CostLedger:
+    """Columnar ledger with one row for each install of each item."""
+
+    categories: tuple[str, ...]
+    items: tuple[str, ...]
+    analysis_duration: int
+    category_index: np.ndarray
+    item_index: np.ndarray
+    year: np.ndarray
+    install_cost: np.ndarray
+    embodied_kgCO2: np.ndarray
+    embodied_CO2_cost: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.year)
+
+    def column(self, _name: str) -> np.ndarray:
+        """Return one of the value columns (install_cost, embodied_kgCO2, embodied_CO2_cost) by name."""
+        if _name not in LEDGER_COLUMNS:
+            raise ValueError(f"Unknown ledger column: '{_name}'. Expected one of: {LEDGER_COLUMNS}")
+        return getattr(self, _name)
+
+    def by_year(self, _name: str) -> np.ndarray:
+        """Return the total of the column for each year of the analysis duration."""
+        return sum_by_year(self.year, self.column(_name), self.analysis_duration)
+
+    def by_item(self, _name: str) -> dict[str, float]:
+        """Return the total of the column (all years) for each item, in ledger order."""
+        totals = np.bincount(self.item_index, weights=self.column(_name), minlength=len(self.items))
+        return dict(zip(self.items, totals.tolist()))
+
+    def by_category(self, _name: str) -> dict[str, float]:
+        """Return the total of the column (all years) for each category."""
+        totals = np.bincount(self.category_index, weights=self.column(_name), minlength=len(self.categories))
+        return dict(zip(self.categories, totals.tolist()))
+
+    def by_item_and_year(self, _name: str) -> tuple[np.ndarray, np.ndarray]:
+        """Return the years with any installs, and the (items x years) array with the column totals.
+
+        Returns:
+        --------
+            * tuple[np.ndarray, np.ndarray]: The sorted unique years, and the items x years totals.
+        """
+        unique_years, year_column = np.unique(self.year, return_inverse=True)
+        totals_ = np.zeros((len(self.items), len(unique_years)))
+        np.add.at(totals_, (self.item_index, year_column), self.column(_name))
+        return unique_years, totals_
+
+    @classmethod
+    def from_schedules(cls, _schedules: Mapping[str, ReplacementSchedule]) -> "CostLedger":
+        """Create a new CostLedger from a {category-name: ReplacementSchedule} mapping.
+
+        Items with the same name (in any category) are combined into a single ledger item.
+        """
+        schedules = list(_schedules.values())
+        durations = {s.analysis_duration for s in schedules}
+        if len(durations) > 1:
+            raise ValueError(f"All the schedules must have the same analysis duration. Got: {sorted(durations)}")
+
+        item_ids: dict[str, int] = {}
+        item_indexes: list[np.ndarray] = []
+        for schedule in schedules:
+            schedule_item_ids = np.array([item_ids.setdefault(n, len(item_ids)) for n in schedule.names], dtype=int)
+            item_indexes.append(schedule_item_ids[schedule.item_index])
+
+        def _concat(_arrays: list[np.ndarray], _dtype: type) -> np.ndarray:
+            return np.concatenate(_arrays).astype(_dtype) if _arrays else np.zeros(0, dtype=_dtype)
+
+        return cls(
+            categories=tuple(_schedules.keys()),
+            items=tuple(item_ids.keys()),
+            analysis_duration=durations.pop() if durations else 0,
+            category_index=_concat([np.full(len(s), i, dtype=int) for i, s in enumerate(schedules)], int),
+            item_index=_concat(item_indexes, int),
+            year=_concat([s.year for s in schedules], int),
+            install_cost=_concat([s.install_cost for s in schedules], float),
+            embodied_kgCO2=_concat([s.embodied_kgCO2 for s in schedules], float),
+            embodied_CO2_cost=_concat([s.embodied_CO2_cost for s in schedules], float),
+        )
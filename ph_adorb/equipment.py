@@ -4,11 +4,16 @@
 """Equipment (mechanical, lighting, etc..), and Collection classes."""
 
 import json
+from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 
+import numpy as np
 from pydantic import BaseModel, PrivateAttr
 
+from ph_adorb.library import DEFAULT_LIBRARY_CACHE_DIR, load_json_library
+from ph_adorb.versioned_model import VersionedModel
+
 
 class PhAdorbEquipmentType(str, Enum):
     MECHANICAL = "Mechanical"
@@ -19,7 +24,7 @@ class PhAdorbEquipmentType(str, Enum):
     BATTERY = "Battery"
 
 
-class PhAdorbEquipment(BaseModel):
+class PhAdorbEquipment(VersionedModel):
     """A single piece of Equipment."""
 
     name: str
@@ -27,11 +32,21 @@ class PhAdorbEquipment(BaseModel):
     cost: float
     lifetime_years: int
     labor_fraction: float
+    quantity: int = 1
 
     @property
     def material_fraction(self) -> float:
         return 1.0 - self.labor_fraction
 
+    @property
+    def total_cost(self) -> float:
+        """Total Cost (quantity * cost)."""
+        return self.quantity * self.cost
+
+    def is_same_definition(self, _other: "PhAdorbEquipment") -> bool:
+        """Return True if the other Equipment has the same definition (ignoring the quantity)."""
+        return self.dict(exclude={"quantity"}) == _other.dict(exclude={"quantity"})
+
     def duplicate(self) -> "PhAdorbEquipment":
         return PhAdorbEquipment(
             name=self.name,
@@ -39,31 +54,118 @@ class PhAdorbEquipment(BaseModel):
             cost=self.cost,
             lifetime_years=self.lifetime_years,
             labor_fraction=self.labor_fraction,
+            quantity=self.quantity,
         )
 
     def __copy__(self) -> "PhAdorbEquipment":
         return self.duplicate()
 
 
+@dataclass(frozen=True)
+class PhAdorbEquipmentArrays:
+    """Columnar (one NumPy array per attribute) view of an Equipment Collection, in the collection's order."""
+
+    names: tuple[str, ...]
+    cost: np.ndarray
+    quantity: np.ndarray
+    lifetime_years: np.ndarray
+    labor_fraction: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def total_cost(self) -> np.ndarray:
+        """Total Cost of each Equipment (quantity * cost)."""
+        return self.quantity * self.cost
+
+    @property
+    def material_fraction(self) -> np.ndarray:
+        return 1.0 - self.labor_fraction
+
+
 class PhAdorbEquipmentCollection(BaseModel):
     """A collection of Equipment."""
 
     _equipment: dict[str, PhAdorbEquipment] = PrivateAttr(default_factory=dict)
+    _sorted_items: list[tuple[str, PhAdorbEquipment]] | None = PrivateAttr(default=None)
+    _arrays: PhAdorbEquipmentArrays | None = PrivateAttr(default=None)
+    _arrays_versions: tuple[int, ...] = PrivateAttr(default=())
+    _shared: bool = PrivateAttr(default=False)
 
     def add_equipment(self, _ph_adorb_equipment: PhAdorbEquipment) -> None:
+        """Add the Equipment to the collection.
+
+        If an Equipment with the same name and the same definition is already in the
+        collection, the quantities are combined rather than one replacing the other.
+        """
+        self._own_items()
+        existing = self._equipment.get(_ph_adorb_equipment.name, None)
+        if (
+            existing is not None
+            and existing is not _ph_adorb_equipment
+            and existing.is_same_definition(_ph_adorb_equipment)
+        ):
+            _ph_adorb_equipment = existing.copy(update={"quantity": existing.quantity + _ph_adorb_equipment.quantity})
         self._equipment[_ph_adorb_equipment.name] = _ph_adorb_equipment
+        self._sorted_items = None
+        self._arrays = None
+
+    def duplicate(self) -> "PhAdorbEquipmentCollection":
+        """Return a new collection with copies of all the Equipment. The (immutable) cached arrays are shared."""
+        collection_ = PhAdorbEquipmentCollection()
+        collection_._equipment = {k: v.copy() for k, v in self._equipment.items()}
+        collection_._arrays = self._arrays
+        collection_._arrays_versions = self._arrays_versions
+        return collection_
+
+    def share(self) -> "PhAdorbEquipmentCollection":
+        """Return a new (copy-on-write) collection which shares this collection's Equipment.
+
+        While shared, the Equipment is read-only. Either collection copies it (once) before it is
+        first changed, or before one of its Equipment is returned by .get_equipment() to be edited.
+        """
+        if not self._shared:
+            for equipment in self._equipment.values():
+                equipment.set_shared()
+            self._shared = True
+        collection_ = PhAdorbEquipmentCollection()
+        collection_._equipment = self._equipment
+        collection_._sorted_items = self._sorted_items
+        collection_._arrays = self._arrays
+        collection_._arrays_versions = self._arrays_versions
+        collection_._shared = True
+        return collection_
+
+    def _own_items(self) -> None:
+        """Copy the (read-only) shared Equipment, before this collection is changed. See: .share()"""
+        if self._shared:
+            self._equipment = {k: v.copy() for k, v in self._equipment.items()}
+            self._sorted_items = None
+            self._shared = False
 
     def get_equipment(self, key: str) -> PhAdorbEquipment:
+        self._own_items()
         return self._equipment[key]
 
+    def _get_sorted_items(self) -> list[tuple[str, PhAdorbEquipment]]:
+        """Return the (key, item) pairs sorted by name. Cached until the collection is changed."""
+        if self._sorted_items is None:
+            self._sorted_items = sorted(self._equipment.items(), key=lambda x: x[1].name)
+        return self._sorted_items
+
+    def fingerprint(self) -> tuple:
+        """Return a hashable fingerprint of every Equipment's field values, which changes if any of them change."""
+        return tuple((k, tuple(v.__dict__.values())) for k, v in self._get_sorted_items())
+
     def keys(self) -> list[str]:
-        return [k for k, v in sorted(self._equipment.items(), key=lambda x: x[1].name)]
+        return [k for k, _ in self._get_sorted_items()]
 
     def values(self) -> list[PhAdorbEquipment]:
-        return list(sorted(self._equipment.values(), key=lambda x: x.name))
+        return [v for _, v in self._get_sorted_items()]
 
     def __iter__(self):
-        return iter(sorted(self._equipment.values(), key=lambda x: x.name))
+        return (v for _, v in self._get_sorted_items())
 
     def __contains__(self, key: str | PhAdorbEquipment) -> bool:
         if isinstance(key, PhAdorbEquipment):
@@ -73,6 +175,29 @@ class PhAdorbEquipmentCollection(BaseModel):
     def __len__(self) -> int:
         return len(self._equipment)
 
+    def to_arrays(self) -> PhAdorbEquipmentArrays:
+        """Return the columnar NumPy view of the Equipment.
+
+        Cached until the collection is changed, or any of its Equipment is edited in place (ie: a new .cost).
+        """
+        items = self.values()
+        versions = tuple(e.version for e in items)
+        if self._arrays is None or versions != self._arrays_versions:
+            self._arrays_versions = versions
+            self._arrays = PhAdorbEquipmentArrays(
+                names=tuple(e.name for e in items),
+                cost=np.fromiter((e.cost for e in items), dtype=float, count=len(items)),
+                quantity=np.fromiter((e.quantity for e in items), dtype=int, count=len(items)),
+                lifetime_years=np.fromiter((e.lifetime_years for e in items), dtype=int, count=len(items)),
+                labor_fraction=np.fromiter((e.labor_fraction for e in items), dtype=float, count=len(items)),
+            )
+        return self._arrays
+
+    @property
+    def total_cost(self) -> float:
+        """Total Cost of all the Equipment."""
+        return float(self.to_arrays().total_cost.sum())
+
 
 def write_equipment_to_json_file(_file_path: Path, equipment: dict[str, PhAdorbEquipment]) -> None:
     """Write all of the Equipment-Types to a JSON file."""
@@ -80,8 +205,11 @@ def write_equipment_to_json_file(_file_path: Path, equipment: dict[str, PhAdorbE
         json.dump([_.dict() for _ in equipment.values()], json_file, indent=4)
 
 
-def load_equipment_from_json_file(_file_path: Path) -> dict[str, PhAdorbEquipment]:
-    """Load all of the Equipment-Types from a JSON file."""
-    with open(_file_path, "r") as json_file:
-        all_equipment = (PhAdorbEquipment(**item) for item in json.load(json_file))
-        return {_.name: _ for _ in all_equipment}
+def load_equipment_from_json_file(
+    _file_path: Path, _trusted: bool = False, _cache_dir: Path | None = DEFAULT_LIBRARY_CACHE_DIR
+) -> dict[str, PhAdorbEquipment]:
+    """Load all of the Equipment-Types from a JSON file.
+
+    Set '_trusted=True' to skip the validation of a published library and use its binary cache.
+    """
+    return load_json_library(_file_path, PhAdorbEquipment, "name", _trusted, _cache_dir)
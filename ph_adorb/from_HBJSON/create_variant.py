@@ -3,46 +3,54 @@
 
 """Create a new Phius ADORB Variant from a Honeybee-Model."""
 
+from __future__ import annotations
+
 from collections import defaultdict
 from pathlib import Path
-from typing import Union
-
-from honeybee.model import Model
-from honeybee_energy.construction.opaque import OpaqueConstruction
-from honeybee_energy.construction.window import WindowConstruction
-from honeybee_energy.generator.pv import PVProperties
-from honeybee_energy.load.lighting import Lighting
-from honeybee_energy.load.process import Process
-from honeybee_energy.properties.extension import (
-    AllAirSystemProperties,
-    DOASSystemProperties,
-    HeatCoolSystemProperties,
-    IdealAirSystemProperties,
-)
-from honeybee_energy.properties.model import ModelEnergyProperties
-from honeybee_energy.properties.room import RoomEnergyProperties
-from honeybee_energy.properties.shade import ShadeEnergyProperties
-
-AnyHvacSystemProperties = Union[
-    AllAirSystemProperties, DOASSystemProperties, HeatCoolSystemProperties, IdealAirSystemProperties
-]
-from honeybee_energy_revive.hvac.equipment import PhiusReviveHVACEquipment
-from honeybee_energy_revive.properties.construction.opaque import OpaqueConstructionReviveProperties
-from honeybee_energy_revive.properties.generator.pv import PVPropertiesReviveProperties
-from honeybee_energy_revive.properties.hvac.allair import AllAirSystemReviveProperties
-from honeybee_energy_revive.properties.hvac.doas import DOASSystemReviveProperties
-from honeybee_energy_revive.properties.hvac.heatcool import HeatCoolSystemReviveProperties
-from honeybee_energy_revive.properties.hvac.idealair import IdealAirSystemReviveProperties
-from honeybee_energy_revive.properties.load.lighting import LightingReviveProperties
-from honeybee_energy_revive.properties.load.process import ProcessReviveProperties
-from honeybee_revive.properties.model import ModelReviveProperties
-
-AnyHvacSystemReviveProperties = Union[
-    AllAirSystemReviveProperties,
-    DOASSystemReviveProperties,
-    HeatCoolSystemReviveProperties,
-    IdealAirSystemReviveProperties,
-]
+from typing import TYPE_CHECKING, Any, Callable, Union
+
+# -- Dev Note: The Honeybee packages are only used for type-hints here. They are imported lazily
+# -- (see: read_HBJSON_file.convert_hbjson_dict_to_hb_model) so that users who never convert an
+# -- HBJSON file do not pay the (considerable) Honeybee startup cost.
+if TYPE_CHECKING:
+    from honeybee.model import Model
+    from honeybee_energy.construction.opaque import OpaqueConstruction
+    from honeybee_energy.construction.window import WindowConstruction
+    from honeybee_energy.generator.pv import PVProperties
+    from honeybee_energy.load.lighting import Lighting
+    from honeybee_energy.load.process import Process
+    from honeybee_energy.properties.extension import (
+        AllAirSystemProperties,
+        DOASSystemProperties,
+        HeatCoolSystemProperties,
+        IdealAirSystemProperties,
+    )
+    from honeybee_energy.properties.model import ModelEnergyProperties
+    from honeybee_energy.properties.room import RoomEnergyProperties
+    from honeybee_energy.properties.shade import ShadeEnergyProperties
+
+    AnyHvacSystemProperties = Union[
+        AllAirSystemProperties, DOASSystemProperties, HeatCoolSystemProperties, IdealAirSystemProperties
+    ]
+    from honeybee_energy_revive.hvac.equipment import PhiusReviveHVACEquipment
+    from honeybee_energy_revive.properties.construction.opaque import OpaqueConstructionReviveProperties
+    from honeybee_energy_revive.properties.generator.pv import PVPropertiesReviveProperties
+    from honeybee_energy_revive.properties.hvac.allair import AllAirSystemReviveProperties
+    from honeybee_energy_revive.properties.hvac.doas import DOASSystemReviveProperties
+    from honeybee_energy_revive.properties.hvac.heatcool import HeatCoolSystemReviveProperties
+    from honeybee_energy_revive.properties.hvac.idealair import IdealAirSystemReviveProperties
+    from honeybee_energy_revive.properties.load.lighting import LightingReviveProperties
+    from honeybee_energy_revive.properties.load.process import ProcessReviveProperties
+    from honeybee_revive.CO2_measures import CO2ReductionMeasureCollection
+    from honeybee_revive.fuels import FuelCollection
+    from honeybee_revive.properties.model import ModelReviveProperties
+
+    AnyHvacSystemReviveProperties = Union[
+        AllAirSystemReviveProperties,
+        DOASSystemReviveProperties,
+        HeatCoolSystemReviveProperties,
+        IdealAirSystemReviveProperties,
+    ]
 
 from ph_adorb.constructions import PhAdorbConstruction, PhAdorbConstructionCollection
 from ph_adorb.ep_sql_file import DataFileSQL
@@ -79,8 +87,13 @@ def get_PhAdorbNationalEmissions_from_hb_mode(_hb_model_prop: ModelRevivePropert
 
 def get_PhAdorbCO2Measures_from_hb_model(_hb_model_prop: ModelReviveProperties) -> PhAdorbCO2MeasureCollection:
     """Get all of the CO2 Reduction Measures from the HB-Model."""
+    return convert_hb_CO2_measures(_hb_model_prop.co2_measures)
+
+
+def convert_hb_CO2_measures(_hb_co2_measures: CO2ReductionMeasureCollection) -> PhAdorbCO2MeasureCollection:
+    """Convert a Honeybee-REVIVE CO2-Measure Collection to a Phius ADORB CO2-Measure Collection."""
     measure_collection_ = PhAdorbCO2MeasureCollection()
-    for co2_measure in _hb_model_prop.co2_measures:
+    for co2_measure in _hb_co2_measures:
         measure_collection_.add_measure(
             PhAdorbCO2ReductionMeasure(
                 measure_type=CO2MeasureType(co2_measure.measure_type),
@@ -169,45 +182,85 @@ def convert_hb_hvac_equipment(_hb_hvac_equip: PhiusReviveHVACEquipment) -> PhAdo
     )
 
 
+class HBEquipmentCounter:
+    """Count the Honeybee equipment objects (loads, HVAC, PV) by identity, so each unique one is only converted once.
+
+    Many HB-Rooms share the very same load objects (ie: from a shared Program-Type). Rather than
+    converting the same object once for every room, each unique object is converted only once and
+    the number of times it was found is carried through as the PhAdorbEquipment 'quantity'.
+    """
+
+    def __init__(self) -> None:
+        self._items: dict[int, tuple[Any, Callable[[Any], PhAdorbEquipment]]] = {}
+        self._counts: dict[int, int] = defaultdict(int)
+
+    def add(self, _hb_obj: Any, _converter: Callable[[Any], PhAdorbEquipment]) -> None:
+        """Add a Honeybee object, along with the function used to convert it to a PhAdorbEquipment."""
+        key = id(_hb_obj)
+        self._items.setdefault(key, (_hb_obj, _converter))
+        self._counts[key] += 1
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def to_PhAdorbEquipmentCollection(self) -> PhAdorbEquipmentCollection:
+        """Return a new EquipmentCollection with one PhAdorbEquipment (with quantity) for each unique object."""
+        equipment_collection_ = PhAdorbEquipmentCollection()
+        for key, (hb_obj, converter) in self._items.items():
+            new_equipment = converter(hb_obj)
+            new_equipment.quantity = self._counts[key]
+            equipment_collection_.add_equipment(new_equipment)
+        return equipment_collection_
+
+
 def get_PhAdorbEquipment_from_hb_model(_hb_model: Model) -> PhAdorbEquipmentCollection:
     """Return a EquipmentCollection with all of the Equipment (Appliances, HVAC, etc...) from the HB-Model."""
 
-    equipment_collection_ = PhAdorbEquipmentCollection()
+    equipment_counter = HBEquipmentCounter()
+    hvac_systems: dict[str, Any] = {}
 
     for room in _hb_model.rooms:
         room_prop: RoomEnergyProperties = getattr(room.properties, "energy")
 
         # -- Add all of the Appliances from all of the HB-Rooms
         for process_load in room_prop.process_loads:
-            equipment_collection_.add_equipment(convert_hb_process_load(process_load))
+            equipment_counter.add(process_load, convert_hb_process_load)
 
         # -- Add the room's lighting
-        equipment_collection_.add_equipment(convert_hbe_lighting(room_prop.lighting))
+        equipment_counter.add(room_prop.lighting, convert_hbe_lighting)
 
-        # -- Add the room's HVAC Equipment
-        if not room_prop.hvac:
-            continue
-        hvac_props: AnyHvacSystemProperties = getattr(room_prop.hvac, "properties")
+        # -- Collect the room's HVAC system. Many rooms may be served by the same one.
+        if room_prop.hvac:
+            hvac_systems.setdefault(room_prop.hvac.identifier, room_prop.hvac)
+
+    # -- Add the HVAC Equipment, only once for each unique HVAC system
+    for hvac in hvac_systems.values():
+        hvac_props: AnyHvacSystemProperties = getattr(hvac, "properties")
         hvac_prop_revive: AnyHvacSystemReviveProperties = getattr(hvac_props, "revive")
         for hb_hvac_equip in hvac_prop_revive.equipment_collection:
-            equipment_collection_.add_equipment(convert_hb_hvac_equipment(hb_hvac_equip))
+            equipment_counter.add(hb_hvac_equip, convert_hb_hvac_equipment)
 
     # -- Add all the Model's Shades which have PV on them
     for shade in _hb_model.shades:
         shade_prop_e: ShadeEnergyProperties = getattr(shade.properties, "energy")
         if not shade_prop_e.pv_properties:
             continue
-        equipment_collection_.add_equipment(convert_hb_shade_pv(shade_prop_e.pv_properties))
+        equipment_counter.add(shade_prop_e.pv_properties, convert_hb_shade_pv)
 
-    return equipment_collection_
+    return equipment_counter.to_PhAdorbEquipmentCollection()
 
 
 def get_PhAdorbFuels_from_hb_model(_hb_model: Model) -> tuple[PhAdorbFuel, PhAdorbFuel]:
     """Get the Electric and Natural-Gas Fuels from the HB-Model."""
 
     model_props: ModelReviveProperties = getattr(_hb_model.properties, "revive")
-    hbrv_elec = model_props.fuels.get_fuel("ELECTRICITY")
-    hb_nat_gas = model_props.fuels.get_fuel("NATURAL_GAS")
+    return convert_hb_fuels(model_props.fuels)
+
+
+def convert_hb_fuels(_hb_fuels: FuelCollection) -> tuple[PhAdorbFuel, PhAdorbFuel]:
+    """Convert a Honeybee-REVIVE Fuel Collection to the Phius ADORB Electric and Natural-Gas Fuels."""
+    hbrv_elec = _hb_fuels.get_fuel("ELECTRICITY")
+    hb_nat_gas = _hb_fuels.get_fuel("NATURAL_GAS")
 
     electricity = PhAdorbFuel(
         fuel_type=PhAdorbFuelType.ELECTRICITY,
@@ -249,18 +302,18 @@ def get_PhAdorbVariant_from_hb_model(_hb_model: Model, _results_sql_file_path: P
     electricity, gas = get_PhAdorbFuels_from_hb_model(_hb_model)
 
     try:
-        revive_variant = PhAdorbVariant(
-            name=_hb_model.display_name or "unnamed",
-            total_purchased_gas_kwh=ep_results_sql.get_total_purchased_gas_kwh(),
+        revive_variant = PhAdorbVariant.from_trusted(
+            name=str(_hb_model.display_name or "unnamed"),
+            total_purchased_gas_kwh=float(ep_results_sql.get_total_purchased_gas_kwh()),
             hourly_purchased_electricity_kwh=ep_results_sql.get_hourly_purchased_electricity_kwh(),
-            total_sold_electricity_kwh=ep_results_sql.get_total_sold_electricity_kwh(),
-            peak_electric_usage_W=ep_results_sql.get_peak_electric_watts(),
+            total_sold_electricity_kwh=float(ep_results_sql.get_total_sold_electricity_kwh()),
+            peak_electric_usage_W=float(ep_results_sql.get_peak_electric_watts()),
             electricity=electricity,
             gas=gas,
             grid_region=get_PhAdorbGridRegion_from_hb_model(hb_model_properties),
             national_emissions=get_PhAdorbNationalEmissions_from_hb_mode(hb_model_properties),
-            analysis_duration=hb_model_properties.analysis_duration,
-            envelope_labor_cost_fraction=hb_model_properties.envelope_labor_cost_fraction,
+            analysis_duration=int(hb_model_properties.analysis_duration),
+            envelope_labor_cost_fraction=float(hb_model_properties.envelope_labor_cost_fraction),
             measure_collection=get_PhAdorbCO2Measures_from_hb_model(hb_model_properties),
             construction_collection=get_PhAdorbConstructions_from_hb_model(_hb_model),
             equipment_collection=get_PhAdorbEquipment_from_hb_model(_hb_model),
@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Create many Phius ADORB Variants from HBJSON files which all share the same geometry.
+
+Parametric studies often generate dozens of HBJSON files with identical geometry which differ
+only in their .revive properties (construction costs, CO2-measures, equipment, etc...). Rather
+than re-building the full Honeybee-Model for each one, the base model is built only once and
+the geometry-derived data (construction areas, room and shade structure) is cached. Each variant
+HBJSON is then applied as a light-weight 'overlay': only the model-level property libraries
+(constructions, program-types, HVAC) and the room / shade energy-property dicts are loaded.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from honeybee_energy.properties.room import RoomEnergyProperties
+
+from ph_adorb.constructions import PhAdorbConstructionCollection
+from ph_adorb.ep_sql_file import DataFileSQL
+from ph_adorb.equipment import PhAdorbEquipmentCollection
+from ph_adorb.from_HBJSON.create_variant import (
+    HBEquipmentCounter,
+    convert_hb_CO2_measures,
+    convert_hb_construction,
+    convert_hb_fuels,
+    convert_hb_hvac_equipment,
+    convert_hb_process_load,
+    convert_hb_shade_pv,
+    convert_hbe_lighting,
+    get_hb_model_construction_quantities,
+)
+from ph_adorb.from_HBJSON.read_HBJSON_file import convert_hbjson_dict_to_hb_model, import_honeybee_extensions
+from ph_adorb.grid_region import load_CO2_factors_from_json_file
+from ph_adorb.national_emissions import PhAdorbNationalEmissions
+from ph_adorb.variant import PhAdorbVariant
+
+# -- A 'path' of dict-keys and list-indexes to a single Shade dict within an HBJSON dict.
+ShadePath = tuple[str | int, ...]
+
+
+class HBModelGeometryMismatchError(Exception):
+    def __init__(self, _base_id: str, _variant_id: str) -> None:
+        self.message = (
+            f"HBModelGeometryMismatchError: The variant HBJSON does not share the base model's geometry. "
+            f"Expected room '{_base_id}' but got '{_variant_id}'."
+        )
+        super().__init__(self.message)
+
+
+class HBModelRoomCountMismatchError(HBModelGeometryMismatchError):
+    def __init__(self, _base_count: int, _variant_count: int) -> None:
+        self.message = (
+            f"HBModelRoomCountMismatchError: The variant HBJSON does not share the base model's geometry. "
+            f"Expected {_base_count} rooms but got {_variant_count}."
+        )
+        Exception.__init__(self, self.message)
+
+
+@dataclass(frozen=True)
+class HBRoomStructure:
+    """The cached structure of a single Honeybee-Room within the base model."""
+
+    identifier: str
+    program_type: str
+    hvac: str | None
+
+
+@dataclass(frozen=True)
+class HBModelGeometry:
+    """Geometry-derived data from a base Honeybee-Model, shared by all of its variants."""
+
+    display_name: str
+    construction_areas_m2: dict[str, float] = field(default_factory=dict)
+    rooms: tuple[HBRoomStructure, ...] = ()
+    shade_paths: tuple[ShadePath, ...] = ()
+
+
+def _find_shade_paths(_hbjson_dict: dict[str, Any]) -> list[ShadePath]:
+    """Return the dict-paths to every Shade (orphaned, room, face, aperture, door) in the HBJSON dict."""
+    paths_: list[ShadePath] = []
+
+    def _add_outdoor_shades(_parent: dict[str, Any], _parent_path: ShadePath) -> None:
+        for i, _ in enumerate(_parent.get("outdoor_shades") or []):
+            paths_.append(_parent_path + ("outdoor_shades", i))
+
+    for i, _ in enumerate(_hbjson_dict.get("orphaned_shades") or []):
+        paths_.append(("orphaned_shades", i))
+
+    for r, room in enumerate(_hbjson_dict.get("rooms") or []):
+        room_path: ShadePath = ("rooms", r)
+        _add_outdoor_shades(room, room_path)
+        for f, face in enumerate(room.get("faces") or []):
+            face_path = room_path + ("faces", f)
+            _add_outdoor_shades(face, face_path)
+            for a, aperture in enumerate(face.get("apertures") or []):
+                _add_outdoor_shades(aperture, face_path + ("apertures", a))
+            for d, door in enumerate(face.get("doors") or []):
+                _add_outdoor_shades(door, face_path + ("doors", d))
+
+    return paths_
+
+
+def _get_from_path(_hbjson_dict: dict[str, Any], _path: ShadePath) -> dict[str, Any]:
+    """Return the item found at the dict-path within the HBJSON dict."""
+    item: Any = _hbjson_dict
+    for key in _path:
+        item = item[key]
+    return item
+
+
+def get_HBModelGeometry_from_hbjson_dict(_base_hbjson_dict: dict[str, Any]) -> HBModelGeometry:
+    """Build the base Honeybee-Model once and return its cached geometry data.
+
+    Arguments:
+    ----------
+        * _base_hbjson_dict (dict): The HBJSON dictionary of the base model.
+
+    Returns:
+    --------
+        * HBModelGeometry: The cached geometry data for the base model.
+    """
+    hb_model = convert_hbjson_dict_to_hb_model(_base_hbjson_dict)
+
+    rooms: list[HBRoomStructure] = []
+    for room in hb_model.rooms:
+        room_prop: RoomEnergyProperties = getattr(room.properties, "energy")
+        rooms.append(
+            HBRoomStructure(
+                identifier=room.identifier,
+                program_type=room_prop.program_type.identifier,
+                hvac=room_prop.hvac.identifier if room_prop.hvac else None,
+            )
+        )
+
+    return HBModelGeometry(
+        display_name=hb_model.display_name or "unnamed",
+        construction_areas_m2=dict(get_hb_model_construction_quantities(hb_model)),
+        rooms=tuple(rooms),
+        shade_paths=tuple(_find_shade_paths(_base_hbjson_dict)),
+    )
+
+
+def get_PhAdorbConstructions_from_overlay(
+    _geometry: HBModelGeometry, _hb_constructions: dict[str, Any]
+) -> PhAdorbConstructionCollection:
+    """Return a ConstructionCollection using the variant's Constructions and the cached base-model areas."""
+    construction_collection_ = PhAdorbConstructionCollection()
+    for construction in _hb_constructions.values():
+        new_construction = convert_hb_construction(construction)
+        new_construction.area_m2 = _geometry.construction_areas_m2.get(construction.identifier, 0.0)
+        construction_collection_.add_construction(new_construction)
+    return construction_collection_
+
+
+def get_PhAdorbEquipment_from_overlay(
+    _geometry: HBModelGeometry,
+    _variant_hbjson_dict: dict[str, Any],
+    _schedules: dict[str, Any],
+    _program_types: dict[str, Any],
+    _hvacs: dict[str, Any],
+) -> PhAdorbEquipmentCollection:
+    """Return an EquipmentCollection using the variant's load / HVAC / PV properties and the cached base-model structure."""
+    import_honeybee_extensions()
+    from honeybee_energy.generator.pv import PVProperties
+    from honeybee_energy.lib.programtypes import program_type_by_identifier
+    from honeybee_energy.load.lighting import Lighting
+    from honeybee_energy.load.process import Process
+
+    equipment_counter = HBEquipmentCounter()
+    hvac_ids: dict[str, None] = {}  # -- ordered set
+
+    variant_rooms = _variant_hbjson_dict.get("rooms") or []
+    if len(variant_rooms) != len(_geometry.rooms):
+        raise HBModelRoomCountMismatchError(len(_geometry.rooms), len(variant_rooms))
+    for room_structure, room_dict in zip(_geometry.rooms, variant_rooms):
+        if room_dict["identifier"] != room_structure.identifier:
+            raise HBModelGeometryMismatchError(room_structure.identifier, room_dict["identifier"])
+        room_energy_dict: dict[str, Any] = room_dict["properties"]["energy"]
+
+        # -- Add all of the Appliances from the HB-Room
+        for process_load_dict in room_energy_dict.get("process_loads") or []:
+            process_load = Process.from_dict_abridged(process_load_dict, _schedules)
+            equipment_counter.add(process_load, convert_hb_process_load)
+
+        # -- Add the room's lighting (either the room's own, or the program-type's)
+        if room_energy_dict.get("lighting"):
+            lighting = Lighting.from_dict_abridged(room_energy_dict["lighting"], _schedules)
+        else:
+            program_type_id = room_energy_dict.get("program_type", room_structure.program_type)
+            program_type = _program_types.get(program_type_id) or program_type_by_identifier(program_type_id)
+            lighting = program_type.lighting
+        if lighting:
+            equipment_counter.add(lighting, convert_hbe_lighting)
+
+        # -- Collect the room's HVAC system. Many rooms may be served by the same one.
+        hvac_id = room_energy_dict.get("hvac", room_structure.hvac)
+        if hvac_id:
+            hvac_ids.setdefault(hvac_id, None)
+
+    # -- Add the HVAC Equipment, only once for each unique HVAC system
+    for hvac_id in hvac_ids:
+        hvac_prop_revive = getattr(_hvacs[hvac_id].properties, "revive")
+        for hb_hvac_equip in hvac_prop_revive.equipment_collection:
+            equipment_counter.add(hb_hvac_equip, convert_hb_hvac_equipment)
+
+    # -- Add all the Model's Shades which have PV on them
+    for shade_path in _geometry.shade_paths:
+        shade_energy_dict = _get_from_path(_variant_hbjson_dict, shade_path)["properties"]["energy"]
+        if not shade_energy_dict.get("pv_properties"):
+            continue
+        pv_properties = PVProperties.from_dict(shade_energy_dict["pv_properties"])
+        equipment_counter.add(pv_properties, convert_hb_shade_pv)
+
+    return equipment_counter.to_PhAdorbEquipmentCollection()
+
+
+def get_PhAdorbVariant_from_overlay(
+    _geometry: HBModelGeometry, _variant_hbjson_dict: dict[str, Any], _results_sql_file_path: Path
+) -> PhAdorbVariant:
+    """Create a new PhAdorbVariant from a variant HBJSON dict which shares the base model's geometry.
+
+    Arguments:
+    ----------
+        * _geometry (HBModelGeometry): The cached geometry data of the base model.
+        * _variant_hbjson_dict (dict): The HBJSON dictionary of the variant model.
+        * _results_sql_file_path (Path): The EnergyPlus results .SQL file for the variant.
+
+    Returns:
+    --------
+        * PhAdorbVariant: The new PhAdorbVariant object.
+    """
+
+    import_honeybee_extensions()
+    from honeybee_energy.properties.model import ModelEnergyProperties
+    from honeybee_revive.properties.model import ModelReviveProperties
+
+    # -----------------------------------------------------------------------------------
+    # -- Load only the model-level property libraries, skip all the geometry.
+    _, constructions, _, _, schedules, program_types, hvacs, _ = ModelEnergyProperties.load_properties_from_dict(
+        _variant_hbjson_dict
+    )
+    (
+        grid_region,
+        national_emissions_factors,
+        analysis_duration,
+        envelope_labor_cost_fraction,
+        co2_measures,
+        fuels,
+    ) = ModelReviveProperties.load_properties_from_dict(_variant_hbjson_dict)
+
+    # -----------------------------------------------------------------------------------
+    # -- Load in the EnergyPlus Simulation Result .SQL data file
+    ep_results_sql = DataFileSQL(source_file_path=_results_sql_file_path)
+    electricity, gas = convert_hb_fuels(fuels)
+
+    try:
+        revive_variant = PhAdorbVariant.from_trusted(
+            name=_variant_hbjson_dict.get("display_name") or _geometry.display_name,
+            total_purchased_gas_kwh=float(ep_results_sql.get_total_purchased_gas_kwh()),
+            hourly_purchased_electricity_kwh=ep_results_sql.get_hourly_purchased_electricity_kwh(),
+            total_sold_electricity_kwh=float(ep_results_sql.get_total_sold_electricity_kwh()),
+            peak_electric_usage_W=float(ep_results_sql.get_peak_electric_watts()),
+            electricity=electricity,
+            gas=gas,
+            grid_region=load_CO2_factors_from_json_file(Path(grid_region.filepath)),
+            national_emissions=PhAdorbNationalEmissions(**national_emissions_factors.to_dict()),
+            analysis_duration=int(analysis_duration),
+            envelope_labor_cost_fraction=float(envelope_labor_cost_fraction),
+            measure_collection=convert_hb_CO2_measures(co2_measures),
+            construction_collection=get_PhAdorbConstructions_from_overlay(_geometry, constructions),
+            equipment_collection=get_PhAdorbEquipment_from_overlay(
+                _geometry, _variant_hbjson_dict, schedules, program_types, hvacs
+            ),
+        )
+    except Exception as e:
+        msg = (
+            "An error occurred while reading data from the EnergyPlus SQL file? Please be sure that "
+            "you have set all of the required output-variables before running the EnergyPlus simulation"
+        )
+        raise Exception(msg, e)
+
+    return revive_variant
@@ -3,25 +3,16 @@
 
 """Functions for importing Honeybee Models from HBJSON files."""
 
+from __future__ import annotations
+
 import json
 import logging
 import os
 import pathlib
-from typing import Dict
-
-# -- Dev Note: Required to import ALL the base packages to run the __init__ startup routines
-# -- which ensures that .revive properties slot is added to all HB Objects. This must be done before
-# -- running read_hb_json to ensure there is a place for all the .ph properties to go.
-# -----------------------------------------------------------------------------
-# -- Dev Note: Do NOT remove vvvvvv -------------------------------------------
-import honeybee
-import honeybee_energy
-import honeybee_energy_revive
-import honeybee_revive
-from honeybee import model
+from typing import TYPE_CHECKING, Dict
 
-# -- Dev Note: Do NOT remove ^^^^^^ -------------------------------------------
-# -----------------------------------------------------------------------------
+if TYPE_CHECKING:
+    from honeybee import model
 
 
 logger = logging.getLogger()
@@ -37,6 +28,26 @@ class HBJSONModelReadError(Exception):
         super(HBJSONModelReadError, self).__init__(self.message)
 
 
+def import_honeybee_extensions() -> None:
+    """Import all of the Honeybee base packages, so their extension startup routines are run.
+
+    This is called lazily (only when an HBJSON is actually converted) so that users of the
+    core ADORB cost engine do not pay the Honeybee startup cost on import.
+    """
+    # -- Dev Note: Required to import ALL the base packages to run the __init__ startup routines
+    # -- which ensures that .revive properties slot is added to all HB Objects. This must be done before
+    # -- running read_hb_json to ensure there is a place for all the .ph properties to go.
+    # -----------------------------------------------------------------------------
+    # -- Dev Note: Do NOT remove vvvvvv -------------------------------------------
+    import honeybee
+    import honeybee_energy
+    import honeybee_energy_revive
+    import honeybee_revive
+
+    # -- Dev Note: Do NOT remove ^^^^^^ -------------------------------------------
+    # -----------------------------------------------------------------------------
+
+
 def read_hb_json_from_file(_file_address: pathlib.Path) -> Dict:
     """Read in the HBJSON file and return it as a python dictionary.
 
@@ -77,6 +88,9 @@ def convert_hbjson_dict_to_hb_model(_data: Dict) -> model.Model:
     --------
         model.Model: A Honeybee Model, rebuilt from the HBJSON file.
     """
+    import_honeybee_extensions()
+    from honeybee import model
+
     hb_model: model.Model = model.Model.from_dict(_data)
     logger.info(f"Converting HB-Model from {hb_model.units} to Meters.")
     hb_model.convert_to_units("Meters")
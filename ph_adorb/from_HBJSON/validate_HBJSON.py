@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Fast pre-validation of the .revive properties in an HBJSON dictionary, before the HB-Model is built.
+
+Re-building the Honeybee-Model from an HBJSON is slow, and missing .revive data (grid-region,
+national-emissions, fuels, ...) is otherwise only found deep inside the Variant creation. These
+functions walk the raw HBJSON dict (no Honeybee imports needed) and report every problem at once.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from ph_adorb.fuel import PhAdorbFuelType
+from ph_adorb.measures import CO2MeasureType
+
+# -- The REQUIRED_..._KEYS must each be a number. The REQUIRED_..._TEXT_KEYS must only be present.
+REQUIRED_NATIONAL_EMISSIONS_KEYS = ("us_trading_rank", "GDP_million_USD", "CO2_MT", "kg_CO2_per_USD")
+REQUIRED_NATIONAL_EMISSIONS_TEXT_KEYS = ("country_name",)
+REQUIRED_MEASURE_KEYS = ("year", "cost", "labor_fraction")
+REQUIRED_MEASURE_TEXT_KEYS = ("measure_type", "name", "country_name")
+REQUIRED_FUEL_KEYS = ("purchase_price_per_kwh", "sale_price_per_kwh", "annual_base_price")
+REQUIRED_EQUIPMENT_KEYS = ("cost", "lifetime_years", "labor_fraction")
+REQUIRED_FUEL_TYPES = ("ELECTRICITY", "NATURAL_GAS")
+
+
+class HBJSONValidationError(Exception):
+    def __init__(self, _errors: list[str]) -> None:
+        self.errors = _errors
+        self.message = f"HBJSONValidationError: The HBJSON has {len(_errors)} problem(s):\n" + "\n".join(
+            f"\t- {e}" for e in _errors
+        )
+        super().__init__(self.message)
+
+
+@dataclass
+class HBJSONValidationReport:
+    """All of the problems found in a single HBJSON dictionary."""
+
+    errors: list[str] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.errors
+
+    def raise_for_errors(self) -> None:
+        """Raise an HBJSONValidationError listing every error, if there are any."""
+        if self.errors:
+            raise HBJSONValidationError(self.errors)
+
+
+def _is_number(_value: Any) -> bool:
+    """Return True if the value can be used as a number."""
+    if isinstance(_value, bool):
+        return False
+    try:
+        float(_value)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def _revive_dict(_obj: dict[str, Any]) -> dict[str, Any] | None:
+    """Return the .revive properties dict of an HBJSON object dict, or None if there isn't one."""
+    return (_obj.get("properties") or {}).get("revive", None)
+
+
+def _check_numbers(
+    _report: HBJSONValidationReport,
+    _dict: dict[str, Any],
+    _keys: tuple[str, ...],
+    _name: str,
+    _text_keys: tuple[str, ...] = (),
+) -> None:
+    """Add an error for each of the (number) keys which is missing or not a number, and for each missing text-key."""
+    for key in _text_keys + _keys:
+        if key not in _dict or _dict[key] is None:
+            _report.errors.append(f"{_name}: is missing '{key}'.")
+        elif key in _keys and not _is_number(_dict[key]):
+            _report.errors.append(f"{_name}: '{key}' is not a number (got: {_dict[key]!r}).")
+
+
+def _check_equipment(_report: HBJSONValidationReport, _obj: dict[str, Any] | None, _name: str) -> None:
+    """Check the cost / lifetime / labor .revive properties of a load, or PV, dict."""
+    if not _obj:
+        return
+    obj_name = f"{_name} '{_obj.get('display_name') or _obj.get('identifier')}'"
+    revive_dict = _revive_dict(_obj)
+    if revive_dict is None:
+        _report.warnings.append(f"{obj_name}: has no .revive properties. Default values will be used.")
+        return
+    _check_numbers(_report, revive_dict, REQUIRED_EQUIPMENT_KEYS, obj_name)
+
+
+def _hvac_equipment_dicts(_hvac_revive_dict: dict[str, Any]) -> list[dict[str, Any]]:
+    """Return the equipment dicts of an HVAC's .revive 'equipment_collection' (a list, or a dict by identifier)."""
+    equipment = (_hvac_revive_dict.get("equipment_collection") or {}).get("equipment") or []
+    return list(equipment.values()) if isinstance(equipment, dict) else list(equipment)
+
+
+def validate_model_revive_properties(_report: HBJSONValidationReport, _hbjson_dict: dict[str, Any]) -> None:
+    """Check the Model-level .revive properties (grid-region, emissions, measures, fuels)."""
+    revive_dict = _revive_dict(_hbjson_dict)
+    if revive_dict is None:
+        _report.errors.append("Model: has no .revive properties.")
+        return
+
+    # -- Grid Region
+    grid_region = revive_dict.get("grid_region")
+    if not grid_region:
+        _report.errors.append("Model: is missing the 'grid_region'.")
+    elif not grid_region.get("filepath"):
+        _report.errors.append("Model: the 'grid_region' has no 'filepath'.")
+    elif not Path(grid_region["filepath"]).exists():
+        _report.errors.append(f"Model: the 'grid_region' file does not exist: '{grid_region['filepath']}'.")
+
+    # -- National Emissions
+    national_emissions = revive_dict.get("national_emissions_factors")
+    if not national_emissions:
+        _report.errors.append("Model: is missing the 'national_emissions_factors'.")
+    else:
+        _check_numbers(
+            _report,
+            national_emissions,
+            REQUIRED_NATIONAL_EMISSIONS_KEYS,
+            "Model national_emissions",
+            REQUIRED_NATIONAL_EMISSIONS_TEXT_KEYS,
+        )
+
+    # -- Analysis Settings
+    _check_numbers(_report, revive_dict, ("analysis_duration", "envelope_labor_cost_fraction"), "Model")
+
+    # -- CO2 Reduction Measures
+    for key, measure in (revive_dict.get("co2_measures") or {}).items():
+        measure_name = f"CO2-Measure '{measure.get('name', key)}'"
+        _check_numbers(_report, measure, REQUIRED_MEASURE_KEYS, measure_name, REQUIRED_MEASURE_TEXT_KEYS)
+        if measure.get("measure_type") not in {_.value for _ in CO2MeasureType}:
+            _report.errors.append(f"{measure_name}: unknown 'measure_type' {measure.get('measure_type')!r}.")
+
+    # -- Fuels
+    fuels = revive_dict.get("fuels")
+    if fuels is None:
+        _report.errors.append("Model: is missing the 'fuels'.")
+    else:
+        for fuel_type in REQUIRED_FUEL_TYPES:
+            fuel = fuels.get(fuel_type)
+            if fuel is None:
+                _report.errors.append(f"Model: is missing the '{PhAdorbFuelType[fuel_type].value}' fuel.")
+            else:
+                _check_numbers(_report, fuel, REQUIRED_FUEL_KEYS, f"Fuel '{fuel_type}'")
+
+
+def validate_energy_revive_properties(_report: HBJSONValidationReport, _hbjson_dict: dict[str, Any]) -> None:
+    """Check the .revive properties of the Constructions, Loads and HVAC systems."""
+    energy_dict = (_hbjson_dict.get("properties") or {}).get("energy") or {}
+
+    for construction in energy_dict.get("constructions") or []:
+        if _revive_dict(construction) is None:
+            _report.errors.append(f"Construction '{construction.get('identifier')}': has no .revive properties.")
+
+    for program_type in energy_dict.get("program_types") or []:
+        _check_equipment(_report, program_type.get("lighting"), "Lighting")
+
+    for hvac in energy_dict.get("hvacs") or []:
+        hvac_revive_dict = _revive_dict(hvac)
+        if hvac_revive_dict is None:
+            _report.warnings.append(f"HVAC '{hvac.get('identifier')}': has no .revive properties (no equipment).")
+            continue
+        for hvac_equipment in _hvac_equipment_dicts(hvac_revive_dict):
+            equipment_name = (
+                f"HVAC-Equipment '{hvac_equipment.get('display_name') or hvac_equipment.get('identifier')}'"
+            )
+            _check_numbers(_report, hvac_equipment, REQUIRED_EQUIPMENT_KEYS, equipment_name)
+
+    for room in _hbjson_dict.get("rooms") or []:
+        room_energy_dict = (room.get("properties") or {}).get("energy") or {}
+        _check_equipment(_report, room_energy_dict.get("lighting"), "Lighting")
+        for process_load in room_energy_dict.get("process_loads") or []:
+            _check_equipment(_report, process_load, "Process-Load")
+
+
+def _all_shade_dicts(_hbjson_dict: dict[str, Any]) -> list[dict[str, Any]]:
+    """Return all the Shade dicts (orphaned, room, face, aperture, door) in the HBJSON dict."""
+    shades_: list[dict[str, Any]] = list(_hbjson_dict.get("orphaned_shades") or [])
+    for room in _hbjson_dict.get("rooms") or []:
+        shades_.extend(room.get("outdoor_shades") or [])
+        for face in room.get("faces") or []:
+            shades_.extend(face.get("outdoor_shades") or [])
+            for sub_face in (face.get("apertures") or []) + (face.get("doors") or []):
+                shades_.extend(sub_face.get("outdoor_shades") or [])
+    return shades_
+
+
+def validate_shade_revive_properties(_report: HBJSONValidationReport, _hbjson_dict: dict[str, Any]) -> None:
+    """Check the .revive properties of any PV found on the Shades."""
+    for shade in _all_shade_dicts(_hbjson_dict):
+        shade_energy_dict = (shade.get("properties") or {}).get("energy") or {}
+        _check_equipment(_report, shade_energy_dict.get("pv_properties"), "PV")
+
+
+def validate_hbjson_dict(_hbjson_dict: dict[str, Any]) -> HBJSONValidationReport:
+    """Walk the raw HBJSON dict and return a report with every .revive property problem found.
+
+    Arguments:
+    ----------
+        * _hbjson_dict (dict): The HBJSON dictionary, as read in from the HBJSON file.
+
+    Returns:
+    --------
+        * HBJSONValidationReport: The report with all of the errors and warnings found.
+    """
+    report_ = HBJSONValidationReport()
+    validate_model_revive_properties(report_, _hbjson_dict)
+    validate_energy_revive_properties(report_, _hbjson_dict)
+    validate_shade_revive_properties(report_, _hbjson_dict)
+    return report_
@@ -3,12 +3,18 @@
 
 """Electricity Grid Region with Hourly CO2 Emissions Factors."""
 
+from __future__ import annotations
+
 import json
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import pandas as pd
+import numpy as np
 from pydantic import BaseModel, Field
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class PhAdorbGridRegion(BaseModel):
     """Regional CO2 Emissions Factors for single Electricity Grid Region."""
@@ -30,8 +36,16 @@ class PhAdorbGridRegion(BaseModel):
         | ...  | ...   | ...   | ...   |
         | 8759 | 460.1 | 460.1 | 434.1 |
         """
+        import pandas as pd
+
         return pd.DataFrame(self.hourly_CO2_factors)
 
+    def get_CO2_factors_as_array(self) -> np.ndarray:
+        """Returns the CO2 factors as a 2D NumPy array (rows=hours of the year, columns=years)."""
+        if not self.hourly_CO2_factors:
+            return np.zeros((0, 0))
+        return np.column_stack([np.asarray(_, dtype=float) for _ in self.hourly_CO2_factors.values()])
+
 
 def write_CO2_factors_to_json_file(_file_path: Path, _grid_region: PhAdorbGridRegion):
     """Write the CO2 factors for the grid-region to a JSON file."""
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Find the install year for each CO2-Reduction-Measure which minimizes the Variant's total ADORB cost.
+
+Installing a measure later lowers its (discounted) cost, but delays its energy and CO2 savings,
+which are worth more in the early years, before the grid has de-carbonized. For each measure, the
+total ADORB cost of installing it in each year of the analysis is built at once from the
+per-year discount and grid-CO2 vectors. The best year for every measure is then found by dynamic
+programming over the measures, with each year's total install cost limited by an optional budget.
+
+Model: The Variant's energy use is its use before any of the measures. Each measure saves its
+energy (and the CO2 of that energy) in every year from its install year to the end of the analysis.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Mapping, Sequence
+
+import numpy as np
+
+from ph_adorb import adorb_cost
+from ph_adorb.measures import PhAdorbCO2ReductionMeasure
+from ph_adorb.variant import PhAdorbVariant, calc_annual_total_gas_CO2
+from ph_adorb.variant_result import ItemDelta, PhAdorbVariantResult
+
+logger = logging.getLogger(__name__)
+
+
+class InstallYearError(Exception):
+    def __init__(self, _msg: str) -> None:
+        self.message = f"InstallYearError: {_msg}"
+        super().__init__(self.message)
+
+
+@dataclass(frozen=True)
+class MeasureTiming:
+    """A CO2-Reduction-Measure to schedule, with its annual energy savings and its allowed install years.
+
+    Attributes:
+    -----------
+        * measure (PhAdorbCO2ReductionMeasure): The measure. Its '.year' is ignored.
+        * hourly_electricity_kwh_savings (np.ndarray | None): The hourly purchased electricity saved.
+        * gas_kwh_savings (float): The annual purchased gas saved.
+        * earliest_year (int): The first year the measure may be installed.
+        * latest_year (int | None): The last year the measure may be installed (Default: the final analysis year).
+    """
+
+    measure: PhAdorbCO2ReductionMeasure
+    hourly_electricity_kwh_savings: np.ndarray | None = field(default=None, compare=False)
+    gas_kwh_savings: float = 0.0
+    earliest_year: int = 0
+    latest_year: int | None = None
+
+
+@dataclass(frozen=True)
+class InstallYearPlan:
+    """The best install year of each measure, and the resulting yearly ADORB costs."""
+
+    years: dict[str, int]
+    total_ADORB: float
+    yearly_costs: np.ndarray
+    yearly_install_costs: np.ndarray
+
+    def measures(self, _timings: Sequence[MeasureTiming]) -> list[PhAdorbCO2ReductionMeasure]:
+        """Return copies of the measures, with their '.year' set to the planned install year."""
+        return [t.measure.copy(update={"year": self.years[t.measure.name]}) for t in _timings]
+
+
+@dataclass(frozen=True)
+class InstallYearFactors:
+    """The per-year discount vectors and the (hours x years) grid-CO2 factors, shared by all of a Variant's measures."""
+
+    pv_energy: np.ndarray
+    pv_operational_CO2: np.ndarray
+    pv_embodied_CO2: np.ndarray
+    hourly_CO2_factors: np.ndarray
+
+    @classmethod
+    def from_variant(cls, _variant: PhAdorbVariant) -> "InstallYearFactors":
+        n = _variant.analysis_duration
+        return cls(
+            adorb_cost.present_value_factors(n, adorb_cost.ENERGY_DISCOUNT_RATE),
+            adorb_cost.present_value_factors(n, adorb_cost.OPERATIONAL_CO2_DISCOUNT_RATE),
+            adorb_cost.present_value_factors(n, adorb_cost.EMBODIED_CO2_DISCOUNT_RATE),
+            _variant.grid_region.get_CO2_factors_as_array(),
+        )
+
+
+def measure_install_year_costs(
+    _variant: PhAdorbVariant, _timing: MeasureTiming, _factors: InstallYearFactors | None = None
+) -> np.ndarray:
+    """Return the (install-years x years x adorb_cost.ADORB_COLUMNS) change in the Variant's yearly ADORB costs
+    for the measure installed in each year of the analysis: its install costs, less its energy and CO2 savings.
+
+    Pass in the Variant's '_factors' when costing many measures, so they are only built once.
+    """
+    n = _variant.analysis_duration
+    factors = _factors or InstallYearFactors.from_variant(_variant)
+    pv_energy = factors.pv_energy
+    pv_operational_CO2 = factors.pv_operational_CO2
+    pv_embodied_CO2 = factors.pv_embodied_CO2
+    price_of_carbon = _variant.price_of_carbon
+    cost = _timing.measure.cost
+
+    # -- The yearly value of the measure's savings, in each year it is in place
+    electric_kwh, electric_CO2 = 0.0, np.zeros(n)
+    if _timing.hourly_electricity_kwh_savings is not None:
+        hourly_MWH = np.asarray(_timing.hourly_electricity_kwh_savings, dtype=float) * 0.001
+        num_hours = min(len(hourly_MWH), len(factors.hourly_CO2_factors))
+        electric_CO2 = (hourly_MWH[:num_hours] @ factors.hourly_CO2_factors[:num_hours])[:n]
+        electric_kwh = float(np.sum(_timing.hourly_electricity_kwh_savings))
+    gas_used = 1.0 if _variant.gas.used else 0.0
+    savings = np.zeros((n, len(adorb_cost.ADORB_COLUMNS)))
+    savings[:, 0] = (
+        electric_kwh * _variant.electricity.purchase_price_per_kwh
+        + gas_used * _timing.gas_kwh_savings * _variant.gas.purchase_price_per_kwh
+    ) / pv_energy
+    savings[:, 1] = (
+        (electric_CO2 + calc_annual_total_gas_CO2(_timing.gas_kwh_savings, _variant.gas.used))
+        * price_of_carbon
+        / pv_operational_CO2
+    )
+
+    # -- [install-year, year]: the savings apply in every year from the install year onward
+    in_place = np.arange(n)[None, :] >= np.arange(n)[:, None]
+    costs_ = np.where(in_place[:, :, None], -savings[None, :, :], 0.0)
+
+    # -- The one-time install cost, and its embodied CO2 (see: 'build_one_time_schedule'), in the install year
+    install_years = np.arange(n)
+    costs_[install_years, install_years, 2] += cost / pv_energy
+    costs_[install_years, install_years, 3] += (
+        adorb_cost.EMBODIED_CO2_FACTOR
+        * cost
+        * _variant.national_emissions.kg_CO2_per_USD
+        * price_of_carbon
+        / pv_embodied_CO2
+    )
+    return costs_
+
+
+def _allowed_years(_timing: MeasureTiming, _analysis_duration: int) -> np.ndarray:
+    latest = _analysis_duration - 1 if _timing.latest_year is None else min(_timing.latest_year, _analysis_duration - 1)
+    years = np.arange(max(_timing.earliest_year, 0), latest + 1)
+    if not len(years):
+        raise InstallYearError(f"The measure '{_timing.measure.name}' has no allowed install years.")
+    return years
+
+
+def optimize_install_years(
+    _variant: PhAdorbVariant,
+    _timings: Sequence[MeasureTiming],
+    _yearly_budgets: Mapping[int, float] | None = None,
+) -> InstallYearPlan:
+    """Return the install year for each measure which minimizes the Variant's total ADORB cost.
+
+    Arguments:
+    ----------
+        * _variant (PhAdorbVariant): The Variant. Any of the measures already in its collection are
+            re-scheduled (their current install year is ignored).
+        * _timings (Sequence[MeasureTiming]): The measures to schedule, with their savings and allowed years.
+        * _yearly_budgets (Mapping[int, float] | None): The maximum total install cost in any year.
+
+    Returns:
+    --------
+        * InstallYearPlan
+
+    Raises:
+    -------
+        * InstallYearError: If two of the measures have the same name, or if the measures cannot all
+            be installed within their windows and the budgets.
+    """
+    logger.info(f"optimize_install_years({len(_timings)} measures)")
+    names = [t.measure.name for t in _timings]
+    if len(set(names)) != len(names):
+        raise InstallYearError(f"The measure names must be unique: {names}")
+    n = _variant.analysis_duration
+    budgets = dict(_yearly_budgets or {})
+    budget_years = sorted(budgets)
+
+    # -- The Variant's costs without any of the measures
+    base = PhAdorbVariantResult.from_variant(_variant)
+    for timing in _timings:
+        if timing.measure.name in _variant.measure_collection:
+            base.apply(ItemDelta.removed(_variant.measure_collection.get_measure(timing.measure.name)))
+
+    factors = InstallYearFactors.from_variant(_variant)  # -- Built once, for all the measures
+    year_costs = [measure_install_year_costs(_variant, t, factors) for t in _timings]
+    year_totals = [c.sum(axis=(1, 2)) for c in year_costs]
+
+    # -- Dynamic program over the measures. The state is the amount spent so far in each of the
+    # -- budgeted years (with no budgets there is only one state, and each measure simply takes its best year).
+    # -- For each state only the lowest-cost schedule is kept: {spent: (total, years)}
+    states: dict[tuple[float, ...], tuple[float, tuple[int, ...]]] = {tuple(0.0 for _ in budget_years): (0.0, ())}
+    for timing, totals in zip(_timings, year_totals):
+        cost = timing.measure.cost
+        next_states: dict[tuple[float, ...], tuple[float, tuple[int, ...]]] = {}
+        for spent, (total, years) in states.items():
+            for year in _allowed_years(timing, n):
+                new_spent = tuple(s + cost if y == year else s for s, y in zip(spent, budget_years))
+                if any(s > budgets[y] for s, y in zip(new_spent, budget_years)):
+                    continue
+                new_total = total + float(totals[year])
+                if new_spent not in next_states or new_total < next_states[new_spent][0]:
+                    next_states[new_spent] = (new_total, years + (int(year),))
+        if not next_states:
+            raise InstallYearError(f"Cannot schedule the measure '{timing.measure.name}' within the yearly budgets.")
+        states = next_states
+
+    total, best_years = min(states.values(), key=lambda state: state[0])
+    yearly = base.yearly_costs.copy()
+    yearly_install_costs = np.zeros(n)
+    for timing, costs, year in zip(_timings, year_costs, best_years):
+        yearly += costs[year]
+        yearly_install_costs[year] += timing.measure.cost
+
+    return InstallYearPlan(
+        {t.measure.name: year for t, year in zip(_timings, best_years)},
+        float(yearly.sum()),
+        yearly,
+        yearly_install_costs,
+    )
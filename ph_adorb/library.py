@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Loading, validating and publishing shared JSON component libraries (Constructions, Equipment, ...).
+
+Libraries are fully validated only once, when they are published. Jobs can then load them in
+'trusted' mode, which builds the models without any per-field validation and caches the parsed
+library in a binary file keyed by the hash of the JSON file, so that later loads of the same
+library only need to read the cache.
+
+The cache files are plain NumPy '.npz' archives with one array per model field (see:
+'encode_model_columns'), read with 'allow_pickle=False', so a cache file can never execute code.
+They are kept in a per-user folder, which only its owner can read or write.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from enum import Enum
+from pathlib import Path
+from typing import Any, Mapping, Type, TypeVar
+
+import numpy as np
+from pydantic import BaseModel, ValidationError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T", bound=BaseModel)
+
+# -- Change this if the cached format changes, so that any old cache files are ignored.
+LIBRARY_CACHE_VERSION = 2
+DEFAULT_LIBRARY_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "ph_adorb" / "library"
+
+
+class LibraryValidationError(Exception):
+    def __init__(self, _file_path: Path, _errors: list[str]) -> None:
+        self.errors = _errors
+        self.message = f"LibraryValidationError: '{_file_path}' has {len(_errors)} invalid record(s):\n" + "\n".join(
+            f"\t- {e}" for e in _errors
+        )
+        super().__init__(self.message)
+
+
+def file_hash(_file_path: Path) -> str:
+    """Return the SHA-256 hash of the file's contents."""
+    return hashlib.sha256(Path(_file_path).read_bytes()).hexdigest()
+
+
+def _enum_fields(_model_type: Type[BaseModel]) -> dict[str, Type[Enum]]:
+    """Return the {field-name: Enum-type} of all the model's Enum fields."""
+    return {
+        name: field.type_
+        for name, field in _model_type.__fields__.items()
+        if isinstance(field.type_, type) and issubclass(field.type_, Enum)
+    }
+
+
+def trusted_construct(_model_type: Type[T], _items: list[dict[str, Any]]) -> list[T]:
+    """Build the models without any validation. Only Enum fields are converted from their values.
+
+    Only use this on data which has already been validated (see: validate_json_library).
+    """
+    enum_fields = _enum_fields(_model_type)
+    models_ = []
+    for item in _items:
+        for name, enum_type in enum_fields.items():
+            if name in item and not isinstance(item[name], enum_type):
+                item[name] = enum_type(item[name])
+        models_.append(_model_type.construct(**item))
+    return models_
+
+
+def encode_model_columns(_prefix: str, _model_type: Type[BaseModel], _items: list[BaseModel]) -> dict[str, np.ndarray]:
+    """Return the {'prefix.field-name': array} of each of the models' fields. None values are stored as NaN."""
+    columns_: dict[str, np.ndarray] = {}
+    for name, field in _model_type.__fields__.items():
+        values = [getattr(item, name) for item in _items]
+        if isinstance(field.type_, type) and issubclass(field.type_, Enum):
+            columns_[f"{_prefix}.{name}"] = np.array([v.value for v in values], dtype=str)
+        elif field.type_ is str:
+            columns_[f"{_prefix}.{name}"] = np.array(values, dtype=str)
+        elif field.type_ in (int, bool):
+            columns_[f"{_prefix}.{name}"] = np.array(values, dtype=field.type_)
+        else:
+            columns_[f"{_prefix}.{name}"] = np.array([np.nan if v is None else v for v in values], dtype=float)
+    return columns_
+
+
+def decode_model_columns(_prefix: str, _model_type: Type[T], _arrays: Mapping[str, np.ndarray]) -> list[T]:
+    """Return the models re-built (without validation) from the columnar arrays written by 'encode_model_columns'."""
+    columns = {name: _arrays[f"{_prefix}.{name}"].tolist() for name in _model_type.__fields__}
+    for name, field in _model_type.__fields__.items():
+        if field.allow_none:
+            columns[name] = [None if v != v else v for v in columns[name]]  # -- NaN -> None
+
+    num_items = len(next(iter(columns.values()), []))
+    rows = [{name: values[i] for name, values in columns.items()} for i in range(num_items)]
+    return trusted_construct(_model_type, rows)
+
+
+def _cache_file_path(_file_path: Path, _model_type: Type[BaseModel], _cache_dir: Path) -> Path:
+    key = f"{_model_type.__module__}.{_model_type.__qualname__}-v{LIBRARY_CACHE_VERSION}-{file_hash(_file_path)}"
+    return _cache_dir / f"{Path(_file_path).stem}-{hashlib.sha256(key.encode()).hexdigest()[:32]}.npz"
+
+
+def _read_cache(_cache_file: Path, _model_type: Type[T], _key: str) -> dict[str, T] | None:
+    try:
+        with np.load(_cache_file, allow_pickle=False) as npz:
+            models = decode_model_columns("items", _model_type, {name: npz[name] for name in npz.files})
+        return {getattr(_, _key): _ for _ in models}
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring the unreadable library cache file: '{_cache_file}' ({e})")
+        return None
+
+
+def _write_cache(_cache_file: Path, _model_type: Type[BaseModel], _library: dict[str, Any]) -> None:
+    """Write the cache file atomically: to a uniquely named temp file first, so parallel jobs never see a partial file."""
+    tmp_file: Path | None = None
+    try:
+        _cache_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=_cache_file.parent, prefix=f"{_cache_file.stem}-", suffix=".tmp", delete=False
+        ) as f:
+            tmp_file = Path(f.name)
+            np.savez(f, **encode_model_columns("items", _model_type, list(_library.values())))
+        tmp_file.replace(_cache_file)
+    except OSError as e:
+        logger.warning(f"Could not write the library cache file: '{_cache_file}' ({e})")
+        if tmp_file is not None:
+            tmp_file.unlink(missing_ok=True)
+
+
+def load_json_library(
+    _file_path: Path,
+    _model_type: Type[T],
+    _key: str,
+    _trusted: bool = False,
+    _cache_dir: Path | None = DEFAULT_LIBRARY_CACHE_DIR,
+) -> dict[str, T]:
+    """Load a JSON library file (a list of records) and return a dict of the models, keyed by one of their fields.
+
+    Arguments:
+    ----------
+        * _file_path (Path): The JSON library file to load.
+        * _model_type (Type[BaseModel]): The type of model to build from each record.
+        * _key (str): The name of the model field to use as the dict key.
+        * _trusted (bool): Default=False. If True, the records are not validated and the parsed
+            library is cached (by file hash) in the '_cache_dir'.
+        * _cache_dir (Path | None): The folder for the cached libraries. Set to None to disable the cache.
+
+    Returns:
+    --------
+        * dict[str, BaseModel]: The library models, keyed by their '_key' field.
+    """
+    if not _trusted:
+        with open(_file_path, "r") as json_file:
+            all_models = (_model_type(**item) for item in json.load(json_file))
+            return {getattr(_, _key): _ for _ in all_models}
+
+    cache_file = _cache_file_path(_file_path, _model_type, _cache_dir) if _cache_dir else None
+    if cache_file and (cached_library := _read_cache(cache_file, _model_type, _key)) is not None:
+        return cached_library
+
+    with open(_file_path, "r") as json_file:
+        library_ = {getattr(_, _key): _ for _ in trusted_construct(_model_type, json.load(json_file))}
+
+    if cache_file:
+        _write_cache(cache_file, _model_type, library_)
+    return library_
+
+
+def validate_json_library(_file_path: Path, _model_type: Type[T]) -> list[T]:
+    """Fully validate every record in the JSON library file, raising a LibraryValidationError listing all the invalid records."""
+    with open(_file_path, "r") as json_file:
+        items = json.load(json_file)
+
+    models_: list[T] = []
+    errors: list[str] = []
+    for i, item in enumerate(items):
+        try:
+            models_.append(_model_type(**item))
+        except ValidationError as e:
+            errors.append(f"Record [{i}]: {e}".replace("\n", " "))
+
+    if errors:
+        raise LibraryValidationError(_file_path, errors)
+    return models_
+
+
+def publish_json_library(
+    _source_file_path: Path,
+    _target_file_path: Path,
+    _model_type: Type[T],
+    _key: str,
+    _cache_dir: Path | None = DEFAULT_LIBRARY_CACHE_DIR,
+) -> dict[str, T]:
+    """Validate a JSON library, write the validated records to the target file, and build its cache.
+
+    After publishing, the target library can be loaded with '_trusted=True'.
+    """
+    models = validate_json_library(_source_file_path, _model_type)
+    with open(_target_file_path, "w") as json_file:
+        json.dump([_.dict() for _ in models], json_file, indent=4)
+    return load_json_library(_target_file_path, _model_type, _key, _trusted=True, _cache_dir=_cache_dir)
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""A SQLite-backed store for the shared component libraries (Constructions, Equipment, CO2-Measures, ...).
+
+Unlike the flat JSON library files, which must always be loaded whole, the store is indexed on
+the record name, type and country so that a job can load only the few records it needs. Records
+are validated once when they are inserted, and re-built without validation when they are read.
+"""
+
+import json
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Type
+
+from pydantic import BaseModel
+
+from ph_adorb.constructions import PhAdorbConstruction
+from ph_adorb.equipment import PhAdorbEquipment
+from ph_adorb.library import trusted_construct, validate_json_library
+from ph_adorb.measures import PhAdorbCO2ReductionMeasure
+from ph_adorb.national_emissions import PhAdorbNationalEmissions
+
+
+@dataclass(frozen=True)
+class LibraryKind:
+    """How one type of library record is stored: its model, and which fields are indexed."""
+
+    model_type: Type[BaseModel]
+    name_field: str
+    type_field: str | None = None
+    country_field: str | None = None
+
+
+LIBRARY_KINDS: dict[str, LibraryKind] = {
+    "construction": LibraryKind(PhAdorbConstruction, "display_name"),
+    "equipment": LibraryKind(PhAdorbEquipment, "name", type_field="equipment_type"),
+    "co2_measure": LibraryKind(
+        PhAdorbCO2ReductionMeasure, "name", type_field="measure_type", country_field="country_name"
+    ),
+    "national_emissions": LibraryKind(PhAdorbNationalEmissions, "country_name", country_field="country_name"),
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    type TEXT,
+    country TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (kind, name)
+);
+CREATE INDEX IF NOT EXISTS idx_records_type ON records (kind, type);
+CREATE INDEX IF NOT EXISTS idx_records_country ON records (kind, country);
+"""
+
+
+class UnknownLibraryKindError(Exception):
+    def __init__(self, _kind: str) -> None:
+        self.message = f"UnknownLibraryKindError: '{_kind}'. Expected one of: {list(LIBRARY_KINDS.keys())}"
+        super().__init__(self.message)
+
+
+def _get_kind(_kind: str) -> LibraryKind:
+    try:
+        return LIBRARY_KINDS[_kind]
+    except KeyError:
+        raise UnknownLibraryKindError(_kind)
+
+
+def _field_value(_model: BaseModel, _field: str | None) -> str | None:
+    """Return the (str) value of the model's field, or None if there is no field."""
+    if _field is None:
+        return None
+    value = getattr(_model, _field)
+    return getattr(value, "value", value)
+
+
+class PhAdorbLibraryStore:
+    """A SQLite database of component library records, indexed by kind, name, type and country.
+
+    Usage:
+        >>> with PhAdorbLibraryStore(Path("library.sqlite")) as store:
+        ...     store.insert_from_json_file("equipment", Path("equipment.json"))
+        ...     lights = store.query("equipment", _type="Lights")
+    """
+
+    def __init__(self, _db_path: Path | str = ":memory:") -> None:
+        self.db_path = _db_path
+        self.connection = sqlite3.connect(str(_db_path))
+        self.connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> "PhAdorbLibraryStore":
+        return self
+
+    def __exit__(self, *_args: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+    def count(self, _kind: str) -> int:
+        """Return the number of records of the kind in the store."""
+        _get_kind(_kind)
+        return self.connection.execute("SELECT COUNT(*) FROM records WHERE kind = ?", (_kind,)).fetchone()[0]
+
+    def insert(self, _kind: str, _models: Iterable[BaseModel]) -> int:
+        """Insert (or replace) the already validated models in a single transaction. Returns the number inserted."""
+        kind = _get_kind(_kind)
+        rows = [
+            (
+                _kind,
+                _field_value(model, kind.name_field),
+                _field_value(model, kind.type_field),
+                _field_value(model, kind.country_field),
+                model.json(),
+            )
+            for model in _models
+        ]
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO records (kind, name, type, country, data) VALUES (?, ?, ?, ?, ?)", rows
+            )
+        return len(rows)
+
+    def insert_from_json_file(self, _kind: str, _file_path: Path) -> int:
+        """Validate all the records in an existing JSON library file, and bulk-insert them into the store."""
+        return self.insert(_kind, validate_json_library(_file_path, _get_kind(_kind).model_type))
+
+    def query(
+        self,
+        _kind: str,
+        _names: Iterable[str] | None = None,
+        _type: str | None = None,
+        _country: str | None = None,
+    ) -> dict[str, Any]:
+        """Return the records of the kind matching all the filters given, keyed by name.
+
+        Arguments:
+        ----------
+            * _kind (str): The kind of record ("construction", "equipment", "co2_measure", "national_emissions").
+            * _names (Iterable[str] | None): Only return the records with these names.
+            * _type (str | None): Only return the records of this type (ie: "Lights", "PERFORMANCE").
+            * _country (str | None): Only return the records for this country.
+
+        Returns:
+        --------
+            * dict[str, BaseModel]: The matching models, keyed by name.
+        """
+        kind = _get_kind(_kind)
+        sql = "SELECT data FROM records WHERE kind = ?"
+        params: list[Any] = [_kind]
+        if _names is not None:
+            names = list(_names)
+            sql += f" AND name IN ({', '.join('?' * len(names))})"
+            params.extend(names)
+        if _type is not None:
+            sql += " AND type = ?"
+            params.append(_type)
+        if _country is not None:
+            sql += " AND country = ?"
+            params.append(_country)
+        sql += " ORDER BY name"
+
+        items = [json.loads(row[0]) for row in self.connection.execute(sql, params)]
+        return {_field_value(m, kind.name_field): m for m in trusted_construct(kind.model_type, items)}
+
+    def get(self, _kind: str, _name: str) -> Any:
+        """Return a single record of the kind, by name."""
+        records = self.query(_kind, _names=[_name])
+        if not records:
+            raise KeyError(f"No '{_kind}' record named '{_name}' in the library store: {self.db_path}")
+        return records[_name]
@@ -9,13 +9,16 @@ from pathlib import Path
 
 from pydantic import BaseModel, PrivateAttr
 
+from ph_adorb.library import DEFAULT_LIBRARY_CACHE_DIR, load_json_library
+from ph_adorb.versioned_model import VersionedModel
+
 
 class CO2MeasureType(str, Enum):
     PERFORMANCE = "PERFORMANCE"
     NON_PERFORMANCE = "NON_PERFORMANCE"
 
 
-class PhAdorbCO2ReductionMeasure(BaseModel):
+class PhAdorbCO2ReductionMeasure(VersionedModel):
     """A CO2 Reduction Measure."""
 
     measure_type: CO2MeasureType
@@ -35,21 +38,77 @@ class PhAdorbCO2MeasureCollection(BaseModel):
     """A collection of CO2 Reduction Measures."""
 
     _measures: dict[str, PhAdorbCO2ReductionMeasure] = PrivateAttr(default_factory=dict)
+    _sorted_items: list[tuple[str, PhAdorbCO2ReductionMeasure]] | None = PrivateAttr(default=None)
+    _sorted_versions: tuple[int, ...] = PrivateAttr(default=())
+    _type_keys: dict[CO2MeasureType, list[str]] = PrivateAttr(default_factory=dict)
+    _shared: bool = PrivateAttr(default=False)
 
     def add_measure(self, factor: PhAdorbCO2ReductionMeasure) -> None:
+        self._own_items()
         self._measures[factor.name] = factor
+        self._sorted_items = None
+        self._type_keys = {}
+
+    def duplicate(self) -> "PhAdorbCO2MeasureCollection":
+        """Return a new collection with copies of all the Measures."""
+        collection_ = PhAdorbCO2MeasureCollection()
+        for measure in self._measures.values():
+            collection_.add_measure(measure.copy())
+        return collection_
+
+    def share(self) -> "PhAdorbCO2MeasureCollection":
+        """Return a new (copy-on-write) collection which shares this collection's Measures.
+
+        While shared, the Measures are read-only. Either collection copies them (once) before it is
+        first changed, or before one of its Measures is returned by .get_measure() to be edited.
+        """
+        if not self._shared:
+            for measure in self._measures.values():
+                measure.set_shared()
+            self._shared = True
+        collection_ = PhAdorbCO2MeasureCollection()
+        collection_._measures = self._measures
+        collection_._sorted_items = self._sorted_items
+        collection_._sorted_versions = self._sorted_versions
+        collection_._type_keys = dict(self._type_keys)
+        collection_._shared = True
+        return collection_
+
+    def _own_items(self) -> None:
+        """Copy the (read-only) shared Measures, before this collection is changed. See: .share()"""
+        if self._shared:
+            self._measures = {k: v.copy() for k, v in self._measures.items()}
+            self._sorted_items = None
+            self._shared = False
 
     def get_measure(self, key: str) -> PhAdorbCO2ReductionMeasure:
+        self._own_items()
         return self._measures[key]
 
+    def _get_sorted_items(self) -> list[tuple[str, PhAdorbCO2ReductionMeasure]]:
+        """Return the (key, item) pairs sorted by year.
+
+        Cached until the collection is changed, or any of its Measures is edited in place (ie: a new .year).
+        """
+        versions = tuple(m.version for m in self._measures.values())
+        if self._sorted_items is None or versions != self._sorted_versions:
+            self._sorted_versions = versions
+            self._sorted_items = sorted(self._measures.items(), key=lambda x: x[1].year)
+            self._type_keys = {}
+        return self._sorted_items
+
+    def fingerprint(self) -> tuple:
+        """Return a hashable fingerprint of every Measure's field values, which changes if any of them change."""
+        return tuple((k, tuple(v.__dict__.values())) for k, v in self._get_sorted_items())
+
     def keys(self) -> list[str]:
-        return [k for k, v in sorted(self._measures.items(), key=lambda x: x[1].year)]
+        return [k for k, _ in self._get_sorted_items()]
 
     def values(self) -> list[PhAdorbCO2ReductionMeasure]:
-        return list(sorted(self._measures.values(), key=lambda x: x.year))
+        return [v for _, v in self._get_sorted_items()]
 
     def __iter__(self):
-        return iter(sorted(self._measures.values(), key=lambda x: x.year))
+        return (v for _, v in self._get_sorted_items())
 
     def __contains__(self, key: str | PhAdorbCO2ReductionMeasure) -> bool:
         if isinstance(key, PhAdorbCO2ReductionMeasure):
@@ -59,23 +118,32 @@ class PhAdorbCO2MeasureCollection(BaseModel):
     def __len__(self) -> int:
         return len(self._measures)
 
+    def measures_of_type(self, _measure_type: CO2MeasureType) -> "PhAdorbCO2MeasureCollection":
+        """Return a new collection of only the measures of the specified type.
+
+        Only the (sorted) keys of each type are cached, until this collection or any of its
+        Measures is changed. The returned collection is new on each call, so it can be changed freely.
+        """
+        sorted_items = self._get_sorted_items()  # -- Clears the cached keys if any Measure has been edited
+        if _measure_type not in self._type_keys:
+            self._type_keys[_measure_type] = [k for k, v in sorted_items if v.measure_type == _measure_type]
+
+        collection_ = PhAdorbCO2MeasureCollection()
+        collection_._measures = {k: self._measures[k] for k in self._type_keys[_measure_type]}
+        collection_._sorted_items = list(collection_._measures.items())
+        collection_._sorted_versions = tuple(m.version for m in collection_._measures.values())
+        collection_._shared = self._shared
+        return collection_
+
     @property
     def performance_measures(self) -> "PhAdorbCO2MeasureCollection":
         """Return a collection of PERFORMANCE measures."""
-        new_collection = PhAdorbCO2MeasureCollection()
-        for measure in self.values():
-            if measure.measure_type == CO2MeasureType.PERFORMANCE:
-                new_collection.add_measure(measure)
-        return new_collection
+        return self.measures_of_type(CO2MeasureType.PERFORMANCE)
 
     @property
     def nonperformance_measures(self) -> "PhAdorbCO2MeasureCollection":
         """Return a collection of NON-PERFORMANCE measures."""
-        new_collection = PhAdorbCO2MeasureCollection()
-        for measure in self.values():
-            if measure.measure_type == CO2MeasureType.NON_PERFORMANCE:
-                new_collection.add_measure(measure)
-        return new_collection
+        return self.measures_of_type(CO2MeasureType.NON_PERFORMANCE)
 
 
 def write_CO2_measures_to_json_file(_file_path: Path, measures: dict[str, PhAdorbCO2ReductionMeasure]) -> None:
@@ -84,8 +152,11 @@ def write_CO2_measures_to_json_file(_file_path: Path, measures: dict[str, PhAdor
         json.dump([_.dict() for _ in measures.values()], json_file, indent=4)
 
 
-def load_CO2_measures_from_json_file(_file_path: Path) -> dict[str, PhAdorbCO2ReductionMeasure]:
-    """Load all of the CO2 Measure-Types from a JSON file."""
-    with open(_file_path, "r") as json_file:
-        all_measures = (PhAdorbCO2ReductionMeasure(**item) for item in json.load(json_file))
-        return {_.name: _ for _ in all_measures}
+def load_CO2_measures_from_json_file(
+    _file_path: Path, _trusted: bool = False, _cache_dir: Path | None = DEFAULT_LIBRARY_CACHE_DIR
+) -> dict[str, PhAdorbCO2ReductionMeasure]:
+    """Load all of the CO2 Measure-Types from a JSON file.
+
+    Set '_trusted=True' to skip the validation of a published library and use its binary cache.
+    """
+    return load_json_library(_file_path, PhAdorbCO2ReductionMeasure, "name", _trusted, _cache_dir)
@@ -0,0 +1,298 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Vectorized Monte Carlo uncertainty analysis of a Variant's ADORB costs.
+
+The price of carbon, the discount rates, the fuel prices and the USA grid-transition constants
+can each be given a Distribution. All of the samples are then evaluated against the Variant in a
+single batched (samples x years x columns) array calculation. The energy use, CO2 emissions and
+the item replacement schedule are calculated only once, since they do not depend on any of
+the uncertain parameters.
+
+Usage:
+    >>> result = run_monte_carlo(
+    ...     variant,
+    ...     {"price_of_carbon": Triangular(0.1, 0.25, 0.5), "energy_discount_rate": Uniform(0.01, 0.03)},
+    ...     _num_samples=10_000,
+    ... )
+    >>> p10, p50, p90 = result.cumulative_bands((10, 50, 90))
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Mapping, NamedTuple, Sequence
+
+import numpy as np
+
+from ph_adorb import adorb_cost
+from ph_adorb.variant import (
+    PhAdorbVariant,
+    calc_annual_hourly_electric_CO2,
+    calc_annual_total_gas_CO2,
+    calc_variant_cost_ledger,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------------------
+# -- Distributions
+
+
+@dataclass(frozen=True)
+class Fixed:
+    value: float
+
+    def sample(self, _rng: np.random.Generator, _size: int) -> np.ndarray:
+        return np.full(_size, self.value, dtype=float)
+
+
+@dataclass(frozen=True)
+class Uniform:
+    low: float
+    high: float
+
+    def sample(self, _rng: np.random.Generator, _size: int) -> np.ndarray:
+        return _rng.uniform(self.low, self.high, _size)
+
+
+@dataclass(frozen=True)
+class Normal:
+    mean: float
+    std: float
+
+    def sample(self, _rng: np.random.Generator, _size: int) -> np.ndarray:
+        return _rng.normal(self.mean, self.std, _size)
+
+
+@dataclass(frozen=True)
+class Triangular:
+    low: float
+    mode: float
+    high: float
+
+    def sample(self, _rng: np.random.Generator, _size: int) -> np.ndarray:
+        return _rng.triangular(self.low, self.mode, self.high, _size)
+
+
+@dataclass(frozen=True)
+class LogNormal:
+    """A log-normal distribution, given by the mean and std-deviation of the underlying normal distribution."""
+
+    mu: float
+    sigma: float
+
+    def sample(self, _rng: np.random.Generator, _size: int) -> np.ndarray:
+        return _rng.lognormal(self.mu, self.sigma, _size)
+
+
+Distribution = Fixed | Uniform | Normal | Triangular | LogNormal
+
+
+# ---------------------------------------------------------------------------------------
+# -- Parameters
+
+# -- The uncertain parameters, with the function to get each one's (point) value for a Variant.
+MONTE_CARLO_PARAMETERS: dict[str, Callable[[PhAdorbVariant], float]] = {
+    "price_of_carbon": lambda v: v.price_of_carbon,
+    "energy_discount_rate": lambda v: adorb_cost.ENERGY_DISCOUNT_RATE,
+    "operational_CO2_discount_rate": lambda v: adorb_cost.OPERATIONAL_CO2_DISCOUNT_RATE,
+    "embodied_CO2_discount_rate": lambda v: adorb_cost.EMBODIED_CO2_DISCOUNT_RATE,
+    "electric_purchase_price_per_kwh": lambda v: v.electricity.purchase_price_per_kwh,
+    "electric_sale_price_per_kwh": lambda v: v.electricity.sale_price_per_kwh,
+    "electric_annual_base_price": lambda v: v.electricity.annual_base_price,
+    "gas_purchase_price_per_kwh": lambda v: v.gas.purchase_price_per_kwh,
+    "gas_annual_base_price": lambda v: v.gas.annual_base_price,
+    "usa_national_transition_cost": lambda v: adorb_cost.USA_NATIONAL_TRANSITION_COST,
+    "nameplate_capacity_increase_GW": lambda v: adorb_cost.NAMEPLATE_CAPACITY_INCREASE_GW,
+    "usa_num_years_to_transition": lambda v: adorb_cost.USA_NUM_YEARS_TO_TRANSITION,
+}
+
+
+class UnknownParameterError(Exception):
+    def __init__(self, _names: Sequence[str]) -> None:
+        self.message = f"UnknownParameterError: {list(_names)}. Expected any of: {list(MONTE_CARLO_PARAMETERS.keys())}"
+        super().__init__(self.message)
+
+
+def sample_parameters(
+    _variant: PhAdorbVariant,
+    _distributions: Mapping[str, Distribution],
+    _num_samples: int,
+    _rng: np.random.Generator,
+) -> dict[str, np.ndarray]:
+    """Return the {parameter-name: samples} of every parameter. Those without a Distribution use the Variant's value."""
+    unknown = [name for name in _distributions if name not in MONTE_CARLO_PARAMETERS]
+    if unknown:
+        raise UnknownParameterError(unknown)
+
+    return {
+        name: (
+            _distributions[name].sample(_rng, _num_samples)
+            if name in _distributions
+            else np.full(_num_samples, get_value(_variant), dtype=float)
+        )
+        for name, get_value in MONTE_CARLO_PARAMETERS.items()
+    }
+
+
+def point_parameters(_variant: PhAdorbVariant) -> dict[str, np.ndarray]:
+    """Return the {parameter-name: (1,) array} of every parameter, with the Variant's own (point) value."""
+    return {name: np.array([get_value(_variant)], dtype=float) for name, get_value in MONTE_CARLO_PARAMETERS.items()}
+
+
+# ---------------------------------------------------------------------------------------
+# -- Batched calculation
+
+
+def _present_value_factors(_analysis_duration_years: int, _discount_rates: np.ndarray) -> np.ndarray:
+    """Return the (samples x years) array of the present value factors for each sample's discount rate."""
+    years = np.arange(1, _analysis_duration_years + 1, dtype=float)
+    return (1 + _discount_rates[:, None]) ** years[None, :]
+
+
+class VariantQuantities(NamedTuple):
+    """The Variant's yearly quantities which do not depend on any of the uncertain parameters."""
+
+    operational_kgCO2: np.ndarray
+    install_costs: np.ndarray
+    embodied_kgCO2: np.ndarray
+
+
+def calc_variant_quantities(_variant: PhAdorbVariant) -> VariantQuantities:
+    """Return the Variant's yearly operational kgCO2 (electric and gas), install costs and embodied kgCO2."""
+    n = _variant.analysis_duration
+    annual_CO2 = np.asarray(
+        calc_annual_hourly_electric_CO2(_variant.hourly_purchased_electricity_kwh, _variant.grid_region), dtype=float
+    )[:n] + calc_annual_total_gas_CO2(_variant.total_purchased_gas_kwh, _variant.gas.used)
+    cost_ledger = calc_variant_cost_ledger(_variant)
+    return VariantQuantities(
+        annual_CO2, cost_ledger.by_year("install_cost")[:n], cost_ledger.by_year("embodied_kgCO2")[:n]
+    )
+
+
+def calculate_annual_ADORB_costs_batch(
+    _variant: PhAdorbVariant,
+    _samples: Mapping[str, np.ndarray],
+    _quantities: VariantQuantities | None = None,
+) -> np.ndarray:
+    """Return the (samples x years x adorb_cost.ADORB_COLUMNS) array of the Variant's yearly ADORB costs.
+
+    This is the batched version of 'adorb_cost.calculate_annual_ADORB_costs_array', with one
+    value of each uncertain parameter per sample (see: 'sample_parameters'). The Variant's
+    quantities (see: 'calc_variant_quantities') are calculated only once, if not supplied.
+    """
+    n = _variant.analysis_duration
+    s = {name: np.asarray(values, dtype=float) for name, values in _samples.items()}
+    num_samples = len(s["price_of_carbon"])
+    logger.info(f"calculate_annual_ADORB_costs_batch({num_samples} samples, {n} years)")
+
+    annual_CO2, yearly_install_costs, yearly_embodied_kgCO2 = _quantities or calc_variant_quantities(_variant)
+
+    pv_energy = _present_value_factors(n, s["energy_discount_rate"])
+    pv_operational_CO2 = _present_value_factors(n, s["operational_CO2_discount_rate"])
+    pv_embodied_CO2 = _present_value_factors(n, s["embodied_CO2_discount_rate"])
+
+    annual_cost_electric = (
+        _variant.total_purchased_electricity_kwh * s["electric_purchase_price_per_kwh"]
+        - _variant.total_sold_electricity_kwh * s["electric_sale_price_per_kwh"]
+        + s["electric_annual_base_price"]
+    )
+    annual_cost_gas = (
+        _variant.total_purchased_gas_kwh * s["gas_purchase_price_per_kwh"] + s["gas_annual_base_price"]
+        if _variant.gas.used
+        else np.zeros(num_samples)
+    )
+
+    years = np.arange(1, n + 1)
+    num_years_to_transition = s["usa_num_years_to_transition"][:, None]
+    transition_cost_factors = np.where(
+        years[None, :] > num_years_to_transition,
+        0.0,
+        s["usa_national_transition_cost"][:, None]
+        / (s["nameplate_capacity_increase_GW"][:, None] * 1e9)
+        / num_years_to_transition,
+    )
+
+    price_of_carbon = s["price_of_carbon"][:, None]
+    yearly_ = np.empty((num_samples, n, len(adorb_cost.ADORB_COLUMNS)))
+    yearly_[:, :, 0] = (annual_cost_electric + annual_cost_gas)[:, None] / pv_energy
+    yearly_[:, :, 1] = annual_CO2[None, :] * price_of_carbon / pv_operational_CO2
+    yearly_[:, :, 2] = yearly_install_costs[None, :] / pv_energy
+    yearly_[:, :, 3] = (
+        adorb_cost.EMBODIED_CO2_FACTOR * yearly_embodied_kgCO2[None, :] * price_of_carbon / pv_embodied_CO2
+    )
+    yearly_[:, :, 4] = transition_cost_factors * _variant.peak_electric_usage_W / pv_energy
+    return yearly_
+
+
+# ---------------------------------------------------------------------------------------
+# -- Results
+
+
+@dataclass(frozen=True)
+class MonteCarloResult:
+    """The sampled parameters, and the resulting (samples x years x adorb_cost.ADORB_COLUMNS) yearly costs."""
+
+    samples: dict[str, np.ndarray]
+    yearly_costs: np.ndarray
+
+    def __len__(self) -> int:
+        return self.yearly_costs.shape[0]
+
+    @property
+    def cumulative_costs(self) -> np.ndarray:
+        """The (samples x years x columns) running total of each column's yearly costs."""
+        return np.cumsum(self.yearly_costs, axis=1)
+
+    @property
+    def total_costs(self) -> np.ndarray:
+        """The total ADORB cost (all years and columns) of each sample."""
+        return self.yearly_costs.sum(axis=(1, 2))
+
+    def yearly_bands(self, _percentiles: Sequence[float] = (10, 50, 90)) -> np.ndarray:
+        """Return the (percentiles x years x columns) percentile bands of the yearly costs."""
+        return np.percentile(self.yearly_costs, _percentiles, axis=0)
+
+    def cumulative_bands(self, _percentiles: Sequence[float] = (10, 50, 90)) -> np.ndarray:
+        """Return the (percentiles x years x columns) percentile bands of the cumulative costs."""
+        return np.percentile(self.cumulative_costs, _percentiles, axis=0)
+
+    def bands_to_DataFrame(
+        self, _percentiles: Sequence[float] = (10, 50, 90), _cumulative: bool = False
+    ) -> "pd.DataFrame":
+        """Return the percentile bands as a DataFrame, with a (percentile, year) row index. Note: pandas is only imported when called."""
+        import pandas as pd
+
+        bands = self.cumulative_bands(_percentiles) if _cumulative else self.yearly_bands(_percentiles)
+        index = pd.MultiIndex.from_product(
+            [[f"P{p:g}" for p in _percentiles], range(bands.shape[1])], names=["percentile", "year"]
+        )
+        return pd.DataFrame(bands.reshape(-1, bands.shape[2]), index=index, columns=list(adorb_cost.ADORB_COLUMNS))
+
+
+def run_monte_carlo(
+    _variant: PhAdorbVariant,
+    _distributions: Mapping[str, Distribution],
+    _num_samples: int = 10_000,
+    _seed: int | None = None,
+) -> MonteCarloResult:
+    """Return the MonteCarloResult for the Variant, with the parameters drawn from their Distributions.
+
+    Arguments:
+    ----------
+        * _variant (PhAdorbVariant): The (prepared) Variant to analyze.
+        * _distributions (Mapping[str, Distribution]): The Distribution of each uncertain parameter
+            (see: MONTE_CARLO_PARAMETERS). All other parameters use their normal (point) value.
+        * _num_samples (int): Default=10,000. The number of samples to draw.
+        * _seed (int | None): The random seed, for repeatable results.
+
+    Returns:
+    --------
+        * MonteCarloResult
+    """
+    samples = sample_parameters(_variant, _distributions, _num_samples, np.random.default_rng(_seed))
+    return MonteCarloResult(samples, calculate_annual_ADORB_costs_batch(_variant, samples))
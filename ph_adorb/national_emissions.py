@@ -8,6 +8,8 @@ from pathlib import Path
 
 from pydantic import BaseModel
 
+from ph_adorb.library import DEFAULT_LIBRARY_CACHE_DIR, load_json_library
+
 
 class PhAdorbNationalEmissions(BaseModel):
     """National Emissions Data."""
@@ -25,8 +27,11 @@ def write_national_emissions_to_json_file(_file_path: Path, _emissions: dict[str
         json.dump([_.dict() for _ in _emissions.values()], json_file, indent=4)
 
 
-def load_national_emissions_from_json_file(_file_path: Path) -> dict[str, PhAdorbNationalEmissions]:
-    """Load all of the National Emissions data from a JSON file."""
-    with open(_file_path, "r") as json_file:
-        all_emissions = (PhAdorbNationalEmissions(**item) for item in json.load(json_file))
-        return {_.country_name: _ for _ in all_emissions}
+def load_national_emissions_from_json_file(
+    _file_path: Path, _trusted: bool = False, _cache_dir: Path | None = DEFAULT_LIBRARY_CACHE_DIR
+) -> dict[str, PhAdorbNationalEmissions]:
+    """Load all of the National Emissions data from a JSON file.
+
+    Set '_trusted=True' to skip the validation of a published library and use its binary cache.
+    """
+    return load_json_library(_file_path, PhAdorbNationalEmissions, "country_name", _trusted, _cache_dir)
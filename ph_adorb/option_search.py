@@ -0,0 +1,328 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Search for the set of design options (CO2-Measures, Constructions, Equipment) with the lowest total ADORB cost.
+
+Every ADORB column is additive: the yearly costs of a Variant with a set of options is the base
+Variant's yearly costs plus the (discounted) yearly costs of each option on its own. So each
+option is scored only once, against the base Variant, and any set of options is then scored by
+simply adding up its options' scores. No option set is ever re-calculated from scratch.
+
+Options can be put in a 'group', of which at most one option may be chosen (ie: alternative wall
+assemblies), and the total first cost of the chosen options can be limited by a budget. Options which
+remove (replace) the same base item are never chosen together, as the item can only be removed once.
+
+Usage:
+    >>> search = OptionSearch(variant, options, _budget=100_000)
+    >>> best = search.search("branch_and_bound")
+    >>> best.option_names, best.total_ADORB
+"""
+
+import itertools
+import logging
+from dataclasses import dataclass, field
+from typing import Iterable, Literal, Sequence
+
+import numpy as np
+
+from ph_adorb import adorb_cost
+from ph_adorb.constructions import PhAdorbConstruction
+from ph_adorb.equipment import PhAdorbEquipment
+from ph_adorb.measures import PhAdorbCO2ReductionMeasure
+from ph_adorb.variant import PhAdorbVariant, calc_annual_total_gas_CO2
+from ph_adorb.variant_result import PhAdorbVariantResult
+
+logger = logging.getLogger(__name__)
+
+Item = PhAdorbCO2ReductionMeasure | PhAdorbConstruction | PhAdorbEquipment
+SearchStrategy = Literal["exhaustive", "greedy", "branch_and_bound"]
+
+
+class OptionSearchError(Exception):
+    def __init__(self, _msg: str) -> None:
+        self.message = f"OptionSearchError: {_msg}"
+        super().__init__(self.message)
+
+
+def item_first_cost(_item: Item) -> float:
+    """Return the (initial) install cost of a single CO2-Measure, Construction or Equipment item."""
+    if isinstance(_item, PhAdorbEquipment):
+        return _item.total_cost
+    return _item.cost
+
+
+def item_key(_item: Item) -> tuple[str, str]:
+    """Return the (type-name, name) key which identifies a CO2-Measure, Construction or Equipment item in a Variant."""
+    if isinstance(_item, PhAdorbConstruction):
+        return type(_item).__name__, _item.display_name
+    return type(_item).__name__, _item.name
+
+
+@dataclass(frozen=True)
+class DesignOption:
+    """A single design option: the items it adds to (or removes from) the Variant, and its effect on energy use.
+
+    Attributes:
+    -----------
+        * name (str): The unique name of the option.
+        * group (str | None): At most one option in each group may be chosen. None for a stand-alone option.
+        * added_items (tuple[Item, ...]): The CO2-Measures, Constructions and Equipment the option adds.
+        * removed_items (tuple[Item, ...]): Any of the base Variant's items which the option replaces.
+        * hourly_electricity_kwh_delta (np.ndarray | None): The change in the hourly purchased electricity.
+        * gas_kwh_delta (float): The change in the annual purchased gas.
+        * peak_electric_W_delta (float): The change in the peak electric demand.
+    """
+
+    name: str
+    group: str | None = None
+    added_items: tuple[Item, ...] = ()
+    removed_items: tuple[Item, ...] = ()
+    hourly_electricity_kwh_delta: np.ndarray | None = field(default=None, compare=False)
+    gas_kwh_delta: float = 0.0
+    peak_electric_W_delta: float = 0.0
+
+    @property
+    def first_cost(self) -> float:
+        """The total install cost of all the option's added items."""
+        return sum(item_first_cost(item) for item in self.added_items)
+
+
+@dataclass(frozen=True)
+class OptionSetResult:
+    """A scored set of options."""
+
+    option_names: tuple[str, ...]
+    total_ADORB: float
+    first_cost: float
+    yearly_costs: np.ndarray
+    num_evaluated: int = 0
+
+    @property
+    def cumulative_costs(self) -> np.ndarray:
+        """The (years x adorb_cost.ADORB_COLUMNS) running total of the yearly costs."""
+        return np.cumsum(self.yearly_costs, axis=0)
+
+
+class OptionSearch:
+    """Score design options against a base Variant, and search for the option set with the lowest total ADORB."""
+
+    def __init__(
+        self, _variant: PhAdorbVariant, _options: Sequence[DesignOption], _budget: float | None = None
+    ) -> None:
+        names = [option.name for option in _options]
+        if len(set(names)) != len(names):
+            raise OptionSearchError(f"The option names must be unique: {names}")
+
+        self.variant = _variant
+        self.options = tuple(_options)
+        self.budget = _budget
+        self.base = PhAdorbVariantResult.from_variant(_variant)
+
+        # -- The discount and grid-CO2 vectors used to score every option are only built once.
+        n = _variant.analysis_duration
+        self._pv_energy = adorb_cost.present_value_factors(n, adorb_cost.ENERGY_DISCOUNT_RATE)
+        self._pv_operational_CO2 = adorb_cost.present_value_factors(n, adorb_cost.OPERATIONAL_CO2_DISCOUNT_RATE)
+        self._hourly_CO2_factors = _variant.grid_region.get_CO2_factors_as_array()
+
+        logger.info(f"OptionSearch: scoring {len(self.options)} options")
+        self.option_yearly_costs = np.stack([self._option_yearly_costs(o) for o in self.options]) if _options else None
+        self.scores = self.option_yearly_costs.sum(axis=(1, 2)) if self.option_yearly_costs is not None else np.zeros(0)
+        self.first_costs = np.array([option.first_cost for option in self.options], dtype=float)
+        self.removed_keys = tuple(frozenset(item_key(item) for item in option.removed_items) for option in self.options)
+
+        # -- The search 'groups': each stand-alone option is a group of its own.
+        groups: dict[str, list[int]] = {}
+        for i, option in enumerate(self.options):
+            groups.setdefault(option.group if option.group is not None else f"__option__{option.name}", []).append(i)
+        self.groups: tuple[tuple[int, ...], ...] = tuple(tuple(g) for g in groups.values())
+
+    # -----------------------------------------------------------------------------------
+    # -- Scoring
+
+    def _option_yearly_costs(self, _option: DesignOption) -> np.ndarray:
+        """Return the (years x adorb_cost.ADORB_COLUMNS) change in the yearly ADORB costs for the single option."""
+        v = self.variant
+        n = v.analysis_duration
+        pv_energy, pv_operational_CO2 = self._pv_energy, self._pv_operational_CO2
+
+        yearly_ = np.zeros((n, len(adorb_cost.ADORB_COLUMNS)))
+        for item in _option.removed_items:
+            yearly_[:, 2:4] -= self.base.item_columns(item)
+        for item in _option.added_items:
+            yearly_[:, 2:4] += self.base.item_columns(item)
+
+        # -- Energy: Costs and CO2
+        electric_kwh_delta, electric_CO2_delta = 0.0, np.zeros(n)
+        if _option.hourly_electricity_kwh_delta is not None:
+            electric_kwh_delta = float(np.sum(_option.hourly_electricity_kwh_delta))
+            # -- The same calculation as 'calc_annual_hourly_electric_CO2', with the grid factors built only once.
+            hourly_MWH = np.asarray(_option.hourly_electricity_kwh_delta, dtype=float) * 0.001
+            num_hours = min(len(hourly_MWH), len(self._hourly_CO2_factors))
+            electric_CO2_delta = (hourly_MWH[:num_hours] @ self._hourly_CO2_factors[:num_hours])[:n]
+        gas_used = 1.0 if v.gas.used else 0.0
+        energy_cost_delta = (
+            electric_kwh_delta * v.electricity.purchase_price_per_kwh
+            + gas_used * _option.gas_kwh_delta * v.gas.purchase_price_per_kwh
+        )
+        CO2_delta = electric_CO2_delta + calc_annual_total_gas_CO2(_option.gas_kwh_delta, v.gas.used)
+        yearly_[:, 0] += energy_cost_delta / pv_energy
+        yearly_[:, 1] += CO2_delta * v.price_of_carbon / pv_operational_CO2
+
+        # -- Grid Transition
+        transition_cost_factors = np.where(
+            np.arange(1, n + 1) > adorb_cost.USA_NUM_YEARS_TO_TRANSITION,
+            0.0,
+            adorb_cost.USA_TRANSITION_COST_FACTOR / adorb_cost.USA_NUM_YEARS_TO_TRANSITION,
+        )
+        yearly_[:, 4] += transition_cost_factors * _option.peak_electric_W_delta / pv_energy
+        return yearly_
+
+    def _index(self, _name: str) -> int:
+        for i, option in enumerate(self.options):
+            if option.name == _name:
+                return i
+        raise KeyError(f"No option named: '{_name}'")
+
+    def _removes_items_once(self, _indices: Sequence[int]) -> bool:
+        """Return True if no two of the options remove the same base item (which would subtract its costs twice)."""
+        removed: set[tuple[str, str]] = set()
+        for i in _indices:
+            if not removed.isdisjoint(self.removed_keys[i]):
+                return False
+            removed |= self.removed_keys[i]
+        return True
+
+    def _is_feasible(self, _indices: Sequence[int]) -> bool:
+        if len({self._group_of(i) for i in _indices}) != len(_indices):
+            return False
+        if not self._removes_items_once(_indices):
+            return False
+        return self.budget is None or float(self.first_costs[list(_indices)].sum()) <= self.budget
+
+    def _group_of(self, _index: int) -> int:
+        for g, group in enumerate(self.groups):
+            if _index in group:
+                return g
+        raise IndexError(_index)
+
+    def _result(self, _indices: Iterable[int], _num_evaluated: int = 0) -> OptionSetResult:
+        indices = sorted(_indices)
+        yearly = self.base.yearly_costs.copy()
+        if indices:
+            yearly += self.option_yearly_costs[indices].sum(axis=0)
+        return OptionSetResult(
+            tuple(self.options[i].name for i in indices),
+            float(yearly.sum()),
+            float(self.first_costs[indices].sum()) if indices else 0.0,
+            yearly,
+            _num_evaluated,
+        )
+
+    def evaluate(self, _option_names: Iterable[str]) -> OptionSetResult:
+        """Return the scored result for a single set of options (by name)."""
+        option_names = list(_option_names)
+        indices = [self._index(name) for name in option_names]
+        if not self._is_feasible(indices):
+            raise OptionSearchError(
+                f"The option set {option_names} breaks a group, removes the same item twice, or breaks the budget."
+            )
+        return self._result(indices, 1)
+
+    # -----------------------------------------------------------------------------------
+    # -- Strategies
+
+    def exhaustive(self) -> OptionSetResult:
+        """Score every feasible option set (at most one option per group), and return the best one."""
+        best_score, best_indices, num_evaluated = 0.0, (), 0
+        for choice in itertools.product(*[(None, *group) for group in self.groups]):
+            indices = tuple(i for i in choice if i is not None)
+            if self.budget is not None and self.first_costs[list(indices)].sum() > self.budget:
+                continue
+            if not self._removes_items_once(indices):
+                continue
+            num_evaluated += 1
+            score = float(self.scores[list(indices)].sum())
+            if score < best_score:
+                best_score, best_indices = score, indices
+        return self._result(best_indices, num_evaluated)
+
+    def greedy(self) -> OptionSetResult:
+        """Repeatedly add the feasible option which lowers the total ADORB the most, until none lowers it."""
+        chosen: list[int] = []
+        used_groups: set[int] = set()
+        removed: frozenset[tuple[str, str]] = frozenset()
+        spent, num_evaluated = 0.0, 0
+        while True:
+            candidates = [
+                i
+                for g, group in enumerate(self.groups)
+                if g not in used_groups
+                for i in group
+                if self.scores[i] < 0
+                and (self.budget is None or spent + self.first_costs[i] <= self.budget)
+                and removed.isdisjoint(self.removed_keys[i])
+            ]
+            num_evaluated += len(candidates)
+            if not candidates:
+                break
+            best = min(candidates, key=lambda i: self.scores[i])
+            chosen.append(best)
+            used_groups.add(self._group_of(best))
+            removed |= self.removed_keys[best]
+            spent += self.first_costs[best]
+        return self._result(chosen, num_evaluated)
+
+    def branch_and_bound(self) -> OptionSetResult:
+        """Return the best option set, found by a depth-first search of the groups which skips any branch
+        whose lower bound (the best possible score of all the remaining groups) cannot beat the best set found.
+        """
+        # -- Search the groups with the largest possible improvement first, to find good sets early.
+        group_best = [min(0.0, float(self.scores[list(group)].min())) for group in self.groups]
+        order = sorted(range(len(self.groups)), key=lambda g: group_best[g])
+        remaining_bound = np.concatenate([np.cumsum([group_best[g] for g in order][::-1])[::-1], [0.0]])
+
+        # -- Start from the greedy solution, as a good initial upper bound.
+        greedy = self.greedy()
+        best_indices = [self._index(name) for name in greedy.option_names]
+        best_score = float(self.scores[best_indices].sum()) if best_indices else 0.0
+        num_evaluated = greedy.num_evaluated
+
+        stack: list[tuple[int, float, float, tuple[int, ...], frozenset]] = [(0, 0.0, 0.0, (), frozenset())]
+        while stack:
+            depth, score, spent, indices, removed = stack.pop()
+            num_evaluated += 1
+            if depth == len(order):
+                if score < best_score:
+                    best_score, best_indices = score, list(indices)
+                continue
+            if score + remaining_bound[depth] >= best_score:
+                continue  # -- This branch cannot beat the best set found so far.
+
+            stack.append((depth + 1, score, spent, indices, removed))  # -- Choose nothing from this group
+            for i in sorted(self.groups[order[depth]], key=lambda i: -self.scores[i]):
+                if self.budget is not None and spent + self.first_costs[i] > self.budget:
+                    continue
+                if not removed.isdisjoint(self.removed_keys[i]):
+                    continue
+                stack.append(
+                    (
+                        depth + 1,
+                        score + float(self.scores[i]),
+                        spent + self.first_costs[i],
+                        indices + (i,),
+                        removed | self.removed_keys[i],
+                    )
+                )
+        return self._result(best_indices, num_evaluated)
+
+    def search(self, _strategy: SearchStrategy = "branch_and_bound") -> OptionSetResult:
+        """Return the best option set found using the search strategy."""
+        strategies = {
+            "exhaustive": self.exhaustive,
+            "greedy": self.greedy,
+            "branch_and_bound": self.branch_and_bound,
+        }
+        if _strategy not in strategies:
+            raise OptionSearchError(f"Unknown strategy: '{_strategy}'. Expected one of: {list(strategies)}")
+        logger.info(f"OptionSearch.search('{_strategy}')")
+        return strategies[_strategy]()
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Explore the trade-off between the total (present-value) ADORB cost and the physical cumulative CO2 of many Variants.
+
+For each Variant, both metrics come from a single pass of the batched cost path (see:
+'monte_carlo.calculate_annual_ADORB_costs_batch'), with the Variant's point-value parameters:
+    * total_ADORB: The sum of the Variant's yearly ADORB costs ($, present value).
+    * cumulative_kgCO2: The Variant's operational (electric and gas) plus embodied kgCO2 over the
+        analysis duration. This is the physical CO2, not discounted and not priced.
+
+The non-dominated (Pareto) front, the Variants for which no other Variant is both cheaper and lower
+in CO2, is found in O(n log n) by sorting on cost and sweeping for new CO2 minimums.
+
+The front can be written to a CSV file for plotting with 'run/generate_ADORB_cost_graph.py'.
+"""
+
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable
+
+import numpy as np
+
+from ph_adorb import adorb_cost
+from ph_adorb.monte_carlo import calc_variant_quantities, calculate_annual_ADORB_costs_batch, point_parameters
+from ph_adorb.variant import PhAdorbVariant
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+def pareto_front(_costs: np.ndarray, _kgCO2: np.ndarray) -> np.ndarray:
+    """Return the indices of the non-dominated points (lowest cost and lowest CO2), in order of increasing cost.
+
+    Of several identical points, only the first is returned.
+    """
+    costs, kgCO2 = np.asarray(_costs, dtype=float), np.asarray(_kgCO2, dtype=float)
+    if not len(costs):
+        return np.zeros(0, dtype=int)
+
+    # -- Sorted by cost (then CO2), a point is on the front only if its CO2 is below that of every cheaper point.
+    order = np.lexsort((kgCO2, costs))
+    sorted_kgCO2 = kgCO2[order]
+    prior_min = np.minimum.accumulate(np.concatenate(([np.inf], sorted_kgCO2[:-1])))
+    return order[sorted_kgCO2 < prior_min]
+
+
+@dataclass(frozen=True)
+class ParetoResult:
+    """The total ADORB cost, cumulative kgCO2 and ADORB column totals of each Variant, and their Pareto front."""
+
+    names: tuple[str, ...]
+    total_ADORB: np.ndarray
+    cumulative_kgCO2: np.ndarray
+    column_totals: np.ndarray
+    front: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def front_names(self) -> list[str]:
+        """The names of the Variants on the front, in order of increasing cost."""
+        return [self.names[i] for i in self.front]
+
+    @property
+    def on_front(self) -> np.ndarray:
+        mask_ = np.zeros(len(self), dtype=bool)
+        mask_[self.front] = True
+        return mask_
+
+    def to_DataFrame(self) -> "pd.DataFrame":
+        """Return every Variant's metrics as a DataFrame. Note: pandas is only imported when called."""
+        import pandas as pd
+
+        return pd.DataFrame(
+            {
+                "total_ADORB": self.total_ADORB,
+                "cumulative_kgCO2": self.cumulative_kgCO2,
+                "on_front": self.on_front,
+            },
+            index=pd.Index(self.names, name="variant"),
+        )
+
+    def front_to_DataFrame(self) -> "pd.DataFrame":
+        """Return the Variants on the front (in order of increasing cost, and so of decreasing CO2) as a DataFrame.
+
+        The index is the Variant names. The columns are the same as the yearly ADORB cost DataFrame
+        (with each Variant's totals), followed by the Variant's 'cumulative_kgCO2'.
+        """
+        import pandas as pd
+
+        df_ = pd.DataFrame(
+            self.column_totals[self.front],
+            columns=list(adorb_cost.ADORB_COLUMNS),
+            index=pd.Index(self.front_names, name="variant"),
+        )
+        df_["cumulative_kgCO2"] = self.cumulative_kgCO2[self.front]
+        return df_
+
+    def write_front_csv(self, _file_path: Path) -> None:
+        """Write the front to a CSV file (indexed by Variant name), for 'run/generate_ADORB_cost_graph.py'."""
+        logger.info(f"Writing the Pareto front ({len(self.front)} Variants) to: {_file_path}")
+        Path(_file_path).parent.mkdir(parents=True, exist_ok=True)
+        self.front_to_DataFrame().to_csv(_file_path)
+
+
+def calc_variant_total_ADORB_and_kgCO2(_variant: PhAdorbVariant) -> tuple[np.ndarray, float]:
+    """Return the Variant's ADORB column totals, and its cumulative (operational plus embodied) kgCO2."""
+    quantities = calc_variant_quantities(_variant)
+    yearly_costs = calculate_annual_ADORB_costs_batch(_variant, point_parameters(_variant), quantities)[0]
+    return yearly_costs.sum(axis=0), float(quantities.operational_kgCO2.sum() + quantities.embodied_kgCO2.sum())
+
+
+def explore_pareto_front(_variants: Iterable[PhAdorbVariant]) -> ParetoResult:
+    """Return the ParetoResult of the total ADORB cost versus the cumulative kgCO2 of the Variants.
+
+    Arguments:
+    ----------
+        * _variants (Iterable[PhAdorbVariant]): The (prepared) Variants to compare.
+
+    Returns:
+    --------
+        * ParetoResult
+    """
+    names, column_totals, kgCO2 = [], [], []
+    for variant in _variants:
+        totals, kg = calc_variant_total_ADORB_and_kgCO2(variant)
+        names.append(variant.name)
+        column_totals.append(totals)
+        kgCO2.append(kg)
+    logger.info(f"explore_pareto_front({len(names)} Variants)")
+
+    column_totals_ = np.array(column_totals, dtype=float).reshape(len(names), len(adorb_cost.ADORB_COLUMNS))
+    total_ADORB = column_totals_.sum(axis=1)
+    cumulative_kgCO2 = np.array(kgCO2, dtype=float)
+    return ParetoResult(
+        tuple(names), total_ADORB, cumulative_kgCO2, column_totals_, pareto_front(total_ADORB, cumulative_kgCO2)
+    )
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Vectorized lifecycle replacement-schedule for Constructions, Equipment and CO2-Measures.
+
+Each item is (re)installed in year-0 and then again at the end of each of its lifetimes, up to
+and including the final year of the analysis. Rather than looping over every item and every
+replacement year, the whole schedule is built at once from arrays of the item costs and lifetimes
+and stored in sparse 'COO' form: one entry (item-index, year) per replacement.
+"""
+
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+from ph_adorb.yearly_values import YearlyCost, YearlyKgCO2
+
+
+def sum_by_year(_years: np.ndarray, _values: np.ndarray, _analysis_duration: int) -> np.ndarray:
+    """Return the total of the values for each year of the analysis duration (values in other years are ignored)."""
+    in_analysis = (_years >= 0) & (_years < _analysis_duration)
+    return np.bincount(_years[in_analysis], weights=_values[in_analysis], minlength=_analysis_duration)[
+        :_analysis_duration
+    ]
+
+
+@dataclass(frozen=True)
+class ReplacementSchedule:
+    """A sparse (items x years) schedule of replacements, with the per-replacement costs and CO2."""
+
+    names: tuple[str, ...]
+    analysis_duration: int
+    item_index: np.ndarray
+    year: np.ndarray
+    install_cost: np.ndarray
+    embodied_kgCO2: np.ndarray
+    embodied_CO2_cost: np.ndarray
+
+    def __len__(self) -> int:
+        """The total number of replacements in the schedule."""
+        return len(self.item_index)
+
+    def to_matrix(self) -> np.ndarray:
+        """Return the dense (items x years) array with the number of installs of each item in each year."""
+        matrix_ = np.zeros((len(self.names), self.analysis_duration + 1), dtype=int)
+        in_analysis = (self.year >= 0) & (self.year <= self.analysis_duration)
+        np.add.at(matrix_, (self.item_index[in_analysis], self.year[in_analysis]), 1)
+        return matrix_
+
+    @property
+    def yearly_install_costs(self) -> np.ndarray:
+        """The total install-cost (labor + material) for each year of the analysis duration."""
+        return sum_by_year(self.year, self.install_cost, self.analysis_duration)
+
+    @property
+    def yearly_embodied_kgCO2(self) -> np.ndarray:
+        """The total embodied kgCO2 for each year of the analysis duration."""
+        return sum_by_year(self.year, self.embodied_kgCO2, self.analysis_duration)
+
+    @property
+    def yearly_embodied_CO2_costs(self) -> np.ndarray:
+        """The total embodied-CO2 cost for each year of the analysis duration."""
+        return sum_by_year(self.year, self.embodied_CO2_cost, self.analysis_duration)
+
+    def _descriptions(self) -> list[str]:
+        return [self.names[i] for i in self.item_index]
+
+    def to_YearlyCosts(self) -> list[YearlyCost]:
+        """Return the install-costs as a list of YearlyCost objects (for the preview tables)."""
+        return YearlyCost.from_arrays(self.install_cost.tolist(), self.year.tolist(), self._descriptions())
+
+    def to_YearlyKgCO2s(self) -> list[YearlyKgCO2]:
+        """Return the embodied kgCO2 as a list of YearlyKgCO2 objects (for the preview tables)."""
+        return YearlyKgCO2.from_arrays(self.embodied_kgCO2.tolist(), self.year.tolist(), self._descriptions())
+
+    def to_YearlyEmbodiedCO2Costs(self) -> list[YearlyCost]:
+        """Return the embodied-CO2 costs as a list of YearlyCost objects (for the preview tables)."""
+        return YearlyCost.from_arrays(self.embodied_CO2_cost.tolist(), self.year.tolist(), self._descriptions())
+
+
+def replacement_years(_lifetime_years: np.ndarray, _analysis_duration: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return the (item-index, year) arrays for every install of every item.
+
+    An item is installed in year-0 and then every 'lifetime' years up to and including the
+    final year of the analysis. Items with a lifetime of 0 are only installed once (year-0).
+
+    Arguments:
+    ----------
+        * _lifetime_years (np.ndarray): The lifetime (years) of each item.
+        * _analysis_duration (int): The number of years in the analysis.
+
+    Returns:
+    --------
+        * tuple[np.ndarray, np.ndarray]: The item-index and the year of each install.
+    """
+    lifetimes = np.asarray(_lifetime_years, dtype=int)
+    steps = np.where(lifetimes == 0, _analysis_duration + 1, lifetimes)
+    counts = np.where(steps > 0, _analysis_duration // np.maximum(steps, 1) + 1, 0)
+
+    item_index = np.repeat(np.arange(len(lifetimes)), counts)
+    first_entry = np.repeat(np.cumsum(counts) - counts, counts)
+    year = (np.arange(len(item_index)) - first_entry) * steps[item_index]
+    return item_index, year
+
+
+def build_replacement_schedule(
+    _names: Sequence[str],
+    _install_costs: np.ndarray,
+    _material_fractions: np.ndarray,
+    _lifetime_years: np.ndarray,
+    _analysis_duration: int,
+    _kg_CO2_per_USD: float,
+    _USD_per_kgCO2: float,
+) -> ReplacementSchedule:
+    """Return the ReplacementSchedule for a set of items which are replaced at the end of their lifetime.
+
+    Arguments:
+    ----------
+        * _names (Sequence[str]): The name of each item.
+        * _install_costs (np.ndarray): The install cost (labor + material) of each item.
+        * _material_fractions (np.ndarray): The fraction of each item's cost which is material (not labor).
+        * _lifetime_years (np.ndarray): The lifetime (years) of each item.
+        * _analysis_duration (int): The number of years in the analysis.
+        * _kg_CO2_per_USD (float): The embodied kgCO2 per dollar of material cost.
+        * _USD_per_kgCO2 (float): The price of carbon.
+
+    Returns:
+    --------
+        * ReplacementSchedule
+    """
+    install_costs = np.asarray(_install_costs, dtype=float)
+    item_embodied_kgCO2 = install_costs * np.asarray(_material_fractions, dtype=float) * _kg_CO2_per_USD
+
+    item_index, year = replacement_years(_lifetime_years, _analysis_duration)
+    embodied_kgCO2 = item_embodied_kgCO2[item_index]
+    return ReplacementSchedule(
+        names=tuple(_names),
+        analysis_duration=_analysis_duration,
+        item_index=item_index,
+        year=year,
+        install_cost=install_costs[item_index],
+        embodied_kgCO2=embodied_kgCO2,
+        embodied_CO2_cost=embodied_kgCO2 * _USD_per_kgCO2,
+    )
+
+
+def build_one_time_schedule(
+    _names: Sequence[str],
+    _install_costs: np.ndarray,
+    _years: np.ndarray,
+    _analysis_duration: int,
+    _kg_CO2_per_USD: float,
+    _USD_per_kgCO2: float,
+) -> ReplacementSchedule:
+    """Return the ReplacementSchedule for a set of items which are each installed only once, in a given year.
+
+    Note: the full cost (labor + material) of a one-time item is counted for its embodied kgCO2.
+    """
+    install_costs = np.asarray(_install_costs, dtype=float)
+    embodied_kgCO2 = install_costs * _kg_CO2_per_USD
+    return ReplacementSchedule(
+        names=tuple(_names),
+        analysis_duration=_analysis_duration,
+        item_index=np.arange(len(install_costs)),
+        year=np.asarray(_years, dtype=int),
+        install_cost=install_costs,
+        embodied_kgCO2=embodied_kgCO2,
+        embodied_CO2_cost=embodied_kgCO2 * _USD_per_kgCO2,
+    )
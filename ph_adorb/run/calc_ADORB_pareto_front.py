@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""A script to find the Pareto front of total ADORB cost versus cumulative CO2, from many prepared PH-ADORB-Variant files.
+
+The Variant files are written by 'calc_HBJSON_ADORB_costs.py' (when given its optional Variant path)
+or by 'variant_io.save_variant'. The front CSV can be plotted with 'generate_ADORB_cost_graph.py'.
+
+This script is called from the command line with the following arguments:
+    * [1] (str): The path to the output CSV file with every Variant's metrics.
+    * [2] (str): The path to the output Pareto front CSV file (for 'generate_ADORB_cost_graph.py').
+    * [3:] (str): The paths to the prepared Variant (.npz) files to read in.
+"""
+
+import sys
+from pathlib import Path
+
+from ph_adorb.pareto import explore_pareto_front
+from ph_adorb.variant_io import load_variant
+
+if __name__ == "__main__":
+    assert len(sys.argv) >= 4, "Error: Incorrect number of arguments."
+    metrics_csv, front_csv = Path(sys.argv[1]), Path(sys.argv[2])
+    variant_files = [Path(arg) for arg in sys.argv[3:]]
+
+    print(f"\t>> Loading {len(variant_files)} prepared Variants.")
+    grid_regions = {}
+    variants = []
+    for variant_file in variant_files:
+        variant = load_variant(variant_file, grid_regions)
+        grid_regions[variant.grid_region.region_code] = variant.grid_region
+        variants.append(variant)
+
+    result = explore_pareto_front(variants)
+
+    metrics_csv.parent.mkdir(parents=True, exist_ok=True)
+    result.to_DataFrame().to_csv(metrics_csv)
+    result.write_front_csv(front_csv)
+    print(f"\t>> The Pareto front: {result.front_names}")
+    print("\t>> Done calculating the Pareto front. The CSV files have been saved.")
@@ -9,6 +9,9 @@ This script is called from the command line with the following arguments:
     * [3] (str): The path to the output Yearly CSV file.
     * [4] (str): The path to the output Cumulative CSV file.
     * [5] (str): The path to the output folder for the preview tables.
+    * [6] (str, optional): The path to save the prepared Variant (.npz) file to. Later cost studies
+        can re-use it without re-reading the HBJSON and SQL files (see: 'calc_prepared_variant_ADORB_costs.py').
+        The Variant is only saved if this path is given.
 """
 
 import os
@@ -19,8 +22,9 @@ from collections import namedtuple
 import logging
 from logging import getLogger
 
-from ph_adorb.from_HBJSON import create_variant, read_HBJSON_file
+from ph_adorb.from_HBJSON import create_variant, read_HBJSON_file, validate_HBJSON
 from ph_adorb.variant import calc_variant_yearly_ADORB_costs, calc_variant_cumulative_ADORB_costs
+from ph_adorb.variant_io import save_variant
 
 
 # Function to setup logger to output to a log file
@@ -37,7 +41,7 @@ class InputFileError(Exception):
         super().__init__(self.msg)
 
 
-Filepaths = namedtuple("Filepaths", ["hbjson", "sql", "annual_csv", "cumulative_csv", "tables"])
+Filepaths = namedtuple("Filepaths", ["hbjson", "sql", "annual_csv", "cumulative_csv", "tables", "variant"])
 
 
 def _remove_folder_and_contents(_folder: Path) -> None:
@@ -58,7 +62,7 @@ def resolve_paths(_args: list[str]) -> Filepaths:
         * Filepaths
     """
 
-    assert len(_args) == 6, "Error: Incorrect number of arguments."
+    assert len(_args) in (6, 7), "Error: Incorrect number of arguments."
 
     # -----------------------------------------------------------------------------------
     # -- The HBJSON input file.
@@ -108,12 +112,17 @@ def resolve_paths(_args: list[str]) -> Filepaths:
     print(f"\t>> Creating the directory: {target_tables_dir}")
     os.mkdir(target_tables_dir)
 
+    # -----------------------------------------------------------------------------------
+    # -- The (optional) prepared-Variant output file:
+    target_variant_filepath = Path(_args[6]) if len(_args) == 7 else None
+
     return Filepaths(
         hbjson_source_filepath,
         results_sql_file,
         target_annual_csv_filepath,
         target_cumulative_csv_filepath,
         target_tables_dir,
+        target_variant_filepath,
     )
 
 
@@ -146,6 +155,13 @@ if __name__ == "__main__":
     print(f"\t>> Loading the Honeybee-Model from the HBJSON file: {file_paths.hbjson}")
     hb_json_dict = read_HBJSON_file.read_hb_json_from_file(file_paths.hbjson)
 
+    # -- Check the .revive properties before the (slow) Honeybee-Model re-build
+    # -------------------------------------------------------------------------
+    validation_report = validate_HBJSON.validate_hbjson_dict(hb_json_dict)
+    for warning in validation_report.warnings:
+        logger.warning(warning)
+    validation_report.raise_for_errors()
+
     # -- Re-Build the Honeybee-Model from the HBJSON-Dict
     # -------------------------------------------------------------------------
     hb_model = read_HBJSON_file.convert_hbjson_dict_to_hb_model(hb_json_dict)
@@ -154,6 +170,15 @@ if __name__ == "__main__":
     # --- Generate the PH-ADORB-Variant from the Honeybee-Model
     revive_variant = create_variant.get_PhAdorbVariant_from_hb_model(hb_model, file_paths.sql)
 
+    # --- Save the prepared PH-ADORB-Variant (only if asked), with its Grid-Region by reference
+    if file_paths.variant is not None:
+        print(f"\t>> Saving the prepared Variant to: '{file_paths.variant}'")
+        save_variant(
+            file_paths.variant,
+            revive_variant,
+            _grid_region_file=Path(hb_model.properties.revive.grid_region.filepath),
+        )
+
     # --- Get the ADORB Costs for the PH-ADORB-Variant
     # -------------------------------------------------------------------------
     variant_yearly_ADORB_df = calc_variant_yearly_ADORB_costs(revive_variant, file_paths.tables)
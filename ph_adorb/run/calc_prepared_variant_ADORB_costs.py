@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""A script to calculate ADORB Costs from a prepared (saved) PH-ADORB-Variant file, and outputs to CSV files.
+
+The Variant file is written by 'calc_HBJSON_ADORB_costs.py' (when given its optional Variant path)
+or by 'variant_io.save_variant', so this skips reading the HBJSON and EnergyPlus SQL files entirely.
+
+This script is called from the command line with the following arguments:
+    * [1] (str): The path to the prepared Variant (.npz) file to read in.
+    * [2] (str): The path to the output Yearly CSV file.
+    * [3] (str): The path to the output Cumulative CSV file.
+"""
+
+import sys
+from pathlib import Path
+
+from ph_adorb.variant import calc_variant_cumulative_ADORB_costs, calc_variant_yearly_ADORB_costs
+from ph_adorb.variant_io import load_variant
+
+if __name__ == "__main__":
+    assert len(sys.argv) == 4, "Error: Incorrect number of arguments."
+    variant_file, annual_csv, cumulative_csv = Path(sys.argv[1]), Path(sys.argv[2]), Path(sys.argv[3])
+
+    print(f"\t>> Loading the prepared Variant from: '{variant_file}'")
+    revive_variant = load_variant(variant_file)
+
+    variant_yearly_ADORB_df = calc_variant_yearly_ADORB_costs(revive_variant)
+    variant_cumulative_ADORB_df = calc_variant_cumulative_ADORB_costs(variant_yearly_ADORB_df)
+
+    annual_csv.parent.mkdir(parents=True, exist_ok=True)
+    cumulative_csv.parent.mkdir(parents=True, exist_ok=True)
+    variant_yearly_ADORB_df.to_csv(annual_csv)
+    variant_cumulative_ADORB_df.to_csv(cumulative_csv)
+    print("\t>> Done calculating the ADORB Costs. The CSV files have been saved.")
@@ -6,6 +6,11 @@
 This script is called from the command line with the following arguments:
     * [1] (str): The path to the CSV file to read in.
     * [2] (str): The path to the folder to save the graphs to.
+
+The CSV's first column is used as the x-axis (the index): the year, for the yearly / cumulative
+ADORB cost CSVs, or the Variant name, for the Pareto front CSV ('pareto.ParetoResult.write_front_csv').
+All the other columns are stacked, except a 'cumulative_kgCO2' column (the front CSV), which is
+plotted as a separate line on a second y-axis.
 """
 
 from collections import namedtuple
@@ -80,11 +85,12 @@ if __name__ == "__main__":
     print(f"\t>> Source CSV File: '{file_paths.csv}'")
     print(f"\t>> Target Folder: '{file_paths.output}'")
 
-    df = pd.read_csv(file_paths.csv)
+    df = pd.read_csv(file_paths.csv, index_col=0)
+    kgCO2 = df.pop("cumulative_kgCO2") if "cumulative_kgCO2" in df.columns else None
 
     # -------------------------------------------------------------------------
     fig = go.Figure()
-    fig.update_layout(title="test")
+    fig.update_layout(title="test", xaxis_title=df.index.name)
     # Add each category as a trace
     for column in df.columns:
         fig.add_trace(
@@ -92,6 +98,9 @@ if __name__ == "__main__":
                 x=df.index, y=df[column], mode="lines", stackgroup="one", name=column  # Creates stacking behavior
             )
         )
+    if kgCO2 is not None:
+        fig.add_trace(go.Scatter(x=kgCO2.index, y=kgCO2, mode="lines+markers", name=kgCO2.name, yaxis="y2"))
+        fig.update_layout(yaxis2=dict(title=kgCO2.name, overlaying="y", side="right"))
 
     with open(file_paths.output, "w") as f:
         f.write(pio.to_html(fig, full_html=False, include_plotlyjs="cdn"))
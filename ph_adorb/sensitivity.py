@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Exact (analytic) sensitivities of a Variant's ADORB costs, and tornado charts.
+
+Every ADORB column is linear in the fuel prices, the fuel quantities, the price of carbon, the
+embodied kgCO2-per-USD, the peak electric demand and each item's cost. So the partial derivative
+of each yearly column with respect to each of these inputs can be found exactly, in a single pass
+over the present-value (discount) vectors, without re-running the calculation.
+
+Usage:
+    >>> sensitivities = calc_variant_ADORB_sensitivities(variant)
+    >>> sensitivities.total("price_of_carbon")  # -- d(Total ADORB) / d(price_of_carbon)
+    >>> fig = plot_tornado(sensitivities.tornado(_relative_change=0.2))
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+
+from ph_adorb import adorb_cost
+from ph_adorb.replacement_schedule import ReplacementSchedule, build_one_time_schedule, build_replacement_schedule
+from ph_adorb.variant import (
+    PhAdorbVariant,
+    calc_annual_hourly_electric_CO2,
+    calc_annual_total_gas_CO2,
+    calc_variant_yearly_ADORB_costs_array,
+)
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+logger = logging.getLogger(__name__)
+
+# -- The column index of each ADORB column, for readability.
+_ENERGY, _OPERATIONAL_CO2, _MR, _EMBODIED_CO2, _TRANSITION = range(len(adorb_cost.ADORB_COLUMNS))
+
+
+class TornadoBar(NamedTuple):
+    """The change in the total ADORB cost for a low and high value of a single input."""
+
+    name: str
+    base_value: float
+    low_delta: float
+    high_delta: float
+
+    @property
+    def swing(self) -> float:
+        return abs(self.high_delta - self.low_delta)
+
+
+@dataclass(frozen=True)
+class ADORBSensitivities:
+    """The partial derivatives of the yearly ADORB costs with respect to each input.
+
+    Attributes:
+    -----------
+        * names (tuple[str, ...]): The name of each input. Items are named "<category>: <item-name>".
+        * base_values (np.ndarray): The Variant's value of each input (an item's value is its total cost).
+        * yearly (np.ndarray): The (inputs x years x adorb_cost.ADORB_COLUMNS) partial derivatives.
+        * base_total (float): The Variant's total ADORB cost.
+    """
+
+    names: tuple[str, ...]
+    base_values: np.ndarray
+    yearly: np.ndarray
+    base_total: float
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _index(self, _name: str) -> int:
+        try:
+            return self.names.index(_name)
+        except ValueError:
+            raise KeyError(f"No sensitivity for the input: '{_name}'. Expected one of: {list(self.names)}")
+
+    def yearly_for(self, _name: str) -> np.ndarray:
+        """Return the (years x adorb_cost.ADORB_COLUMNS) partial derivatives for a single input."""
+        return self.yearly[self._index(_name)]
+
+    @property
+    def totals(self) -> np.ndarray:
+        """The partial derivative of the total ADORB cost with respect to each input."""
+        return self.yearly.sum(axis=(1, 2))
+
+    def total(self, _name: str) -> float:
+        """Return the partial derivative of the total ADORB cost with respect to a single input."""
+        return float(self.totals[self._index(_name)])
+
+    def tornado(self, _relative_change: float = 0.1, _max_bars: int | None = None) -> list[TornadoBar]:
+        """Return the TornadoBars for a +/- relative change of every input, the largest swing first."""
+        deltas = self.totals * self.base_values * _relative_change
+        bars = [
+            TornadoBar(name, float(value), -float(delta), float(delta))
+            for name, value, delta in zip(self.names, self.base_values, deltas)
+        ]
+        bars.sort(key=lambda bar: bar.swing, reverse=True)
+        return bars[:_max_bars] if _max_bars else bars
+
+
+def _item_derivatives(
+    _category: str,
+    _unit_schedule: ReplacementSchedule,
+    _pv_energy: np.ndarray,
+    _pv_embodied_CO2: np.ndarray,
+    _CO2_cost_per_USD: float,
+) -> tuple[list[str], np.ndarray]:
+    """Return the item names and (items x years x columns) partial derivatives w.r.t. each item's total cost.
+
+    The '_unit_schedule' must be built with every item's cost, and the kgCO2/USD and price of carbon, set to 1.0.
+    """
+    n = _unit_schedule.analysis_duration
+    num_items = len(_unit_schedule.names)
+    in_analysis = (_unit_schedule.year >= 0) & (_unit_schedule.year < n)
+    flat_index = _unit_schedule.item_index[in_analysis] * n + _unit_schedule.year[in_analysis]
+
+    def _by_item_and_year(_values: np.ndarray) -> np.ndarray:
+        return np.bincount(flat_index, weights=_values[in_analysis], minlength=num_items * n).reshape(num_items, n)
+
+    derivatives_ = np.zeros((num_items, n, len(adorb_cost.ADORB_COLUMNS)))
+    derivatives_[:, :, _MR] = _by_item_and_year(_unit_schedule.install_cost) / _pv_energy
+    derivatives_[:, :, _EMBODIED_CO2] = (
+        adorb_cost.EMBODIED_CO2_FACTOR
+        * _CO2_cost_per_USD
+        * _by_item_and_year(_unit_schedule.embodied_kgCO2)
+        / _pv_embodied_CO2
+    )
+    return [f"{_category}: {name}" for name in _unit_schedule.names], derivatives_
+
+
+def _unit_cost_schedules(_variant: PhAdorbVariant) -> dict[str, tuple[np.ndarray, ReplacementSchedule]]:
+    """Return the {category: (item-costs, schedule)} of the Variant's items.
+
+    Each schedule is built with a cost of 1.0 for every item, and a kgCO2/USD and price of carbon
+    of 1.0, so its 'embodied_kgCO2' is the material fraction of each (unit) install.
+    """
+    n = _variant.analysis_duration
+
+    measures = _variant.all_carbon_measures.values()
+    constructions = _variant.construction_collection.to_arrays()
+    equipment = _variant.equipment_collection.to_arrays()
+    return {
+        "CO2 Measures": (
+            np.array([m.cost for m in measures], dtype=float),
+            build_one_time_schedule(
+                [m.name for m in measures],
+                np.ones(len(measures)),
+                np.array([m.year for m in measures], dtype=int),
+                n,
+                1.0,
+                1.0,
+            ),
+        ),
+        "Constructions": (
+            constructions.cost,
+            build_replacement_schedule(
+                constructions.names,
+                np.ones(len(constructions)),
+                constructions.material_fraction,
+                constructions.lifetime_years,
+                n,
+                1.0,
+                1.0,
+            ),
+        ),
+        "Equipment": (
+            equipment.total_cost,
+            build_replacement_schedule(
+                equipment.names,
+                np.ones(len(equipment)),
+                equipment.material_fraction,
+                equipment.lifetime_years,
+                n,
+                1.0,
+                1.0,
+            ),
+        ),
+    }
+
+
+def calc_variant_ADORB_sensitivities(_variant: PhAdorbVariant) -> ADORBSensitivities:
+    """Return the exact partial derivatives of the Variant's yearly ADORB costs with respect to each input.
+
+    The inputs are the fuel prices and quantities, the price of carbon, the national kgCO2-per-USD,
+    the peak electric demand, and the total cost of each CO2-Measure, Construction and Equipment item.
+
+    Arguments:
+    ----------
+        * _variant (PhAdorbVariant): The Variant to analyze.
+
+    Returns:
+    --------
+        * ADORBSensitivities
+    """
+    logger.info("calc_variant_ADORB_sensitivities()")
+
+    n = _variant.analysis_duration
+    num_columns = len(adorb_cost.ADORB_COLUMNS)
+    pv_energy = adorb_cost.present_value_factors(n, adorb_cost.ENERGY_DISCOUNT_RATE)
+    pv_operational_CO2 = adorb_cost.present_value_factors(n, adorb_cost.OPERATIONAL_CO2_DISCOUNT_RATE)
+    pv_embodied_CO2 = adorb_cost.present_value_factors(n, adorb_cost.EMBODIED_CO2_DISCOUNT_RATE)
+    transition_cost_factors = np.where(
+        np.arange(1, n + 1) > adorb_cost.USA_NUM_YEARS_TO_TRANSITION,
+        0.0,
+        adorb_cost.USA_TRANSITION_COST_FACTOR / adorb_cost.USA_NUM_YEARS_TO_TRANSITION,
+    )
+
+    electricity, gas = _variant.electricity, _variant.gas
+    price_of_carbon = _variant.price_of_carbon
+    kg_CO2_per_USD = _variant.national_emissions.kg_CO2_per_USD
+    gas_used = 1.0 if gas.used else 0.0
+    annual_CO2 = np.asarray(
+        calc_annual_hourly_electric_CO2(_variant.hourly_purchased_electricity_kwh, _variant.grid_region), dtype=float
+    )[:n] + calc_annual_total_gas_CO2(_variant.total_purchased_gas_kwh, gas.used)
+
+    # -- The yearly embodied 'material dollars' (the embodied kgCO2 for 1 kgCO2/USD)
+    unit_cost_schedules = _unit_cost_schedules(_variant)
+    yearly_material_USD = np.zeros(n)
+    for costs, unit_schedule in unit_cost_schedules.values():
+        in_analysis = (unit_schedule.year >= 0) & (unit_schedule.year < n)
+        yearly_material_USD += np.bincount(
+            unit_schedule.year[in_analysis],
+            weights=(costs[unit_schedule.item_index] * unit_schedule.embodied_kgCO2)[in_analysis],
+            minlength=n,
+        )[:n]
+    embodied_CO2_per_unit = adorb_cost.EMBODIED_CO2_FACTOR * yearly_material_USD / pv_embodied_CO2
+
+    # -- The scalar inputs: {name: (value, [(column, yearly-derivative), ...])}
+    scalars: dict[str, tuple[float, list[tuple[int, np.ndarray]]]] = {
+        "electric_purchase_price_per_kwh": (
+            electricity.purchase_price_per_kwh,
+            [(_ENERGY, _variant.total_purchased_electricity_kwh / pv_energy)],
+        ),
+        "electric_sale_price_per_kwh": (
+            electricity.sale_price_per_kwh,
+            [(_ENERGY, -_variant.total_sold_electricity_kwh / pv_energy)],
+        ),
+        "electric_annual_base_price": (electricity.annual_base_price, [(_ENERGY, 1.0 / pv_energy)]),
+        "total_sold_electricity_kwh": (
+            _variant.total_sold_electricity_kwh,
+            [(_ENERGY, -electricity.sale_price_per_kwh / pv_energy)],
+        ),
+        "gas_purchase_price_per_kwh": (
+            gas.purchase_price_per_kwh,
+            [(_ENERGY, gas_used * _variant.total_purchased_gas_kwh / pv_energy)],
+        ),
+        "gas_annual_base_price": (gas.annual_base_price, [(_ENERGY, gas_used / pv_energy)]),
+        "total_purchased_gas_kwh": (
+            _variant.total_purchased_gas_kwh,
+            [
+                (_ENERGY, gas_used * gas.purchase_price_per_kwh / pv_energy),
+                (_OPERATIONAL_CO2, calc_annual_total_gas_CO2(1.0, gas.used) * price_of_carbon / pv_operational_CO2),
+            ],
+        ),
+        "price_of_carbon": (
+            price_of_carbon,
+            [
+                (_OPERATIONAL_CO2, annual_CO2 / pv_operational_CO2),
+                (_EMBODIED_CO2, kg_CO2_per_USD * embodied_CO2_per_unit),
+            ],
+        ),
+        "kg_CO2_per_USD": (kg_CO2_per_USD, [(_EMBODIED_CO2, price_of_carbon * embodied_CO2_per_unit)]),
+        "peak_electric_usage_W": (
+            _variant.peak_electric_usage_W,
+            [(_TRANSITION, transition_cost_factors / pv_energy)],
+        ),
+    }
+
+    names: list[str] = []
+    base_values: list[float] = []
+    yearly: list[np.ndarray] = []
+    for name, (value, columns) in scalars.items():
+        derivatives = np.zeros((1, n, num_columns))
+        for column, derivative in columns:
+            derivatives[0, :, column] += derivative
+        names.append(name)
+        base_values.append(value)
+        yearly.append(derivatives)
+
+    # -- The items: one (unit-cost) pass over each category's replacement schedule
+    for category, (costs, unit_schedule) in unit_cost_schedules.items():
+        item_names, item_derivatives = _item_derivatives(
+            category, unit_schedule, pv_energy, pv_embodied_CO2, kg_CO2_per_USD * price_of_carbon
+        )
+        names.extend(item_names)
+        base_values.extend(costs.tolist())
+        yearly.append(item_derivatives)
+
+    return ADORBSensitivities(
+        tuple(names),
+        np.asarray(base_values, dtype=float),
+        np.concatenate(yearly, axis=0),
+        float(calc_variant_yearly_ADORB_costs_array(_variant).sum()),
+    )
+
+
+def plot_tornado(_bars: list[TornadoBar], _title: str = "ADORB Sensitivity") -> "go.Figure":
+    """Return a plotly tornado chart of the change in total ADORB cost for each input. Note: plotly is only imported when called."""
+    import plotly.graph_objects as go
+
+    bars = list(reversed(_bars))  # -- Largest swing at the top
+    names = [bar.name for bar in bars]
+    fig = go.Figure()
+    fig.add_trace(go.Bar(y=names, x=[bar.low_delta for bar in bars], orientation="h", name="Low"))
+    fig.add_trace(go.Bar(y=names, x=[bar.high_delta for bar in bars], orientation="h", name="High"))
+    fig.update_layout(title=_title, barmode="overlay", xaxis_title="Change in Total ADORB Cost ($)")
+    return fig
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""A small memoized graph of named calculation stages.
+
+Each stage names its inputs: either one of the graph's external inputs, or the output of another
+stage. When the graph is run, each stage is only re-computed if the 'fingerprint' of its inputs
+has changed since it was last run. Upstream stages are identified by their own fingerprint, so
+changing a single input only re-runs the stages downstream of it. The time taken by each stage
+(or the fact that it was cached) is recorded for every run.
+"""
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Hashable, Iterable
+
+import numpy as np
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+
+class StageGraphError(Exception):
+    def __init__(self, _msg: str) -> None:
+        self.message = f"StageGraphError: {_msg}"
+        super().__init__(self.message)
+
+
+@dataclass(frozen=True)
+class Stage:
+    """A single named calculation stage: func(*inputs)."""
+
+    name: str
+    inputs: tuple[str, ...]
+    func: Callable[..., Any]
+
+
+@dataclass(frozen=True)
+class StageRun:
+    """The record of a single stage in a single run of the graph."""
+
+    name: str
+    seconds: float
+    cached: bool
+
+
+@dataclass
+class _StageMemo:
+    """The most recent results of a stage, keyed by their input fingerprint."""
+
+    max_size: int
+    results: OrderedDict = field(default_factory=OrderedDict)
+
+    def get(self, _fingerprint: Hashable) -> tuple[bool, Any]:
+        if _fingerprint in self.results:
+            self.results.move_to_end(_fingerprint)
+            return True, self.results[_fingerprint][1]
+        return False, None
+
+    def put(self, _fingerprint: Hashable, _inputs: tuple[Any, ...], _result: Any) -> None:
+        # -- The inputs are kept alive with the result, so that any id() based fingerprints stay valid.
+        self.results[_fingerprint] = (_inputs, _result)
+        while len(self.results) > self.max_size:
+            self.results.popitem(last=False)
+
+
+def _hash_array(_array: np.ndarray) -> str:
+    return hashlib.blake2b(np.ascontiguousarray(_array).tobytes(), digest_size=16).hexdigest()
+
+
+def fingerprint(_value: Any) -> Hashable:
+    """Return a hashable fingerprint of the value, which changes whenever the value's content changes.
+
+    * Simple values (str, int, float, bool, Enum, None) are their own fingerprint.
+    * NumPy arrays are hashed.
+    * Objects with a 'fingerprint()' method (ie: the Collections) use it.
+    * Other pydantic models, tuples, lists and dicts are fingerprinted item by item.
+    * Anything else is identified by its type and id().
+    """
+    if _value is None or isinstance(_value, (str, int, float, bool)):
+        return _value
+    if isinstance(_value, np.ndarray):
+        return ("array", _value.shape, _value.dtype.str, _hash_array(_value))
+    if hasattr(_value, "fingerprint"):
+        return (type(_value).__name__, _value.fingerprint())
+    if isinstance(_value, BaseModel):
+        return (type(_value).__name__, tuple(fingerprint(_) for _ in _value.__dict__.values()))
+    if isinstance(_value, (tuple, list)):
+        return tuple(fingerprint(_) for _ in _value)
+    if isinstance(_value, dict):
+        return tuple((k, fingerprint(v)) for k, v in _value.items())
+    return identity_fingerprint(_value)
+
+
+def identity_fingerprint(_value: Any) -> Hashable:
+    """Return a fingerprint of the object's identity. Only use this for objects which are never changed in place."""
+    return ("id", type(_value).__name__, id(_value))
+
+
+class StageGraph:
+    """A graph of named Stages, each memoized on the fingerprint of its inputs."""
+
+    def __init__(
+        self,
+        _stages: Iterable[Stage],
+        _input_names: Iterable[str],
+        _identity_inputs: Iterable[str] = (),
+        _max_cache_size: int = 8,
+    ) -> None:
+        """
+        Arguments:
+        ----------
+            * _stages (Iterable[Stage]): The calculation stages.
+            * _input_names (Iterable[str]): The names of the graph's external inputs.
+            * _identity_inputs (Iterable[str]): The names of any (large) inputs to fingerprint by their
+                identity instead of their content. These objects must never be changed in place.
+            * _max_cache_size (int): The number of results to keep for each stage.
+        """
+        self.input_names = tuple(_input_names)
+        self.identity_inputs = frozenset(_identity_inputs)
+        self.stages = self._sorted_stages(list(_stages))
+        self.last_run: list[StageRun] = []
+        self._memos = {stage.name: _StageMemo(_max_cache_size) for stage in self.stages}
+
+    def _sorted_stages(self, _stages: list[Stage]) -> tuple[Stage, ...]:
+        """Return the stages sorted so that every stage comes after all of its inputs."""
+        known = set(self.input_names)
+        remaining = {s.name: s for s in _stages}
+        if len(remaining) != len(_stages) or known & remaining.keys():
+            raise StageGraphError("Stage names must be unique, and different from the input names.")
+
+        sorted_: list[Stage] = []
+        while remaining:
+            ready = [s for s in remaining.values() if all(i in known for i in s.inputs)]
+            if not ready:
+                raise StageGraphError(f"Unknown inputs, or a dependency cycle, in the stages: {sorted(remaining)}")
+            for stage in ready:
+                sorted_.append(stage)
+                known.add(stage.name)
+                del remaining[stage.name]
+        return tuple(sorted_)
+
+    def run(self, _inputs: dict[str, Any]) -> dict[str, Any]:
+        """Run all the stages (re-using any memoized results) and return the {stage-name: result} dict.
+
+        Arguments:
+        ----------
+            * _inputs (dict[str, Any]): The values of all of the graph's input names.
+
+        Returns:
+        --------
+            * dict[str, Any]: The result of every stage.
+        """
+        missing = [name for name in self.input_names if name not in _inputs]
+        if missing:
+            raise StageGraphError(f"Missing the input(s): {missing}")
+
+        fingerprints: dict[str, Hashable] = {
+            name: identity_fingerprint(_inputs[name]) if name in self.identity_inputs else fingerprint(_inputs[name])
+            for name in self.input_names
+        }
+        values: dict[str, Any] = {name: _inputs[name] for name in self.input_names}
+        self.last_run = []
+
+        for stage in self.stages:
+            start = time.perf_counter()
+            stage_fingerprint = (stage.name, tuple(fingerprints[i] for i in stage.inputs))
+            cached, result = self._memos[stage.name].get(stage_fingerprint)
+            if not cached:
+                stage_inputs = tuple(values[i] for i in stage.inputs)
+                result = stage.func(*stage_inputs)
+                self._memos[stage.name].put(stage_fingerprint, stage_inputs, result)
+
+            fingerprints[stage.name] = stage_fingerprint
+            values[stage.name] = result
+            self.last_run.append(StageRun(stage.name, time.perf_counter() - start, cached))
+            logger.info(
+                f"Stage '{stage.name}': {'cached' if cached else 'computed'} in {self.last_run[-1].seconds:.6f}s"
+            )
+
+        return {stage.name: values[stage.name] for stage in self.stages}
+
+    def clear(self) -> None:
+        """Clear all of the memoized stage results."""
+        for memo in self._memos.values():
+            memo.results.clear()
+
+    def format_timings(self) -> str:
+        """Return the per-stage timings of the last run as a text table."""
+        lines = [f"{'Stage':<32} {'Time (ms)':>12}  Cached"]
+        for run in self.last_run:
+            lines.append(f"{run.name:<32} {run.seconds * 1_000:>12.3f}  {'yes' if run.cached else 'no'}")
+        return "\n".join(lines)
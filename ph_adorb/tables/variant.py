@@ -3,16 +3,16 @@
 
 """Functions to preview variant costs in table-format."""
 
-from collections import defaultdict
 from pathlib import Path
 
+import numpy as np
 from rich.console import Console
 from rich.table import Table
 
+from ph_adorb.cost_ledger import CostLedger
 from ph_adorb.measures import PhAdorbCO2MeasureCollection
 from ph_adorb.constructions import PhAdorbConstructionCollection
 from ph_adorb.equipment import PhAdorbEquipmentCollection
-from ph_adorb.yearly_values import YearlyCost, YearlyKgCO2
 
 
 def rich_table_to_html(_tbl: Table) -> str:
@@ -190,7 +190,9 @@ def preview_variant_equipment(_equipment_collection: PhAdorbEquipmentCollection,
     tbl_ = Table(title="Variant Equipment", show_lines=True)
     tbl_.add_column("Equipment/Appliance", style="cyan", justify="center", min_width=20, no_wrap=True)
     tbl_.add_column("Type", style="magenta", justify="center")
+    tbl_.add_column("Quantity", style="magenta", justify="center")
     tbl_.add_column("USD", style="magenta", justify="center")
+    tbl_.add_column("Total USD", style="magenta", justify="center")
     tbl_.add_column("Lifetime (years)", style="magenta", justify="center")
     tbl_.add_column("Labor Fraction [%]", style="magenta", justify="center")
 
@@ -199,7 +201,9 @@ def preview_variant_equipment(_equipment_collection: PhAdorbEquipmentCollection,
         tbl_.add_row(
             equipment.name,
             equipment.equipment_type.name,
+            f"{equipment.quantity}",
             f"{equipment.cost:,.0f}",
+            f"{equipment.total_cost:,.0f}",
             f"{equipment.lifetime_years:.0f}",
             f"{equipment.labor_fraction * 100.0 :.0f}",
         )
@@ -256,109 +260,54 @@ def preview_variant_constructions(
         console.print(tbl_)
 
 
-def preview_yearly_install_costs(_input: list[YearlyCost], _output_path: Path | None) -> None:
-    # Group the data by description
-    grouped_data = defaultdict(lambda: defaultdict(float))
-    unique_years = set()
-
-    for item in _input:
-        grouped_data[item.description][item.year] += item.cost
-        unique_years.add(item.year)
-
-    # Sort the years to ensure columns are in order
-    sorted_years = sorted(unique_years)
-
-    # Create the table
-    tbl_ = Table(title="Variant Install Costs (USD) by Year", show_lines=True)
-    tbl_.add_column("Description", style="cyan", justify="center", min_width=20, no_wrap=True)
-
-    for year in sorted_years:
-        tbl_.add_column(str(year), style="magenta", justify="center", min_width=8)
-
-    for description, costs in grouped_data.items():
-        row = [description] + [
-            f"{costs.get(year, 0):,.0f}" if costs.get(year, 0) != 0 else "-" for year in sorted_years
-        ]
-        tbl_.add_row(*row)
-
-    add_total_row(tbl_)
-
-    if _output_path:
-        html_table = rich_table_to_html(tbl_)
-        with open(Path(_output_path / "yearly_install_costs.html"), "w") as f:
-            f.write(html_table)
-    else:
-        console = Console()
-        console.print(tbl_)
-
-
-def preview_yearly_embodied_kgCO2(_input: list[YearlyKgCO2], _output_path: Path | None) -> None:
-    # Group the data by description
-    grouped_data = defaultdict(lambda: defaultdict(float))
-    unique_years = set()
-
-    for item in _input:
-        grouped_data[item.description][item.year] += item.kg_CO2
-        unique_years.add(item.year)
-
-    # Sort the years to ensure columns are in order
-    sorted_years = sorted(unique_years)
+def _preview_ledger_by_item_and_year(
+    _ledger: CostLedger, _column: str, _title: str, _filename: str, _output_path: Path | None
+) -> None:
+    """Preview one column of the CostLedger as an (item x year) table."""
+    years, totals = _ledger.by_item_and_year(_column)
+    has_installs = np.bincount(_ledger.item_index, minlength=len(_ledger.items)) > 0
 
     # Create the table
-    tbl_ = Table(title="Variant Embodied-CO2 (kgCO2) by Year", show_lines=True)
+    tbl_ = Table(title=_title, show_lines=True)
     tbl_.add_column("Description", style="cyan", justify="center", min_width=20, no_wrap=True)
 
-    for year in sorted_years:
+    for year in years:
         tbl_.add_column(str(year), style="magenta", justify="center", min_width=8)
 
-    for description, costs in grouped_data.items():
-        row = [description] + [
-            f"{costs.get(year, 0):,.0f}" if costs.get(year, 0) != 0 else "-" for year in sorted_years
-        ]
+    for description, item_totals, item_has_installs in zip(_ledger.items, totals, has_installs):
+        if not item_has_installs:
+            continue
+        row = [description] + [f"{value:,.0f}" if value != 0 else "-" for value in item_totals]
         tbl_.add_row(*row)
 
     add_total_row(tbl_)
 
     if _output_path:
         html_table = rich_table_to_html(tbl_)
-        with open(Path(_output_path / "yearly_embodied_CO2_kg.html"), "w") as f:
+        with open(Path(_output_path / _filename), "w") as f:
             f.write(html_table)
     else:
         console = Console()
         console.print(tbl_)
 
 
-def preview_yearly_embodied_CO2_costs(_input: list[YearlyCost], _output_path: Path | None) -> None:
-    # Group the data by description
-    grouped_data = defaultdict(lambda: defaultdict(float))
-    unique_years = set()
+def preview_yearly_install_costs(_ledger: CostLedger, _output_path: Path | None) -> None:
+    _preview_ledger_by_item_and_year(
+        _ledger, "install_cost", "Variant Install Costs (USD) by Year", "yearly_install_costs.html", _output_path
+    )
 
-    for item in _input:
-        grouped_data[item.description][item.year] += item.cost
-        unique_years.add(item.year)
 
-    # Sort the years to ensure columns are in order
-    sorted_years = sorted(unique_years)
+def preview_yearly_embodied_kgCO2(_ledger: CostLedger, _output_path: Path | None) -> None:
+    _preview_ledger_by_item_and_year(
+        _ledger, "embodied_kgCO2", "Variant Embodied-CO2 (kgCO2) by Year", "yearly_embodied_CO2_kg.html", _output_path
+    )
 
-    # Create the table
-    tbl_ = Table(title="Variant Embodied-CO2 Costs (USD) by Year.", show_lines=True)
-    tbl_.add_column("Description", style="cyan", justify="center", min_width=20, no_wrap=True)
 
-    for year in sorted_years:
-        tbl_.add_column(str(year), style="magenta", justify="center", min_width=8)
-
-    for description, costs in grouped_data.items():
-        row = [description] + [
-            f"{costs.get(year, 0):,.0f}" if costs.get(year, 0) != 0 else "-" for year in sorted_years
-        ]
-        tbl_.add_row(*row)
-
-    add_total_row(tbl_)
-
-    if _output_path:
-        html_table = rich_table_to_html(tbl_)
-        with open(Path(_output_path / "yearly_embodied_CO2_costs.html"), "w") as f:
-            f.write(html_table)
-    else:
-        console = Console()
-        console.print(tbl_)
+def preview_yearly_embodied_CO2_costs(_ledger: CostLedger, _output_path: Path | None) -> None:
+    _preview_ledger_by_item_and_year(
+        _ledger,
+        "embodied_CO2_cost",
+        "Variant Embodied-CO2 Costs (USD) by Year.",
+        "yearly_embodied_CO2_costs.html",
+        _output_path,
+    )
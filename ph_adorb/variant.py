@@ -3,43 +3,51 @@
 
 """A Building Variant with all of its relevant data, and related functions."""
 
+from __future__ import annotations
+
 from pathlib import Path
 import logging
+from typing import TYPE_CHECKING, Any
 
-import pandas as pd
-from pydantic import BaseModel, Field
-from ph_units.unit_type import Unit
+import numpy as np
+from pydantic import BaseModel, Field, PrivateAttr, validator
 
 from ph_adorb import adorb_cost
 from ph_adorb.constructions import PhAdorbConstructionCollection
+from ph_adorb.cost_ledger import CostLedger
 from ph_adorb.equipment import PhAdorbEquipmentCollection
 from ph_adorb.fuel import PhAdorbFuel
 from ph_adorb.grid_region import PhAdorbGridRegion
 from ph_adorb.measures import PhAdorbCO2MeasureCollection
 from ph_adorb.national_emissions import PhAdorbNationalEmissions
-from ph_adorb.tables.variant import (
-    preview_hourly_electric_and_CO2,
-    preview_yearly_energy_and_CO2,
-    preview_variant_co2_measures,
-    preview_variant_constructions,
-    preview_variant_equipment,
-    preview_yearly_embodied_CO2_costs,
-    preview_yearly_embodied_kgCO2,
-    preview_yearly_install_costs,
-)
+from ph_adorb.replacement_schedule import ReplacementSchedule, build_one_time_schedule, build_replacement_schedule
 from ph_adorb.yearly_values import YearlyCost, YearlyKgCO2
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------------------
 
 
+def as_readonly_hourly_array(_values: Any) -> np.ndarray:
+    """Return the hourly values as a read-only float64 array (without a copy, if it already is one)."""
+    array_ = np.asarray(_values, dtype=np.float64)
+    if array_.ndim != 1:
+        raise ValueError(f"Expected a 1-dimensional list of hourly values, got an array with shape: {array_.shape}")
+    if array_.flags.writeable:
+        array_ = array_.copy() if array_ is _values else array_
+        array_.flags.writeable = False
+    return array_
+
+
 class PhAdorbVariant(BaseModel):
     """A single Variant of a building design."""
 
     name: str
     total_purchased_gas_kwh: float
-    hourly_purchased_electricity_kwh: list[float]
+    hourly_purchased_electricity_kwh: np.ndarray
     total_sold_electricity_kwh: float
     peak_electric_usage_W: float
     electricity: PhAdorbFuel
@@ -55,13 +63,90 @@ class PhAdorbVariant(BaseModel):
 
     price_of_carbon: float = 0.25
 
+    # -- The (hourly-array, total) used to cache the total_purchased_electricity_kwh
+    _total_purchased_electricity_kwh: tuple[np.ndarray, float] | None = PrivateAttr(default=None)
+
+    @validator("hourly_purchased_electricity_kwh", pre=True)
+    def validate_hourly_purchased_electricity_kwh(cls, _values: Any) -> np.ndarray:
+        return as_readonly_hourly_array(_values)
+
+    @classmethod
+    def from_trusted(cls, **_fields: Any) -> PhAdorbVariant:
+        """Create a new PhAdorbVariant from already-validated data, WITHOUT re-validating any of it.
+
+        Normal construction validates every one of the 8760 hourly values, and every nested
+        model (grid-region, fuels, collections, ...). When all of the data comes from already
+        validated models and loaders, this skips that work. No type-coercion is done (other than
+        storing the hourly electricity as a read-only array), so all values must already be of the
+        correct type (ie: the grid-region must be a PhAdorbGridRegion, etc...). Optional fields
+        which are not supplied are set to their defaults.
+
+        Raises:
+        -------
+            * ValueError: If any of the required fields are missing.
+        """
+        missing = [name for name, field in cls.__fields__.items() if field.required and name not in _fields]
+        if missing:
+            raise ValueError(f"Cannot create a PhAdorbVariant, missing the required field(s): {missing}")
+        _fields["hourly_purchased_electricity_kwh"] = as_readonly_hourly_array(
+            _fields["hourly_purchased_electricity_kwh"]
+        )
+        return cls.construct(**_fields)
+
+    def clone(self, **_overrides: Any) -> PhAdorbVariant:
+        """Return a cheap copy of the Variant, with any of its fields replaced by the '_overrides'.
+
+        The large, read-only members (the hourly electricity array, the grid-region and the
+        national-emissions) are shared with the original Variant, not copied. The fuels are copied.
+        The Measure, Construction and Equipment collections are copy-on-write (see: '.share()'): their
+        items are shared, read-only, until the clone or the original changes a collection, which then
+        copies its own items. So many clones of a large Variant cost little until they are edited.
+        Like 'from_trusted', the overrides are not validated, and they are used as-is (not copied).
+
+        Raises:
+        -------
+            * ValueError: If any of the overrides is not a PhAdorbVariant field.
+        """
+        unknown = [name for name in _overrides if name not in self.__fields__]
+        if unknown:
+            raise ValueError(f"Cannot clone the PhAdorbVariant, unknown field(s): {unknown}")
+
+        copies = {
+            "electricity": lambda: self.electricity.copy(),
+            "gas": lambda: self.gas.copy(),
+            "measure_collection": lambda: self.measure_collection.share(),
+            "construction_collection": lambda: self.construction_collection.share(),
+            "equipment_collection": lambda: self.equipment_collection.share(),
+        }
+        fields = {
+            name: _overrides[name] if name in _overrides else copies[name]() if name in copies else getattr(self, name)
+            for name in self.__fields__
+        }
+
+        clone_ = PhAdorbVariant.from_trusted(**fields)
+        if clone_.hourly_purchased_electricity_kwh is self.hourly_purchased_electricity_kwh:
+            clone_._total_purchased_electricity_kwh = self._total_purchased_electricity_kwh
+        return clone_
+
     @property
     def total_purchased_electricity_kwh(self) -> float:
         """Return the total annual purchased electricity in KWH."""
-        return sum(self.hourly_purchased_electricity_kwh)
+        hourly_kwh = self.hourly_purchased_electricity_kwh
+        if self._total_purchased_electricity_kwh is None or self._total_purchased_electricity_kwh[0] is not hourly_kwh:
+            self._total_purchased_electricity_kwh = (hourly_kwh, float(np.sum(hourly_kwh)))
+        return self._total_purchased_electricity_kwh[1]
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, PhAdorbVariant):
+            return NotImplemented
+        exclude = {"hourly_purchased_electricity_kwh"}
+        return self.dict(exclude=exclude) == other.dict(exclude=exclude) and np.array_equal(
+            self.hourly_purchased_electricity_kwh, other.hourly_purchased_electricity_kwh
+        )
 
     class Config:
         arbitrary_types_allowed = True
+        json_encoders = {np.ndarray: lambda a: a.tolist()}
 
     @property
     def all_carbon_measures(self) -> PhAdorbCO2MeasureCollection:
@@ -116,13 +201,16 @@ def calc_annual_hourly_electric_CO2(
     """Return a list of total annual CO2 emissions for each year from 2023 - 2011 (89 years)."""
     MWH_PER_KWH = 0.001
 
-    # -- Convert the hourly purchased electricity from KWH to a pd.Series as MWH
-    hourly_electric_MWH = pd.Series(_hourly_purchased_electricity_kwh) * MWH_PER_KWH
+    # -- Convert the hourly purchased electricity from KWH to MWH
+    hourly_electric_MWH = np.asarray(_hourly_purchased_electricity_kwh, dtype=float) * MWH_PER_KWH
 
-    # Multiply each year's factors by the hourly electric MWH list, and sum the results for each year.
+    # Multiply each year's factors by the hourly electric MWH, and sum the results for each year.
+    # Only the hours present in both the electric and the grid-factor data are included.
+    hourly_CO2_factors = _grid_region.get_CO2_factors_as_array()
+    num_hours = min(len(hourly_electric_MWH), len(hourly_CO2_factors))
     annual_hourly_electric_CO2: list[float] = (
-        (_grid_region.get_CO2_factors_as_df().multiply(hourly_electric_MWH, axis=0)).sum().tolist()
-    )
+        hourly_electric_MWH[:num_hours] @ hourly_CO2_factors[:num_hours]
+    ).tolist()
     return annual_hourly_electric_CO2
 
 
@@ -153,11 +241,12 @@ def calc_annual_total_gas_CO2(
     logger.info("calc_annual_total_gas_CO2()")
 
     TONS_CO2_PER_THERM_GAS = 12.7
+    THERMS_PER_KWH = 0.0341214115648838
 
     if not _gas_used:
         return 0.0
 
-    annual_therms_gas = Unit(_total_purchased_gas_kwh, "KWH").as_a("THERM").value
+    annual_therms_gas = _total_purchased_gas_kwh * THERMS_PER_KWH
     annual_tons_gas_CO2 = annual_therms_gas * TONS_CO2_PER_THERM_GAS
 
     logger.debug(
@@ -238,32 +327,64 @@ def calc_CO2_reduction_measures_yearly_install_costs(
     return [YearlyCost(measure.cost, measure.year, measure.name) for measure in _variant_CO2_measures]
 
 
+def calc_CO2_reduction_measures_schedule(
+    _variant_CO2_measures: PhAdorbCO2MeasureCollection,
+    _analysis_duration: int,
+    _kg_CO2_per_USD: float,
+    _USD_per_kgCO2: float = 0.25,
+) -> ReplacementSchedule:
+    """Return the one-time ReplacementSchedule (install-costs, embodied kgCO2 and CO2-costs) for all the CO2-Reduction-Measures."""
+    logger.info(f"calc_CO2_reduction_measures_schedule({len(_variant_CO2_measures)} measures)")
+
+    measures = _variant_CO2_measures.values()
+    return build_one_time_schedule(
+        [m.name for m in measures],
+        np.fromiter((m.cost for m in measures), dtype=float, count=len(measures)),
+        np.fromiter((m.year for m in measures), dtype=int, count=len(measures)),
+        _analysis_duration,
+        _kg_CO2_per_USD,
+        _USD_per_kgCO2,
+    )
+
+
 # ---------------------------------------------------------------------------------------
 # -- Constructions
 
 
+def calc_constructions_replacement_schedule(
+    _construction_collection: PhAdorbConstructionCollection,
+    _analysis_duration: int,
+    _kg_CO2_per_USD: float,
+    _USD_per_kgCO2: float = 0.25,
+) -> ReplacementSchedule:
+    """Return the ReplacementSchedule (install-costs, embodied kgCO2 and CO2-costs) for all the Variant's Constructions."""
+    logger.info(f"calc_constructions_replacement_schedule({len(_construction_collection)} constructions)")
+
+    arrays = _construction_collection.to_arrays()
+    schedule_ = build_replacement_schedule(
+        arrays.names,
+        arrays.cost,
+        arrays.material_fraction,
+        arrays.lifetime_years,
+        _analysis_duration,
+        _kg_CO2_per_USD,
+        _USD_per_kgCO2,
+    )
+    logger.debug(
+        f"Constructions: {len(schedule_)} installs, ${schedule_.install_cost.sum() :,.0f}, {schedule_.embodied_kgCO2.sum() :,.0f} kgCO2"
+    )
+    return schedule_
+
+
 def calc_constructions_yearly_embodied_kgCO2(
     _construction_collection: PhAdorbConstructionCollection, _analysis_duration, _kg_CO2_per_USD
 ) -> list[YearlyKgCO2]:
     """Return a list of all the Yearly-Embodied-CO2-Costs for all the Variant's Construction Materials."""
     logger.info("calc_constructions_yearly_embodied_kgCO2()")
 
-    yearly_embodied_kgCO2_: list[YearlyKgCO2] = []
-    for const in _construction_collection:
-        const_material_dollar_cost: float = const.cost * const.material_fraction
-        const_material_embodied_kgCO2: float = const_material_dollar_cost * _kg_CO2_per_USD
-
-        logger.debug(
-            f"Construction {const.display_name}: ${const_material_dollar_cost :,.0f} * {_kg_CO2_per_USD :,.2f} kgCO2/USD = {const_material_embodied_kgCO2 :,.0f} kgCO2"
-        )
-
-        for year in range(0, _analysis_duration + 1, const.lifetime_years or (_analysis_duration + 1)):
-            logger.debug(
-                f"Adding Construction {const.display_name} Embodied CO2 [lifetime={const.lifetime_years}yrs] {const_material_embodied_kgCO2 :,.0f} kgCO2 for year-{year}"
-            )
-            yearly_embodied_kgCO2_.append(YearlyKgCO2(const_material_embodied_kgCO2, year, const.display_name))
-
-    return yearly_embodied_kgCO2_
+    return calc_constructions_replacement_schedule(
+        _construction_collection, _analysis_duration, _kg_CO2_per_USD
+    ).to_YearlyKgCO2s()
 
 
 def calc_constructions_yearly_embodied_CO2_cost(
@@ -291,42 +412,47 @@ def calc_constructions_yearly_install_costs(
     """Return a list of all the Yearly-Install-Costs (labor + material) for all the Variant's Constructions."""
     logger.info("calc_constructions_yearly_install_costs()")
 
-    yearly_install_costs_ = []
-    for const in _construction_collection:
-        for year in range(0, _analysis_duration + 1, const.lifetime_years or (_analysis_duration + 1)):
-            logger.debug(
-                f"Adding Construction {const.display_name} Install Cost: [lifetime={const.lifetime_years}yrs] ${const.cost :,.0f} for year-{year}"
-            )
-            yearly_install_costs_.append(YearlyCost(const.cost, year, const.display_name))
-    return yearly_install_costs_
+    return calc_constructions_replacement_schedule(_construction_collection, _analysis_duration, 0.0).to_YearlyCosts()
 
 
 # ---------------------------------------------------------------------------------------
 # -- Mechanical Equipment & Appliances
 
 
+def calc_equipment_replacement_schedule(
+    _equipment_collection: PhAdorbEquipmentCollection,
+    _analysis_duration: int,
+    _kg_CO2_per_USD: float,
+    _USD_per_kgCO2: float = 0.25,
+) -> ReplacementSchedule:
+    """Return the ReplacementSchedule (install-costs, embodied kgCO2 and CO2-costs) for all the Variant's Equipment."""
+    logger.info(f"calc_equipment_replacement_schedule({len(_equipment_collection)} equipment)")
+
+    arrays = _equipment_collection.to_arrays()
+    schedule_ = build_replacement_schedule(
+        arrays.names,
+        arrays.total_cost,
+        arrays.material_fraction,
+        arrays.lifetime_years,
+        _analysis_duration,
+        _kg_CO2_per_USD,
+        _USD_per_kgCO2,
+    )
+    logger.debug(
+        f"Equipment: {len(schedule_)} installs, ${schedule_.install_cost.sum() :,.0f}, {schedule_.embodied_kgCO2.sum() :,.0f} kgCO2"
+    )
+    return schedule_
+
+
 def calc_equipment_yearly_embodied_kgCO2_(
     _equipment_collection: PhAdorbEquipmentCollection, _analysis_duration, _kg_CO2_per_USD
 ) -> list[YearlyKgCO2]:
     """Return a list of all the Yearly-Embodied-kgCO2 for all the Variant's Equipment."""
     logger.info("calc_equipment_yearly_embodied_kgCO2_()")
 
-    yearly_embodied_kgCO2_: list[YearlyKgCO2] = []
-    for equip in _equipment_collection:
-        equip_material_cost: float = equip.cost * equip.material_fraction
-        equip_material_embodied_CO2_cost: float = equip_material_cost * _kg_CO2_per_USD
-
-        logger.debug(
-            f"Equipment {equip.name}: ${equip_material_cost :,.0f} * {_kg_CO2_per_USD :,.2f} kgCO2/USD = {equip_material_embodied_CO2_cost :,.0f} kgCO2"
-        )
-
-        for year in range(0, _analysis_duration + 1, equip.lifetime_years or (_analysis_duration + 1)):
-            logger.debug(
-                f"Adding Equipment {equip.name} Embodied CO2 [lifetime={equip.lifetime_years}yrs] {equip_material_embodied_CO2_cost :,.0f} kgCO2 for year-{year}"
-            )
-            yearly_embodied_kgCO2_.append(YearlyKgCO2(equip_material_embodied_CO2_cost, year, equip.name))
-
-    return yearly_embodied_kgCO2_
+    return calc_equipment_replacement_schedule(
+        _equipment_collection, _analysis_duration, _kg_CO2_per_USD
+    ).to_YearlyKgCO2s()
 
 
 def calc_equipment_yearly_embodied_CO2_cost(
@@ -354,24 +480,59 @@ def calc_equipment_yearly_install_costs(
     """Return a list of all the Yearly-Install-Costs (labor + material) for all the Variant's Equipment."""
     logger.info("calc_equipment_yearly_install_costs()")
 
-    yearly_install_costs_ = []
-    for equip in _equipment_collection:
-        for year in range(0, _analysis_duration + 1, equip.lifetime_years or (_analysis_duration + 1)):
-            logger.debug(
-                f"Adding Equipment {equip.name} Install Cost: [lifetime={equip.lifetime_years}yrs] ${equip.cost :,.0f} for year-{year}"
-            )
-            yearly_install_costs_.append(YearlyCost(equip.cost, year, equip.name))
-
-    return yearly_install_costs_
+    return calc_equipment_replacement_schedule(_equipment_collection, _analysis_duration, 0.0).to_YearlyCosts()
 
 
 # ---------------------------------------------------------------------------------------
 
 
+def calc_variant_cost_ledger(_variant: PhAdorbVariant) -> CostLedger:
+    """Return the CostLedger with every install of the Variant's CO2-Measures, Constructions and Equipment."""
+    logger.info("calc_variant_cost_ledger()")
+
+    return CostLedger.from_schedules(
+        {
+            "CO2 Measures": calc_CO2_reduction_measures_schedule(
+                _variant.all_carbon_measures,
+                _variant.analysis_duration,
+                _variant.national_emissions.kg_CO2_per_USD,
+                _variant.price_of_carbon,
+            ),
+            "Constructions": calc_constructions_replacement_schedule(
+                _variant.construction_collection,
+                _variant.analysis_duration,
+                _variant.national_emissions.kg_CO2_per_USD,
+                _variant.price_of_carbon,
+            ),
+            "Equipment": calc_equipment_replacement_schedule(
+                _variant.equipment_collection,
+                _variant.analysis_duration,
+                _variant.national_emissions.kg_CO2_per_USD,
+                _variant.price_of_carbon,
+            ),
+        }
+    )
+
+
 def calc_variant_yearly_ADORB_costs(_variant: PhAdorbVariant, _output_tables_path: Path | None = None) -> pd.DataFrame:
     """Return a DataFrame with the Variant's yearly ADORB costs for each year of the analysis duration."""
     logger.info("calc_variant_yearly_ADORB_costs()")
 
+    return adorb_cost.ADORB_costs_array_to_DataFrame(
+        calc_variant_yearly_ADORB_costs_array(_variant, _output_tables_path)
+    )
+
+
+def calc_variant_yearly_ADORB_costs_array(
+    _variant: PhAdorbVariant, _output_tables_path: Path | None = None
+) -> np.ndarray:
+    """Return an array (years x adorb_cost.ADORB_COLUMNS) with the Variant's yearly ADORB costs.
+
+    This is the NumPy-only core path: pandas and the table-preview (rich) packages are only
+    imported if an '_output_tables_path' is provided.
+    """
+    logger.info("calc_variant_yearly_ADORB_costs_array()")
+
     # -----------------------------------------------------------------------------------
     # -----------------------------------------------------------------------------------
     # -- Electric: Annual Costs, Annual CO2
@@ -403,65 +564,21 @@ def calc_variant_yearly_ADORB_costs(_variant: PhAdorbVariant, _output_tables_pat
 
     # -----------------------------------------------------------------------------------
     # -----------------------------------------------------------------------------------
-    # -- CO2-REDUCTION-MEASURES Costs
-    carbon_measure_yearly_embodied_kgCO2 = calc_CO2_reduction_measures_yearly_embodied_kgCO2(
-        _variant.all_carbon_measures,
-        _variant.national_emissions.kg_CO2_per_USD,
-    )
-    carbon_measure_yearly_embodied_CO2_costs = calc_CO2_reduction_measures_yearly_embodied_CO2_cost(
-        carbon_measure_yearly_embodied_kgCO2,
-        _variant.price_of_carbon,
-    )
-    carbon_measure_yearly_install_costs = calc_CO2_reduction_measures_yearly_install_costs(_variant.all_carbon_measures)
-
-    # -----------------------------------------------------------------------------------
-    # -----------------------------------------------------------------------------------
-    # -- CONSTRUCTIONS Costs
-    construction_yearly_embodied_kgCO2 = calc_constructions_yearly_embodied_kgCO2(
-        _variant.construction_collection,
-        _variant.analysis_duration,
-        _variant.national_emissions.kg_CO2_per_USD,
-    )
-    construction_yearly_embodied_CO2_costs = calc_constructions_yearly_embodied_CO2_cost(
-        construction_yearly_embodied_kgCO2, _variant.price_of_carbon
-    )
-    construction_yearly_install_costs = calc_constructions_yearly_install_costs(
-        _variant.construction_collection,
-        _variant.analysis_duration,
-    )
-
-    # -----------------------------------------------------------------------------------
-    # -----------------------------------------------------------------------------------
-    # -- HVAC EQUIPMENT AND APPLIANCE Costs
-    equipment_yearly_embodied_kgCO2_ = calc_equipment_yearly_embodied_kgCO2_(
-        _variant.equipment_collection,
-        _variant.analysis_duration,
-        _variant.national_emissions.kg_CO2_per_USD,
-    )
-    equipment_yearly_embodied_CO2_costs = calc_equipment_yearly_embodied_CO2_cost(
-        equipment_yearly_embodied_kgCO2_,
-        _variant.price_of_carbon,
-    )
-    equipment_yearly_install_costs = calc_equipment_yearly_install_costs(
-        _variant.equipment_collection,
-        _variant.analysis_duration,
-    )
-
-    # -----------------------------------------------------------------------------------
-    # -----------------------------------------------------------------------------------
-    all_yearly_install_costs = (
-        carbon_measure_yearly_install_costs + construction_yearly_install_costs + equipment_yearly_install_costs
-    )
-    all_yearly_embodied_kgCO2 = (
-        carbon_measure_yearly_embodied_kgCO2 + construction_yearly_embodied_kgCO2 + equipment_yearly_embodied_kgCO2_
-    )
-    all_yearly_embodied_kgCO2_costs = (
-        carbon_measure_yearly_embodied_CO2_costs
-        + construction_yearly_embodied_CO2_costs
-        + equipment_yearly_embodied_CO2_costs
-    )
+    # -- CO2-REDUCTION-MEASURES, CONSTRUCTIONS, HVAC EQUIPMENT AND APPLIANCE Costs
+    cost_ledger = calc_variant_cost_ledger(_variant)
 
     if _output_tables_path:
+        from ph_adorb.tables.variant import (
+            preview_hourly_electric_and_CO2,
+            preview_yearly_energy_and_CO2,
+            preview_variant_co2_measures,
+            preview_variant_constructions,
+            preview_variant_equipment,
+            preview_yearly_embodied_CO2_costs,
+            preview_yearly_embodied_kgCO2,
+            preview_yearly_install_costs,
+        )
+
         logger.info(f"Saving ADORB Tables to: {_output_tables_path}")
         preview_hourly_electric_and_CO2(
             _variant.hourly_purchased_electricity_kwh,
@@ -478,21 +595,21 @@ def calc_variant_yearly_ADORB_costs(_variant: PhAdorbVariant, _output_tables_pat
         preview_variant_co2_measures(_variant.measure_collection, _output_tables_path)
         preview_variant_constructions(_variant.construction_collection, _output_tables_path)
         preview_variant_equipment(_variant.equipment_collection, _output_tables_path)
-        preview_yearly_install_costs(all_yearly_install_costs, _output_tables_path)
-        preview_yearly_embodied_kgCO2(all_yearly_embodied_kgCO2, _output_tables_path)
-        preview_yearly_embodied_CO2_costs(all_yearly_embodied_kgCO2_costs, _output_tables_path)
+        preview_yearly_install_costs(cost_ledger, _output_tables_path)
+        preview_yearly_embodied_kgCO2(cost_ledger, _output_tables_path)
+        preview_yearly_embodied_CO2_costs(cost_ledger, _output_tables_path)
 
     # -----------------------------------------------------------------------------------
     # -----------------------------------------------------------------------------------
-    # -- Compute and return the ADORB costs DataFrame
-    return adorb_cost.calculate_annual_ADORB_costs(
+    # -- Compute and return the ADORB costs array
+    return adorb_cost.calculate_annual_ADORB_costs_array(
         _variant.analysis_duration,
         annual_total_cost_electric,
         annual_total_cost_gas,
         future_annual_total_CO2_electric,
         annual_total_CO2_gas,
-        all_yearly_install_costs,
-        all_yearly_embodied_kgCO2_costs,
+        cost_ledger.by_year("install_cost"),
+        cost_ledger.by_year("embodied_CO2_cost"),
         _variant.peak_electric_usage_W,
         _variant.price_of_carbon,
     )
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Compact binary save / load of fully prepared PhAdorbVariants.
+
+A prepared Variant is stored as a single (uncompressed) NumPy '.npz' archive:
+    * The hourly electricity is stored as a raw float64 array.
+    * The Measure, Construction and Equipment collections are stored 'columnar': one array per field.
+    * The small fields (name, fuels, national-emissions, ...) are stored as a JSON 'meta' record.
+    * The Grid-Region is stored by reference (its region-code, and the file it was loaded from)
+        since it is large and shared by many Variants. It can optionally be embedded instead.
+
+The same bytes (see: 'encode_variant' / 'decode_variant') can be sent to worker processes, which
+only need to load each Grid-Region once:
+
+    >>> data = encode_variant(variant)
+    >>> # -- in the worker:
+    >>> variant = decode_variant(data, _grid_region=grid_regions_by_code)
+
+Re-running a cost study from a saved Variant skips reading the HBJSON and SQL files entirely.
+"""
+
+import io
+import json
+import logging
+from pathlib import Path
+from typing import Any, Iterable, Mapping, Type, TypeVar
+
+import numpy as np
+from pydantic import BaseModel
+
+from ph_adorb.constructions import PhAdorbConstruction, PhAdorbConstructionCollection
+from ph_adorb.equipment import PhAdorbEquipment, PhAdorbEquipmentCollection
+from ph_adorb.fuel import PhAdorbFuel
+from ph_adorb.grid_region import PhAdorbGridRegion, load_CO2_factors_from_json_file
+from ph_adorb.library import decode_model_columns, encode_model_columns
+from ph_adorb.measures import PhAdorbCO2MeasureCollection, PhAdorbCO2ReductionMeasure
+from ph_adorb.national_emissions import PhAdorbNationalEmissions
+from ph_adorb.variant import PhAdorbVariant
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T", bound=BaseModel)
+
+# -- Change this if the stored format changes.
+VARIANT_FORMAT_VERSION = 1
+
+_META_FIELDS = {
+    "name",
+    "total_purchased_gas_kwh",
+    "total_sold_electricity_kwh",
+    "peak_electric_usage_W",
+    "electricity",
+    "gas",
+    "national_emissions",
+    "analysis_duration",
+    "envelope_labor_cost_fraction",
+    "price_of_carbon",
+}
+
+
+class VariantFormatError(Exception):
+    def __init__(self, _msg: str) -> None:
+        self.message = f"VariantFormatError: {_msg}"
+        super().__init__(self.message)
+
+
+# ---------------------------------------------------------------------------------------
+# -- Grid-Region
+
+
+def _encode_grid_region(_grid_region: PhAdorbGridRegion) -> dict[str, np.ndarray]:
+    return {
+        "grid_region.years": np.array(list(_grid_region.hourly_CO2_factors.keys()), dtype=int),
+        "grid_region.factors": _grid_region.get_CO2_factors_as_array().T,
+    }
+
+
+def _decode_grid_region(_meta: dict[str, Any], _arrays: Mapping[str, np.ndarray]) -> PhAdorbGridRegion:
+    factors = _arrays["grid_region.factors"]
+    return PhAdorbGridRegion.construct(
+        region_code=_meta["region_code"],
+        region_name=_meta["region_name"],
+        description=_meta["description"],
+        hourly_CO2_factors={int(y): row.tolist() for y, row in zip(_arrays["grid_region.years"], factors)},
+    )
+
+
+def _resolve_grid_region(
+    _meta: dict[str, Any],
+    _arrays: Mapping[str, np.ndarray],
+    _grid_region: PhAdorbGridRegion | Mapping[str, PhAdorbGridRegion] | None,
+) -> PhAdorbGridRegion:
+    """Return the Variant's Grid-Region: embedded, supplied (by region-code), or loaded from its source file."""
+    if "grid_region.factors" in _arrays:
+        return _decode_grid_region(_meta, _arrays)
+
+    region_code = _meta["region_code"]
+    if isinstance(_grid_region, PhAdorbGridRegion):
+        if _grid_region.region_code != region_code:
+            raise VariantFormatError(
+                f"The Variant uses the grid-region '{region_code}', not '{_grid_region.region_code}'."
+            )
+        return _grid_region
+    if _grid_region is not None and region_code in _grid_region:
+        return _grid_region[region_code]
+    if _meta.get("file"):
+        logger.info(f"Loading the grid-region '{region_code}' from: {_meta['file']}")
+        return load_CO2_factors_from_json_file(Path(_meta["file"]))
+    raise VariantFormatError(f"Cannot find the grid-region '{region_code}'. Please supply it.")
+
+
+# ---------------------------------------------------------------------------------------
+# -- Variant
+
+
+def encode_variant(
+    _variant: PhAdorbVariant, _grid_region_file: Path | None = None, _embed_grid_region: bool = False
+) -> bytes:
+    """Return the Variant encoded as the bytes of a NumPy '.npz' archive.
+
+    Arguments:
+    ----------
+        * _variant (PhAdorbVariant): The Variant to encode.
+        * _grid_region_file (Path | None): The (JSON) file the Variant's grid-region was loaded from. If
+            given, it is stored with the reference so that the grid-region can be re-loaded automatically.
+        * _embed_grid_region (bool): Default=False. If True, store the full grid-region factors
+            (as a raw array) instead of a reference to them.
+
+    Returns:
+    --------
+        * bytes
+    """
+    grid_region = _variant.grid_region
+    meta = {
+        "version": VARIANT_FORMAT_VERSION,
+        "variant": json.loads(_variant.json(include=_META_FIELDS)),
+        "grid_region": {
+            "region_code": grid_region.region_code,
+            "region_name": grid_region.region_name,
+            "description": grid_region.description,
+            "file": str(_grid_region_file) if _grid_region_file else None,
+        },
+    }
+
+    arrays: dict[str, np.ndarray] = {
+        "meta": np.frombuffer(json.dumps(meta).encode("utf-8"), dtype=np.uint8),
+        "hourly_purchased_electricity_kwh": np.asarray(_variant.hourly_purchased_electricity_kwh, dtype=float),
+        **encode_model_columns("measures", PhAdorbCO2ReductionMeasure, _variant.measure_collection.values()),
+        **encode_model_columns("constructions", PhAdorbConstruction, _variant.construction_collection.values()),
+        **encode_model_columns("equipment", PhAdorbEquipment, _variant.equipment_collection.values()),
+    }
+    if _embed_grid_region:
+        arrays.update(_encode_grid_region(grid_region))
+
+    buffer = io.BytesIO()
+    np.savez(buffer, **arrays)
+    return buffer.getvalue()
+
+
+def _collection(_collection_type: Type[T], _add_method: str, _items: Iterable[BaseModel]) -> T:
+    collection_ = _collection_type()
+    add = getattr(collection_, _add_method)
+    for item in _items:
+        add(item)
+    return collection_
+
+
+def decode_variant(
+    _data: bytes, _grid_region: PhAdorbGridRegion | Mapping[str, PhAdorbGridRegion] | None = None
+) -> PhAdorbVariant:
+    """Return the PhAdorbVariant decoded from the bytes written by 'encode_variant'.
+
+    Arguments:
+    ----------
+        * _data (bytes): The encoded Variant.
+        * _grid_region (PhAdorbGridRegion | Mapping[str, PhAdorbGridRegion] | None): The already loaded
+            grid-region, or a dict of them by region-code. If not supplied, the grid-region is loaded
+            from the file recorded when the Variant was encoded (unless it was embedded).
+
+    Returns:
+    --------
+        * PhAdorbVariant
+
+    Raises:
+    -------
+        * VariantFormatError: If the data is an unknown version, or the grid-region cannot be found.
+    """
+    with np.load(io.BytesIO(_data), allow_pickle=False) as npz:
+        arrays = {name: npz[name] for name in npz.files}
+
+    meta = json.loads(arrays["meta"].tobytes().decode("utf-8"))
+    if meta.get("version") != VARIANT_FORMAT_VERSION:
+        raise VariantFormatError(f"Unsupported version: {meta.get('version')}. Expected: {VARIANT_FORMAT_VERSION}")
+
+    fields = meta["variant"]
+    fields.update(
+        electricity=PhAdorbFuel(**fields["electricity"]),
+        gas=PhAdorbFuel(**fields["gas"]),
+        national_emissions=PhAdorbNationalEmissions(**fields["national_emissions"]),
+        hourly_purchased_electricity_kwh=arrays["hourly_purchased_electricity_kwh"],
+        grid_region=_resolve_grid_region(meta["grid_region"], arrays, _grid_region),
+        measure_collection=_collection(
+            PhAdorbCO2MeasureCollection,
+            "add_measure",
+            decode_model_columns("measures", PhAdorbCO2ReductionMeasure, arrays),
+        ),
+        construction_collection=_collection(
+            PhAdorbConstructionCollection,
+            "add_construction",
+            decode_model_columns("constructions", PhAdorbConstruction, arrays),
+        ),
+        equipment_collection=_collection(
+            PhAdorbEquipmentCollection,
+            "add_equipment",
+            decode_model_columns("equipment", PhAdorbEquipment, arrays),
+        ),
+    )
+    return PhAdorbVariant.from_trusted(**fields)
+
+
+def save_variant(
+    _file_path: Path,
+    _variant: PhAdorbVariant,
+    _grid_region_file: Path | None = None,
+    _embed_grid_region: bool = False,
+) -> None:
+    """Save the prepared Variant to a binary ('.npz') file. See: 'encode_variant'."""
+    logger.info(f"Saving the Variant '{_variant.name}' to: {_file_path}")
+    Path(_file_path).write_bytes(encode_variant(_variant, _grid_region_file, _embed_grid_region))
+
+
+def load_variant(
+    _file_path: Path, _grid_region: PhAdorbGridRegion | Mapping[str, PhAdorbGridRegion] | None = None
+) -> PhAdorbVariant:
+    """Load a prepared Variant from a binary file written by 'save_variant'. See: 'decode_variant'."""
+    logger.info(f"Loading the Variant from: {_file_path}")
+    return decode_variant(Path(_file_path).read_bytes(), _grid_region)
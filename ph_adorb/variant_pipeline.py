@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""The Variant ADORB calculation, as a memoized StageGraph.
+
+Use this when the same Variant is re-costed many times with small changes (ie: a new price of
+carbon, or a single changed construction). Only the stages downstream of the changed inputs
+are re-calculated; all other stage results are re-used from the previous runs.
+"""
+
+import numpy as np
+
+from ph_adorb import adorb_cost
+from ph_adorb.cost_ledger import CostLedger
+from ph_adorb.stage_graph import Stage, StageGraph, StageRun
+from ph_adorb.variant import (
+    PhAdorbVariant,
+    calc_annual_hourly_electric_CO2,
+    calc_annual_total_electric_cost,
+    calc_annual_total_gas_CO2,
+    calc_annual_total_gas_cost,
+    calc_CO2_reduction_measures_schedule,
+    calc_constructions_replacement_schedule,
+    calc_equipment_replacement_schedule,
+)
+
+VARIANT_PIPELINE_INPUTS = (
+    "hourly_purchased_electricity_kwh",
+    "total_sold_electricity_kwh",
+    "electricity",
+    "total_purchased_gas_kwh",
+    "gas",
+    "grid_region",
+    "kg_CO2_per_USD",
+    "analysis_duration",
+    "price_of_carbon",
+    "peak_electric_usage_W",
+    "measure_collection",
+    "construction_collection",
+    "equipment_collection",
+)
+
+
+def _electric_cost(_hourly_kwh, _sold_kwh, _electricity) -> float:
+    return calc_annual_total_electric_cost(
+        float(np.sum(_hourly_kwh)),
+        _sold_kwh,
+        _electricity.purchase_price_per_kwh,
+        _electricity.sale_price_per_kwh,
+        _electricity.annual_base_price,
+    )
+
+
+def _gas_cost(_gas_kwh, _gas) -> float:
+    return calc_annual_total_gas_cost(_gas_kwh, _gas.used, _gas.purchase_price_per_kwh, _gas.annual_base_price)
+
+
+def _gas_CO2(_gas_kwh, _gas) -> float:
+    return calc_annual_total_gas_CO2(_gas_kwh, _gas.used)
+
+
+def _cost_ledger(_measures, _constructions, _equipment, _analysis_duration, _kg_CO2_per_USD):
+    """Return the CostLedger of every install. It does not depend on the price of carbon.
+
+    The ledger's 'embodied_CO2_cost' column is left at zero. The price of carbon is applied to the
+    yearly embodied kgCO2 in the (cheap) 'yearly_embodied_CO2_costs' stage instead, so a new price
+    does not re-build the replacement schedules.
+    """
+    return CostLedger.from_schedules(
+        {
+            "CO2 Measures": calc_CO2_reduction_measures_schedule(_measures, _analysis_duration, _kg_CO2_per_USD, 0.0),
+            "Constructions": calc_constructions_replacement_schedule(
+                _constructions, _analysis_duration, _kg_CO2_per_USD, 0.0
+            ),
+            "Equipment": calc_equipment_replacement_schedule(_equipment, _analysis_duration, _kg_CO2_per_USD, 0.0),
+        }
+    )
+
+
+VARIANT_PIPELINE_STAGES = (
+    Stage(
+        "electric_cost",
+        ("hourly_purchased_electricity_kwh", "total_sold_electricity_kwh", "electricity"),
+        _electric_cost,
+    ),
+    Stage("electric_CO2", ("hourly_purchased_electricity_kwh", "grid_region"), calc_annual_hourly_electric_CO2),
+    Stage("gas_cost", ("total_purchased_gas_kwh", "gas"), _gas_cost),
+    Stage("gas_CO2", ("total_purchased_gas_kwh", "gas"), _gas_CO2),
+    Stage(
+        "cost_ledger",
+        (
+            "measure_collection",
+            "construction_collection",
+            "equipment_collection",
+            "analysis_duration",
+            "kg_CO2_per_USD",
+        ),
+        _cost_ledger,
+    ),
+    Stage("yearly_install_costs", ("cost_ledger",), lambda _ledger: _ledger.by_year("install_cost")),
+    Stage("yearly_embodied_kgCO2", ("cost_ledger",), lambda _ledger: _ledger.by_year("embodied_kgCO2")),
+    Stage(
+        "yearly_embodied_CO2_costs",
+        ("yearly_embodied_kgCO2", "price_of_carbon"),
+        lambda _kgCO2, _price_of_carbon: _kgCO2 * _price_of_carbon,
+    ),
+    Stage(
+        "adorb_costs",
+        (
+            "analysis_duration",
+            "electric_cost",
+            "gas_cost",
+            "electric_CO2",
+            "gas_CO2",
+            "yearly_install_costs",
+            "yearly_embodied_CO2_costs",
+            "peak_electric_usage_W",
+            "price_of_carbon",
+        ),
+        adorb_cost.calculate_annual_ADORB_costs_array,
+    ),
+)
+
+
+class PhAdorbVariantPipeline:
+    """A memoized ADORB calculation for repeated runs of (slightly different) Variants.
+
+    The Variant's Grid-Region is identified by the object itself (not its content), so it
+    must not be changed in place between runs. Replace it with a new object instead.
+
+    Usage:
+        >>> pipeline = PhAdorbVariantPipeline()
+        >>> costs = pipeline.run(variant)
+        >>> variant.price_of_carbon = 0.5
+        >>> costs = pipeline.run(variant)  # -- Only re-runs the price-of-carbon stages.
+        >>> print(pipeline.format_timings())
+    """
+
+    def __init__(self, _max_cache_size: int = 8) -> None:
+        self.graph = StageGraph(
+            VARIANT_PIPELINE_STAGES,
+            VARIANT_PIPELINE_INPUTS,
+            _identity_inputs=("grid_region",),
+            _max_cache_size=_max_cache_size,
+        )
+
+    @staticmethod
+    def inputs(_variant: PhAdorbVariant) -> dict:
+        """Return the pipeline's {input-name: value} dict for the Variant."""
+        return {
+            "hourly_purchased_electricity_kwh": _variant.hourly_purchased_electricity_kwh,
+            "total_sold_electricity_kwh": _variant.total_sold_electricity_kwh,
+            "electricity": _variant.electricity,
+            "total_purchased_gas_kwh": _variant.total_purchased_gas_kwh,
+            "gas": _variant.gas,
+            "grid_region": _variant.grid_region,
+            "kg_CO2_per_USD": _variant.national_emissions.kg_CO2_per_USD,
+            "analysis_duration": _variant.analysis_duration,
+            "price_of_carbon": _variant.price_of_carbon,
+            "peak_electric_usage_W": _variant.peak_electric_usage_W,
+            "measure_collection": _variant.all_carbon_measures,
+            "construction_collection": _variant.construction_collection,
+            "equipment_collection": _variant.equipment_collection,
+        }
+
+    def run_stages(self, _variant: PhAdorbVariant) -> dict:
+        """Return the result of every stage for the Variant."""
+        return self.graph.run(self.inputs(_variant))
+
+    def run(self, _variant: PhAdorbVariant) -> np.ndarray:
+        """Return an array (years x adorb_cost.ADORB_COLUMNS) with the Variant's yearly ADORB costs.
+
+        The result is the same as 'variant.calc_variant_yearly_ADORB_costs_array()'.
+        """
+        return self.run_stages(_variant)["adorb_costs"].copy()
+
+    @property
+    def last_run(self) -> list[StageRun]:
+        return self.graph.last_run
+
+    def format_timings(self) -> str:
+        return self.graph.format_timings()
+
+    def clear(self) -> None:
+        self.graph.clear()
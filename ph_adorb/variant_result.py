@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""The yearly ADORB costs of a Variant, with incremental updates for changed items.
+
+The 'pv_direct_MR' and 'pv_embodied_CO2' columns are the sum of the discounted costs of every
+CO2-Measure, Construction and Equipment item. When a single item is added, removed or changed,
+the result is updated by subtracting the old item's discounted costs and adding the new item's,
+rather than re-calculating the whole Variant.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from ph_adorb import adorb_cost
+from ph_adorb.constructions import PhAdorbConstruction
+from ph_adorb.equipment import PhAdorbEquipment
+from ph_adorb.measures import PhAdorbCO2ReductionMeasure
+from ph_adorb.replacement_schedule import ReplacementSchedule, build_one_time_schedule, build_replacement_schedule
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from ph_adorb.variant import PhAdorbVariant
+
+logger = logging.getLogger(__name__)
+
+MR_COLUMN = adorb_cost.ADORB_COLUMNS.index("pv_direct_MR")
+EMBODIED_CO2_COLUMN = adorb_cost.ADORB_COLUMNS.index("pv_embodied_CO2")
+
+
+class ItemDeltaError(Exception):
+    def __init__(self, _msg: str) -> None:
+        self.message = f"ItemDeltaError: {_msg}"
+        super().__init__(self.message)
+
+
+@dataclass(frozen=True)
+class ItemDelta:
+    """A single added (old=None), removed (new=None) or changed CO2-Measure, Construction or Equipment item."""
+
+    old: PhAdorbCO2ReductionMeasure | PhAdorbConstruction | PhAdorbEquipment | None = None
+    new: PhAdorbCO2ReductionMeasure | PhAdorbConstruction | PhAdorbEquipment | None = None
+
+    def __post_init__(self) -> None:
+        if self.old is None and self.new is None:
+            raise ItemDeltaError("A delta needs an old item, a new item, or both.")
+        if self.old is not None and self.new is not None and type(self.old) is not type(self.new):
+            raise ItemDeltaError(f"Cannot change a {type(self.old).__name__} into a {type(self.new).__name__}.")
+
+    @classmethod
+    def added(cls, _item: Any) -> "ItemDelta":
+        return cls(new=_item)
+
+    @classmethod
+    def removed(cls, _item: Any) -> "ItemDelta":
+        return cls(old=_item)
+
+    @classmethod
+    def changed(cls, _old_item: Any, _new_item: Any) -> "ItemDelta":
+        return cls(old=_old_item, new=_new_item)
+
+
+def item_schedule(
+    _item: PhAdorbCO2ReductionMeasure | PhAdorbConstruction | PhAdorbEquipment,
+    _analysis_duration: int,
+    _kg_CO2_per_USD: float,
+    _USD_per_kgCO2: float,
+) -> ReplacementSchedule:
+    """Return the ReplacementSchedule for a single CO2-Measure, Construction or Equipment item."""
+    if isinstance(_item, PhAdorbCO2ReductionMeasure):
+        return build_one_time_schedule(
+            [_item.name],
+            np.array([_item.cost]),
+            np.array([_item.year]),
+            _analysis_duration,
+            _kg_CO2_per_USD,
+            _USD_per_kgCO2,
+        )
+    if isinstance(_item, PhAdorbConstruction):
+        name, cost = _item.display_name, _item.cost
+    elif isinstance(_item, PhAdorbEquipment):
+        name, cost = _item.name, _item.total_cost
+    else:
+        raise ItemDeltaError(f"Unsupported item type: {type(_item).__name__}")
+    return build_replacement_schedule(
+        [name],
+        np.array([cost]),
+        np.array([_item.material_fraction]),
+        np.array([_item.lifetime_years]),
+        _analysis_duration,
+        _kg_CO2_per_USD,
+        _USD_per_kgCO2,
+    )
+
+
+class PhAdorbVariantResult:
+    """The yearly ADORB costs (years x adorb_cost.ADORB_COLUMNS) of a Variant.
+
+    Usage:
+        >>> result = PhAdorbVariantResult.from_variant(variant)
+        >>> result.apply(ItemDelta.changed(old_wall, new_wall))
+        >>> result.total
+    """
+
+    def __init__(
+        self,
+        _yearly_costs: np.ndarray,
+        _analysis_duration: int,
+        _kg_CO2_per_USD: float,
+        _price_of_carbon: float,
+    ) -> None:
+        self._yearly_costs = np.array(_yearly_costs, dtype=float)
+        self.analysis_duration = _analysis_duration
+        self.kg_CO2_per_USD = _kg_CO2_per_USD
+        self.price_of_carbon = _price_of_carbon
+
+    @classmethod
+    def from_variant(cls, _variant: "PhAdorbVariant") -> "PhAdorbVariantResult":
+        """Return the (fully calculated) result for the Variant."""
+        from ph_adorb.variant import calc_variant_yearly_ADORB_costs_array
+
+        return cls(
+            calc_variant_yearly_ADORB_costs_array(_variant),
+            _variant.analysis_duration,
+            _variant.national_emissions.kg_CO2_per_USD,
+            _variant.price_of_carbon,
+        )
+
+    @property
+    def yearly_costs(self) -> np.ndarray:
+        """A read-only view of the yearly ADORB costs array (years x adorb_cost.ADORB_COLUMNS)."""
+        view_ = self._yearly_costs.view()
+        view_.flags.writeable = False
+        return view_
+
+    @property
+    def total(self) -> float:
+        """The total ADORB cost, summed over all the years and columns."""
+        return float(self._yearly_costs.sum())
+
+    def item_columns(self, _item: Any) -> np.ndarray:
+        """Return the item's discounted 'pv_direct_MR' and 'pv_embodied_CO2' columns (years x 2)."""
+        schedule = item_schedule(_item, self.analysis_duration, self.kg_CO2_per_USD, self.price_of_carbon)
+        return adorb_cost.install_ADORB_columns(
+            self.analysis_duration, schedule.yearly_install_costs, schedule.yearly_embodied_CO2_costs
+        )
+
+    def apply(self, _delta: ItemDelta) -> None:
+        """Update the yearly costs in place for a single added, removed or changed item."""
+        logger.debug(f"PhAdorbVariantResult.apply(old={_delta.old}, new={_delta.new})")
+
+        columns = [MR_COLUMN, EMBODIED_CO2_COLUMN]
+        if _delta.old is not None:
+            self._yearly_costs[:, columns] -= self.item_columns(_delta.old)
+        if _delta.new is not None:
+            self._yearly_costs[:, columns] += self.item_columns(_delta.new)
+
+    def to_DataFrame(self) -> "pd.DataFrame":
+        return adorb_cost.ADORB_costs_array_to_DataFrame(self._yearly_costs.copy())
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""A pydantic model which records a new version number every time one of its fields is set.
+
+The model can also be made read-only while it is shared by more than one (copy-on-write) collection.
+"""
+
+from itertools import count
+from typing import Any
+
+from pydantic import BaseModel, PrivateAttr
+
+# -- Shared by all models, so that a version number is never re-used.
+_VERSIONS = count(1)
+
+
+class SharedModelError(Exception):
+    def __init__(self, _model: BaseModel, _name: str) -> None:
+        self.message = (
+            f"SharedModelError: Cannot set '{_name}' of the {type(_model).__name__}, it is shared by more than one "
+            "collection (ie: after a Variant.clone()). Get it again from its collection (ie: .get_construction()) "
+            "to edit it."
+        )
+        super().__init__(self.message)
+
+
+class VersionedModel(BaseModel):
+    """A model with a '.version' which changes each time any of its fields is set in place.
+
+    Collections which cache a view of their items (ie: the columnar NumPy arrays) keep the
+    versions the view was built from, and rebuild it if any item has been edited since.
+    """
+
+    _version: int = PrivateAttr(default=0)
+    _shared: bool = PrivateAttr(default=False)
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def shared(self) -> bool:
+        """True if the model is shared by more than one collection, and so is read-only. Its copies are not shared."""
+        return self._shared
+
+    def set_shared(self) -> None:
+        """Make the model read-only, as it is now shared by more than one (copy-on-write) collection."""
+        super().__setattr__("_shared", True)
+
+    def copy(self, **_kwargs: Any) -> Any:
+        """Return a copy (with the same version, unless any fields are updated) which is not shared."""
+        copy_ = super().copy(**_kwargs)
+        BaseModel.__setattr__(copy_, "_shared", False)
+        if _kwargs.get("update"):
+            BaseModel.__setattr__(copy_, "_version", next(_VERSIONS))
+        return copy_
+
+    def __setattr__(self, _name: str, _value: Any) -> None:
+        if self._shared and _name in self.__fields__:
+            raise SharedModelError(self, _name)
+        super().__setattr__(_name, _value)
+        if _name in self.__fields__:
+            super().__setattr__("_version", next(_VERSIONS))
@@ -1,12 +1,26 @@
 # -*- coding: utf-8 -*-
 # -*- Python Version: 3.10 -*-
 
-"""A simple 'YearlyCost object to store annual costs."""
+"""A simple 'YearlyCost object to store annual costs.
 
+The records are slotted and frozen (hashable) so that the many thousands created in large
+batch runs stay small. Use the 'from_arrays' constructors to build many records at once; the
+description strings are interned so repeated descriptions share a single string object.
+"""
+
+import sys
 from dataclasses import dataclass
+from typing import Iterable
+
+
+def _interned(_descriptions: Iterable[str] | str, _count: int) -> list[str]:
+    """Return a list of interned description strings (a single str is repeated for every record)."""
+    if isinstance(_descriptions, str):
+        return [sys.intern(_descriptions)] * _count
+    return [sys.intern(str(d)) for d in _descriptions]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class YearlyCost:
     """A single Yearly Cost for a building design."""
 
@@ -17,8 +31,16 @@ class YearlyCost:
     def __repr__(self) -> str:
         return f"YearlyCost(cost={self.cost :.1f}, year={self.year}, description={self.description})"
 
+    @classmethod
+    def from_arrays(
+        cls, _costs: Iterable[float], _years: Iterable[int], _descriptions: Iterable[str] | str = ""
+    ) -> list["YearlyCost"]:
+        """Return a list of YearlyCost records built from the parallel arrays of costs, years and descriptions."""
+        costs, years = [float(c) for c in _costs], [int(y) for y in _years]
+        return [cls(c, y, d) for c, y, d in zip(costs, years, _interned(_descriptions, len(costs)))]
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class YearlyKgCO2:
     """A single Yearly CO2 Emissions for a building design"""
 
@@ -29,8 +51,16 @@ class YearlyKgCO2:
     def __repr__(self) -> str:
         return f"YearlyKgCO2(kg_CO2={self.kg_CO2 :.1f}, year={self.year}, description={self.description})"
 
+    @classmethod
+    def from_arrays(
+        cls, _kg_CO2s: Iterable[float], _years: Iterable[int], _descriptions: Iterable[str] | str = ""
+    ) -> list["YearlyKgCO2"]:
+        """Return a list of YearlyKgCO2 records built from the parallel arrays of kgCO2, years and descriptions."""
+        kg_CO2s, years = [float(c) for c in _kg_CO2s], [int(y) for y in _years]
+        return [cls(c, y, d) for c, y, d in zip(kg_CO2s, years, _interned(_descriptions, len(kg_CO2s)))]
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class YearlyPresentValueFactor:
     """A single Yearly Present Value Factor for a building design."""
 
@@ -39,3 +69,8 @@ class YearlyPresentValueFactor:
 
     def __repr__(self) -> str:
         return f"YearlyPresentValueFactor(pv_factor={self.factor :.3f}, year={self.year})"
+
+    @classmethod
+    def from_arrays(cls, _factors: Iterable[float], _years: Iterable[int]) -> list["YearlyPresentValueFactor"]:
+        """Return a list of YearlyPresentValueFactor records built from the parallel arrays of factors and years."""
+        return [cls(float(f), int(y)) for f, y in zip(_factors, _years)]
@@ -1,13 +1,17 @@
 from pytest import approx
 
 from ph_adorb.adorb_cost import (
-    present_value_factor,
+    ADORB_COLUMNS,
+    calculate_annual_ADORB_costs,
+    calculate_annual_ADORB_costs_array,
+    energy_CO2_cost_PV,
     energy_purchase_cost_PV,
-    measure_CO2_cost_PV,
     grid_transition_cost_PV,
+    measure_CO2_cost_PV,
     measure_purchase_cost_PV,
-    energy_CO2_cost_PV,
-    calculate_annual_ADORB_costs,
+    present_value_factor,
+    present_value_factors,
+    sum_yearly_costs_by_year,
 )
 from ph_adorb.variant import YearlyCost
 
@@ -262,3 +266,32 @@ def test_pv_grid_transition_cost():
     assert grid_transition_cost_PV(present_value_factor(0, 0.02), 0) == 0
     assert grid_transition_cost_PV(present_value_factor(1, 0.02), 1) == approx(0.09010957324106113)
     assert grid_transition_cost_PV(present_value_factor(-1, 0.02), 1) == 0.09375
+
+
+def test_present_value_factors():
+    factors = present_value_factors(16, 0.02)
+    assert len(factors) == 16
+    assert factors[0] == approx(present_value_factor(0, 0.02).factor)
+    assert factors[15] == approx(present_value_factor(15, 0.02).factor)
+
+
+def test_sum_yearly_costs_by_year():
+    costs = [YearlyCost(1, 0), YearlyCost(2, 0), YearlyCost(3, 2), YearlyCost(4, 5)]
+    assert sum_yearly_costs_by_year(costs, 3).tolist() == [3.0, 0.0, 3.0]
+
+
+def test_adorb_cost_array_matches_DataFrame():
+    result = calculate_annual_ADORB_costs_array(
+        50,
+        phius_gui_annual_total_cost_electric,
+        phius_gui_annual_total_cost_gas,
+        phius_gui_annual_hourly_CO2_electric,
+        phius_gui_annual_total_CO2_gas,
+        sum_yearly_costs_by_year(phius_gui_all_yearly_install_costs, 50),
+        sum_yearly_costs_by_year(phius_gui_all_yearly_embodied_kgCO2, 50),
+        phius_gui_grid_transition_cost,
+        0.25,
+    )
+    assert result.shape == (50, len(ADORB_COLUMNS))
+    assert result[:, ADORB_COLUMNS.index("pv_direct_MR")].sum() == approx(73_733.73329487)
+    assert result[:, ADORB_COLUMNS.index("pv_e_trans")].sum() == approx(6_319.495880549157)
@@ -1,6 +1,8 @@
 from copy import copy
 from pathlib import Path
 
+import numpy as np
+import pytest
 from pytest import approx
 
 from ph_adorb.constructions import (
@@ -193,6 +195,138 @@ def test_set_construction_f2_quantities():
     assert collection.get_construction("Test Construction 2").area_m2 == approx(100.0)
 
 
+def test_construction_collection_sorted_after_set_quantities():
+    collection = PhAdorbConstructionCollection()
+    for name in ["B", "A"]:
+        collection.add_construction(
+            PhAdorbConstruction(
+                display_name=name,
+                identifier=name,
+                CO2_kg_per_m2=100,
+                cost_per_m2=1000,
+                lifetime_years=30,
+                labor_fraction=0.4,
+            )
+        )
+    assert collection.keys() == ["A", "B"]
+
+    collection.set_constructions_ft2_quantities({"A": 10.7639, "B": 21.5278})
+    assert [c.area_m2 for c in collection] == [approx(1.0), approx(2.0)]
+
+
+def test_construction_collection_arrays():
+    collection = PhAdorbConstructionCollection()
+    for name, area in [("B", 2.0), ("A", 1.0)]:
+        collection.add_construction(
+            PhAdorbConstruction(
+                display_name=name,
+                identifier=name,
+                CO2_kg_per_m2=100,
+                cost_per_m2=1000,
+                lifetime_years=30,
+                labor_fraction=0.4,
+                area_m2=area,
+            )
+        )
+    arrays = collection.to_arrays()
+    assert arrays.names == ("A", "B")
+    assert list(arrays.cost) == [c.cost for c in collection]
+    assert list(arrays.CO2_kg) == [c.CO2_kg for c in collection]
+    assert list(arrays.material_fraction) == approx([0.6, 0.6])
+    assert collection.total_cost == approx(3000.0)
+    assert collection.total_CO2_kg == approx(300.0)
+    assert collection.to_arrays() is arrays
+
+    collection.set_constructions_ft2_quantities({"A": 10.7639, "B": 10.7639})
+    assert collection.to_arrays() is not arrays
+    assert collection.total_cost == approx(2000.0)
+
+
+def test_construction_collection_arrays_follow_item_edits():
+    collection = PhAdorbConstructionCollection()
+    collection.add_construction(
+        PhAdorbConstruction(
+            display_name="Wall",
+            identifier="Wall",
+            CO2_kg_per_m2=100,
+            cost_per_m2=1000,
+            lifetime_years=30,
+            labor_fraction=0.4,
+            area_m2=1.0,
+        )
+    )
+    assert collection.total_cost == approx(1000.0)
+
+    wall = collection.get_construction("Wall")
+    wall.cost_per_m2 = 50.0
+    wall.set_quantity_ft2(10.7639 * 4)
+    wall.lifetime_years = 25
+    arrays = collection.to_arrays()
+    assert list(arrays.cost_per_m2) == [50.0]
+    assert list(arrays.area_m2) == [approx(4.0)]
+    assert list(arrays.lifetime_years) == [25]
+    assert collection.total_cost == approx(200.0)
+    assert collection.to_arrays() is arrays
+
+    # -- A duplicate shares the arrays until one of its own Constructions is edited
+    duplicate = collection.duplicate()
+    assert duplicate.to_arrays() is arrays
+    duplicate.get_construction("Wall").area_m2 = 1.0
+    assert duplicate.total_cost == approx(50.0)
+    assert collection.total_cost == approx(200.0)
+
+
+def test_set_construction_quantities_in_place():
+    collection = PhAdorbConstructionCollection()
+    for name in ["Wall A", "Roof"]:
+        collection.add_construction(
+            PhAdorbConstruction(
+                display_name=name,
+                identifier=name,
+                CO2_kg_per_m2=100,
+                cost_per_m2=1000,
+                lifetime_years=30,
+                labor_fraction=0.4,
+            )
+        )
+    roof = collection.get_construction("Roof")
+    collection.to_arrays()
+
+    collection.set_constructions_ft2_quantities({"WALL_A": 10.7639, "roof": 21.5278})
+    assert collection.get_construction("Roof") is roof
+    assert roof.area_m2 == approx(2.0)
+    assert list(collection.to_arrays().area_m2) == [approx(2.0), approx(1.0)]
+
+    collection.set_areas_m2(np.array([5.0, 6.0]))
+    assert roof.area_m2 == 5.0
+    assert collection.get_construction("Wall A").area_m2 == 6.0
+    assert collection.total_cost == approx(11_000.0)
+
+    with pytest.raises(ValueError):
+        collection.set_areas_m2([1.0])
+
+
+def test_set_construction_quantities_with_matching_normalized_names():
+    collection = PhAdorbConstructionCollection()
+    for name in ["Wall A", "WALL_A", "Roof"]:
+        collection.add_construction(
+            PhAdorbConstruction(
+                display_name=name,
+                identifier=name,
+                CO2_kg_per_m2=100,
+                cost_per_m2=1000,
+                lifetime_years=30,
+                labor_fraction=0.4,
+            )
+        )
+
+    collection.set_constructions_ft2_quantities({"wall a": 10.7639, "Roof": 21.5278})
+    assert collection.get_construction("Wall A").area_m2 == approx(1.0)
+    assert collection.get_construction("WALL_A").area_m2 == approx(1.0)
+    assert collection.get_construction("Roof").area_m2 == approx(2.0)
+    assert collection.total_cost == approx(4000.0)
+
+
 def test_constructions_json_file():
     # -- Create a temp JSON file with some constructions
     c1 = PhAdorbConstruction(
@@ -224,3 +358,30 @@ def test_constructions_json_file():
 
     # -- Clean up
     file_path.unlink()
+
+
+def test_construction_collection_share():
+    collection = PhAdorbConstructionCollection()
+    collection.add_construction(
+        PhAdorbConstruction(
+            display_name="Wall",
+            identifier="Wall",
+            CO2_kg_per_m2=100,
+            cost_per_m2=1000,
+            lifetime_years=30,
+            labor_fraction=0.4,
+            area_m2=1.0,
+        )
+    )
+    shared = collection.share()
+    assert shared.values()[0] is collection.values()[0]
+    assert shared.values()[0].shared
+
+    shared.set_constructions_ft2_quantities({"Wall": 10.7639 * 2})
+    assert shared.total_cost == approx(2000.0)
+    assert collection.total_cost == approx(1000.0)
+    assert not shared.get_construction("Wall").shared
+
+    # -- Adding to the original does not add to the shared collection
+    collection.add_construction(collection.get_construction("Wall").copy(update={"display_name": "Roof"}))
+    assert len(collection) == 2 and len(shared) == 1
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+from pytest import approx
+
+from ph_adorb.cost_ledger import CostLedger
+from ph_adorb.replacement_schedule import (
+    build_one_time_schedule,
+    build_replacement_schedule,
+)
+
+
+def _example_ledger() -> CostLedger:
+    return CostLedger.from_schedules(
+        {
+            "CO2 Measures": build_one_time_schedule(["M1"], np.array([500.0]), np.array([5]), 50, 1.0, 0.25),
+            "Constructions": build_replacement_schedule(
+                ["Wall", "Roof"], np.array([1000.0, 2000.0]), np.array([0.5, 0.5]), np.array([20, 50]), 50, 1.0, 0.25
+            ),
+        }
+    )
+
+
+def test_cost_ledger_from_schedules():
+    ledger = _example_ledger()
+    assert len(ledger) == 6
+    assert ledger.categories == ("CO2 Measures", "Constructions")
+    assert ledger.items == ("M1", "Wall", "Roof")
+
+
+def test_cost_ledger_by_year():
+    by_year = _example_ledger().by_year("install_cost")
+    assert by_year.shape == (50,)
+    assert by_year[0] == approx(3000.0)
+    assert by_year[5] == approx(500.0)
+    assert by_year[20] == approx(1000.0)
+    assert by_year.sum() == approx(5500.0)  # -- Roof year-50 replacement is outside the analysis
+
+
+def test_cost_ledger_by_item_and_category():
+    ledger = _example_ledger()
+    assert ledger.by_item("install_cost") == {"M1": 500.0, "Wall": 3000.0, "Roof": 4000.0}
+    assert ledger.by_category("embodied_kgCO2") == {"CO2 Measures": 500.0, "Constructions": 3500.0}
+
+
+def test_cost_ledger_by_item_and_year():
+    years, totals = _example_ledger().by_item_and_year("install_cost")
+    assert years.tolist() == [0, 5, 20, 40, 50]
+    assert totals[2].tolist() == [2000.0, 0.0, 0.0, 0.0, 2000.0]
+
+
+def test_cost_ledger_unknown_column():
+    with pytest.raises(ValueError):
+        _example_ledger().by_year("not_a_column")
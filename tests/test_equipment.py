@@ -62,7 +62,7 @@ def test_equipment_to_json():
     json_str = equip.json()
     assert (
         json_str
-        == '{"name": "Test Equipment", "equipment_type": "Mechanical", "cost": 1000.0, "lifetime_years": 10, "labor_fraction": 0.2}'
+        == '{"name": "Test Equipment", "equipment_type": "Mechanical", "cost": 1000.0, "lifetime_years": 10, "labor_fraction": 0.2, "quantity": 1}'
     )
 
 
@@ -77,6 +77,40 @@ def test_equipment_from_json():
     assert equip.material_fraction == 0.8
 
 
+def test_equipment_total_cost():
+    equip = PhAdorbEquipment(
+        name="Test Equipment",
+        equipment_type=PhAdorbEquipmentType.MECHANICAL,
+        cost=1000.0,
+        lifetime_years=10,
+        labor_fraction=0.2,
+        quantity=3,
+    )
+    assert equip.total_cost == 3000.0
+    assert equip.duplicate().quantity == 3
+
+
+def test_EquipmentCollection_combines_identical_equipment():
+    equip1 = PhAdorbEquipment(
+        name="Test Lights",
+        equipment_type=PhAdorbEquipmentType.LIGHTS,
+        cost=2000.0,
+        lifetime_years=20,
+        labor_fraction=0.3,
+    )
+    equip_collection = PhAdorbEquipmentCollection()
+    equip_collection.add_equipment(equip1)
+    equip_collection.add_equipment(equip1.duplicate())
+    assert len(equip_collection) == 1
+    assert equip_collection.get_equipment("Test Lights").quantity == 2
+    assert equip1.quantity == 1
+
+    # -- A different definition with the same name still replaces the original
+    equip_collection.add_equipment(equip1.copy(update={"cost": 10.0}))
+    assert equip_collection.get_equipment("Test Lights").quantity == 1
+    assert equip_collection.get_equipment("Test Lights").cost == 10.0
+
+
 def test_EquipmentCollection():
     equip1 = PhAdorbEquipment(
         name="Test Mechanical",
@@ -130,6 +164,63 @@ def test_EquipmentCollection():
         assert isinstance(equip, PhAdorbEquipment)
 
 
+def test_EquipmentCollection_arrays():
+    collection = PhAdorbEquipmentCollection()
+    collection.add_equipment(
+        PhAdorbEquipment(
+            name="B",
+            equipment_type=PhAdorbEquipmentType.LIGHTS,
+            cost=100,
+            lifetime_years=10,
+            labor_fraction=0.5,
+            quantity=2,
+        )
+    )
+    arrays = collection.to_arrays()
+    assert arrays.names == ("B",)
+    assert list(arrays.total_cost) == [200]
+    assert collection.total_cost == 200
+
+    collection.add_equipment(
+        PhAdorbEquipment(
+            name="A",
+            equipment_type=PhAdorbEquipmentType.APPLIANCE,
+            cost=1000,
+            lifetime_years=20,
+            labor_fraction=0.2,
+        )
+    )
+    arrays = collection.to_arrays()
+    assert arrays.names == ("A", "B")
+    assert list(arrays.lifetime_years) == [20, 10]
+    assert collection.total_cost == 1200
+
+
+def test_EquipmentCollection_arrays_follow_item_edits():
+    collection = PhAdorbEquipmentCollection()
+    collection.add_equipment(
+        PhAdorbEquipment(
+            name="Fridge",
+            equipment_type=PhAdorbEquipmentType.APPLIANCE,
+            cost=1000,
+            lifetime_years=20,
+            labor_fraction=0.2,
+        )
+    )
+    assert collection.total_cost == 1000
+
+    fridge = collection.get_equipment("Fridge")
+    fridge.cost = 800.0
+    fridge.quantity = 3
+    fridge.lifetime_years = 15
+    arrays = collection.to_arrays()
+    assert list(arrays.cost) == [800.0]
+    assert list(arrays.quantity) == [3]
+    assert list(arrays.lifetime_years) == [15]
+    assert collection.total_cost == 2400
+    assert collection.to_arrays() is arrays
+
+
 def test_equipment_json_file():
     equip1 = PhAdorbEquipment(
         name="Test Mechanical",
@@ -165,3 +256,23 @@ def test_equipment_json_file():
 
     # -- Cleanup
     file_path.unlink()
+
+
+def test_EquipmentCollection_share():
+    collection = PhAdorbEquipmentCollection()
+    collection.add_equipment(
+        PhAdorbEquipment(
+            name="Fridge",
+            equipment_type=PhAdorbEquipmentType.APPLIANCE,
+            cost=1000,
+            lifetime_years=20,
+            labor_fraction=0.2,
+        )
+    )
+    shared = collection.share()
+    assert shared.values()[0] is collection.values()[0]
+
+    shared.add_equipment(shared.values()[0].duplicate())
+    assert shared.get_equipment("Fridge").quantity == 2
+    assert collection.get_equipment("Fridge").quantity == 1
+    assert collection.total_cost == 1000 and shared.total_cost == 2000
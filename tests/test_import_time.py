@@ -0,0 +1,46 @@
+import json
+import subprocess
+import sys
+
+# -- Generous upper limit on the import-time (seconds) to catch large regressions, not to benchmark.
+IMPORT_TIME_BUDGET_SECONDS = 5.0
+
+IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import ph_adorb.variant
+import ph_adorb.from_HBJSON.create_variant
+import ph_adorb.from_HBJSON.read_HBJSON_file
+import ph_adorb.from_HBJSON.model_geometry
+elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+CORE_IMPORT_SCRIPT = """
+import json, sys
+import ph_adorb.adorb_cost
+import ph_adorb.variant
+print(json.dumps({"modules": sorted(sys.modules)}))
+"""
+
+
+def _run_import_script(_script: str = IMPORT_SCRIPT) -> dict:
+    result = subprocess.run([sys.executable, "-c", _script], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+def test_honeybee_not_imported_on_startup():
+    modules = _run_import_script()["modules"]
+    for package_name in ["honeybee", "honeybee_energy", "honeybee_energy_revive", "honeybee_revive"]:
+        assert package_name not in modules
+
+
+def test_import_time_budget():
+    assert _run_import_script()["elapsed"] < IMPORT_TIME_BUDGET_SECONDS
+
+
+def test_core_cost_engine_does_not_import_pandas_or_rich():
+    modules = _run_import_script(CORE_IMPORT_SCRIPT)["modules"]
+    for package_name in ["pandas", "rich", "ph_units"]:
+        assert package_name not in modules
@@ -0,0 +1,144 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from ph_adorb.install_year import (
+    InstallYearError,
+    InstallYearFactors,
+    MeasureTiming,
+    measure_install_year_costs,
+    optimize_install_years,
+)
+from ph_adorb.measures import CO2MeasureType, PhAdorbCO2ReductionMeasure
+from ph_adorb.variant import PhAdorbVariant, calc_variant_yearly_ADORB_costs_array
+from tests.variant_factory import HOURS_PER_YEAR, example_variant_fields
+
+
+def _measure(_name: str, _cost: float, _year: int = 0) -> PhAdorbCO2ReductionMeasure:
+    return PhAdorbCO2ReductionMeasure(
+        measure_type=CO2MeasureType.PERFORMANCE,
+        name=_name,
+        year=_year,
+        cost=_cost,
+        kg_CO2=None,
+        country_name="USA",
+        labor_fraction=0.5,
+    )
+
+
+@pytest.fixture(scope="module")
+def variant() -> PhAdorbVariant:
+    return PhAdorbVariant.from_trusted(**example_variant_fields(_grid_region_years=51))
+
+
+def _with_measures(_variant: PhAdorbVariant, _measures: list[PhAdorbCO2ReductionMeasure]) -> PhAdorbVariant:
+    variant = _variant.clone()
+    for measure in _measures:
+        variant.measure_collection.add_measure(measure)
+    return variant
+
+
+def test_install_costs_match_the_full_calculation(variant):
+    base = calc_variant_yearly_ADORB_costs_array(variant)
+    costs = measure_install_year_costs(variant, MeasureTiming(_measure("Roof", 25_000.0)))
+    for year in (0, 7, 30):
+        full = calc_variant_yearly_ADORB_costs_array(_with_measures(variant, [_measure("Roof", 25_000.0, year)]))
+        np.testing.assert_allclose(costs[year], full - base, atol=1e-9)
+
+
+def test_savings_match_the_full_calculation(variant):
+    hourly_savings = np.full(HOURS_PER_YEAR, 0.2)
+    timing = MeasureTiming(_measure("HP", 0.0), hourly_savings, gas_kwh_savings=1_500.0)
+    costs = measure_install_year_costs(variant, timing)
+
+    saving = variant.clone(
+        hourly_purchased_electricity_kwh=np.asarray(variant.hourly_purchased_electricity_kwh) - hourly_savings,
+        total_purchased_gas_kwh=variant.total_purchased_gas_kwh - 1_500.0,
+    )
+    expected = calc_variant_yearly_ADORB_costs_array(saving) - calc_variant_yearly_ADORB_costs_array(variant)
+    np.testing.assert_allclose(costs[0], expected, atol=1e-9)
+
+    # -- Installed later, there are no savings before the install year
+    assert np.all(costs[12, :12, :2] == 0.0)
+    np.testing.assert_allclose(costs[12, 12:, :2], expected[12:, :2])
+
+
+def test_measure_without_savings_is_installed_as_late_as_allowed(variant):
+    plan = optimize_install_years(variant, [MeasureTiming(_measure("Roof", 25_000.0), latest_year=10)])
+    assert plan.years == {"Roof": 10}
+    assert plan.yearly_install_costs[10] == 25_000.0
+
+
+def test_plan_total_matches_the_rescheduled_variant(variant):
+    timings = [
+        MeasureTiming(_measure("Roof", 25_000.0, 3), earliest_year=2, latest_year=20),
+        MeasureTiming(_measure("Window", 40_000.0, 3), latest_year=15),
+    ]
+    existing = _with_measures(variant, [t.measure for t in timings])
+    plan = optimize_install_years(existing, timings)
+
+    rescheduled = _with_measures(variant, plan.measures(timings))
+    expected = calc_variant_yearly_ADORB_costs_array(rescheduled)
+    np.testing.assert_allclose(plan.yearly_costs, expected, atol=1e-9)
+    assert plan.total_ADORB == pytest.approx(expected.sum())
+
+
+def test_early_savings_pull_the_install_year_forward(variant):
+    timing = MeasureTiming(_measure("HP", 5_000.0), np.full(HOURS_PER_YEAR, 0.5), gas_kwh_savings=5_000.0)
+    plan = optimize_install_years(variant, [timing])
+    assert plan.years == {"HP": 0}
+
+
+def test_budgets_match_brute_force(variant):
+    rng = np.random.default_rng(3)
+    timings = [
+        MeasureTiming(
+            _measure(f"Measure {i}", float(rng.uniform(5_000, 20_000))),
+            np.full(HOURS_PER_YEAR, float(rng.uniform(0.0, 0.3))),
+            gas_kwh_savings=float(rng.uniform(0, 2_000)),
+            earliest_year=int(rng.integers(0, 3)),
+            latest_year=int(rng.integers(3, 6)),
+        )
+        for i in range(4)
+    ]
+    budgets = {year: 22_000.0 for year in range(6)}
+    plan = optimize_install_years(variant, timings, budgets)
+
+    totals = [measure_install_year_costs(variant, t).sum(axis=(1, 2)) for t in timings]
+    best = np.inf
+    for years in itertools.product(*(range(t.earliest_year, t.latest_year + 1) for t in timings)):
+        spent = np.zeros(6)
+        for t, year in zip(timings, years):
+            spent[year] += t.measure.cost
+        if np.all(spent <= 22_000.0):
+            best = min(best, sum(total[year] for total, year in zip(totals, years)))
+
+    base = calc_variant_yearly_ADORB_costs_array(variant).sum()
+    assert plan.total_ADORB == pytest.approx(base + best)
+    assert np.all(plan.yearly_install_costs[:6] <= 22_000.0)
+
+
+def test_shared_factors_match_the_per_measure_factors(variant):
+    timing = MeasureTiming(_measure("HP", 5_000.0), np.full(HOURS_PER_YEAR, 0.5), gas_kwh_savings=5_000.0)
+    factors = InstallYearFactors.from_variant(variant)
+    np.testing.assert_array_equal(
+        measure_install_year_costs(variant, timing, factors), measure_install_year_costs(variant, timing)
+    )
+
+
+def test_infeasible_budgets_raise(variant):
+    timings = [MeasureTiming(_measure("Roof", 25_000.0), latest_year=1)]
+    with pytest.raises(InstallYearError):
+        optimize_install_years(variant, timings, {0: 10_000.0, 1: 10_000.0})
+
+
+def test_duplicate_measure_names_raise(variant):
+    timings = [MeasureTiming(_measure("Roof", 25_000.0)), MeasureTiming(_measure("Roof", 10_000.0))]
+    with pytest.raises(InstallYearError):
+        optimize_install_years(variant, timings)
+
+
+def test_empty_window_raises(variant):
+    with pytest.raises(InstallYearError):
+        optimize_install_years(variant, [MeasureTiming(_measure("Roof", 1.0), earliest_year=60)])
@@ -0,0 +1,108 @@
+import json
+import pickle
+import stat
+import tempfile
+
+import numpy as np
+import pytest
+
+from ph_adorb.equipment import (
+    PhAdorbEquipment,
+    PhAdorbEquipmentType,
+    load_equipment_from_json_file,
+    write_equipment_to_json_file,
+)
+from ph_adorb.library import (
+    DEFAULT_LIBRARY_CACHE_DIR,
+    LibraryValidationError,
+    publish_json_library,
+    validate_json_library,
+)
+
+
+def _write_equipment_library(_file_path):
+    equipment = [
+        PhAdorbEquipment(
+            name=f"Equip {i}",
+            equipment_type=PhAdorbEquipmentType.MECHANICAL,
+            cost=1000.0 * i,
+            lifetime_years=10 + i,
+            labor_fraction=0.2,
+        )
+        for i in range(3)
+    ]
+    write_equipment_to_json_file(_file_path, {_.name: _ for _ in equipment})
+    return equipment
+
+
+def test_trusted_load_matches_validated_load(tmp_path):
+    file_path = tmp_path / "equipment.json"
+    equipment = _write_equipment_library(file_path)
+
+    trusted = load_equipment_from_json_file(file_path, _trusted=True, _cache_dir=None)
+    assert trusted == load_equipment_from_json_file(file_path)
+    assert list(trusted.values()) == equipment
+    assert trusted["Equip 1"].equipment_type is PhAdorbEquipmentType.MECHANICAL
+
+
+def test_trusted_load_uses_the_cache(tmp_path):
+    file_path = tmp_path / "equipment.json"
+    cache_dir = tmp_path / "cache"
+    _write_equipment_library(file_path)
+
+    first = load_equipment_from_json_file(file_path, _trusted=True, _cache_dir=cache_dir)
+    assert len(list(cache_dir.iterdir())) == 1
+    assert load_equipment_from_json_file(file_path, _trusted=True, _cache_dir=cache_dir) == first
+
+    # -- A changed library file gets a new cache entry
+    data = json.loads(file_path.read_text())
+    data[0]["cost"] = 99.0
+    file_path.write_text(json.dumps(data))
+    changed = load_equipment_from_json_file(file_path, _trusted=True, _cache_dir=cache_dir)
+    assert changed["Equip 0"].cost == 99.0
+    assert len(list(cache_dir.iterdir())) == 2
+
+
+def test_validate_json_library_reports_all_errors(tmp_path):
+    file_path = tmp_path / "equipment.json"
+    _write_equipment_library(file_path)
+    data = json.loads(file_path.read_text())
+    data[0]["cost"] = "not-a-number"
+    data[2]["equipment_type"] = "Not-A-Type"
+    file_path.write_text(json.dumps(data))
+
+    with pytest.raises(LibraryValidationError) as e:
+        validate_json_library(file_path, PhAdorbEquipment)
+    assert len(e.value.errors) == 2
+
+
+def test_publish_json_library(tmp_path):
+    source_path = tmp_path / "source.json"
+    target_path = tmp_path / "published.json"
+    equipment = _write_equipment_library(source_path)
+
+    published = publish_json_library(source_path, target_path, PhAdorbEquipment, "name", tmp_path / "cache")
+    assert list(published.values()) == equipment
+    assert load_equipment_from_json_file(target_path) == published
+
+
+def test_library_cache_is_private_and_cannot_run_code(tmp_path):
+    file_path = tmp_path / "equipment.json"
+    cache_dir = tmp_path / "cache"
+    _write_equipment_library(file_path)
+    load_equipment_from_json_file(file_path, _trusted=True, _cache_dir=cache_dir)
+
+    assert stat.S_IMODE(cache_dir.stat().st_mode) == 0o700
+    (cache_file,) = cache_dir.iterdir()
+    assert cache_file.suffix == ".npz"
+    with np.load(cache_file, allow_pickle=False) as npz:
+        assert list(npz["items.name"]) == ["Equip 0", "Equip 1", "Equip 2"]
+
+    # -- A pickle planted under the cache file's name is never un-pickled, only ignored
+    cache_file.write_bytes(pickle.dumps({"Equip 0": "planted"}))
+    reloaded = load_equipment_from_json_file(file_path, _trusted=True, _cache_dir=cache_dir)
+    assert reloaded == load_equipment_from_json_file(file_path)
+
+
+def test_default_library_cache_dir_is_per_user():
+    assert not DEFAULT_LIBRARY_CACHE_DIR.is_relative_to(tempfile.gettempdir())
@@ -0,0 +1,71 @@
+import pytest
+
+from ph_adorb.equipment import (
+    PhAdorbEquipment,
+    PhAdorbEquipmentType,
+    write_equipment_to_json_file,
+)
+from ph_adorb.library_store import PhAdorbLibraryStore, UnknownLibraryKindError
+from ph_adorb.measures import CO2MeasureType, PhAdorbCO2ReductionMeasure
+
+
+def _equipment() -> list[PhAdorbEquipment]:
+    return [
+        PhAdorbEquipment(
+            name=f"Equip {i}",
+            equipment_type=PhAdorbEquipmentType.LIGHTS if i % 2 else PhAdorbEquipmentType.MECHANICAL,
+            cost=100.0 * i,
+            lifetime_years=10,
+            labor_fraction=0.2,
+        )
+        for i in range(6)
+    ]
+
+
+def test_library_store_insert_from_json_file(tmp_path):
+    file_path = tmp_path / "equipment.json"
+    write_equipment_to_json_file(file_path, {_.name: _ for _ in _equipment()})
+
+    with PhAdorbLibraryStore(tmp_path / "library.sqlite") as store:
+        assert store.insert_from_json_file("equipment", file_path) == 6
+
+    # -- Re-open the saved store
+    with PhAdorbLibraryStore(tmp_path / "library.sqlite") as store:
+        assert store.count("equipment") == 6
+        assert store.get("equipment", "Equip 3") == _equipment()[3]
+
+
+def test_library_store_query():
+    with PhAdorbLibraryStore() as store:
+        store.insert("equipment", _equipment())
+        store.insert(
+            "co2_measure",
+            [
+                PhAdorbCO2ReductionMeasure(
+                    measure_type=CO2MeasureType.PERFORMANCE,
+                    name=f"Measure {country}",
+                    year=5,
+                    cost=1000,
+                    kg_CO2=None,
+                    country_name=country,
+                    labor_fraction=0.4,
+                )
+                for country in ["USA", "DE"]
+            ],
+        )
+
+        lights = store.query("equipment", _type="Lights")
+        assert list(lights.keys()) == ["Equip 1", "Equip 3", "Equip 5"]
+        assert all(e.equipment_type is PhAdorbEquipmentType.LIGHTS for e in lights.values())
+
+        assert list(store.query("equipment", _names=["Equip 0", "Equip 1", "Missing"], _type="Lights")) == ["Equip 1"]
+        assert list(store.query("co2_measure", _country="DE")) == ["Measure DE"]
+        assert store.query("co2_measure", _type="NON_PERFORMANCE") == {}
+
+
+def test_library_store_unknown_kind():
+    with PhAdorbLibraryStore() as store:
+        with pytest.raises(UnknownLibraryKindError):
+            store.query("not-a-kind")
+        with pytest.raises(KeyError):
+            store.get("equipment", "Missing")
@@ -144,6 +144,64 @@ def test_CO2ReductionMeasureCollection_PERFORMANCE():
     assert len(collection.nonperformance_measures) == 1
 
 
+def test_CO2ReductionMeasureCollection_type_views():
+    collection = PhAdorbCO2MeasureCollection()
+    measure1 = PhAdorbCO2ReductionMeasure(
+        measure_type=CO2MeasureType.PERFORMANCE,
+        name="Test Measure 1",
+        year=2023,
+        cost=1000,
+        kg_CO2=100,
+        country_name="DE",
+        labor_fraction=0.5,
+    )
+    collection.add_measure(measure1)
+    assert collection.performance_measures is not collection.performance_measures
+    assert len(collection.performance_measures) == 1
+
+    # -- Changing a returned collection does not change the next one
+    collection.performance_measures.add_measure(measure1.copy(update={"name": "Test Measure 2"}))
+    assert collection.performance_measures.keys() == ["Test Measure 1"]
+    assert len(collection.nonperformance_measures) == 0
+
+    # -- Replacing the measure with a different type moves it to the other view
+    collection.add_measure(measure1.copy(update={"measure_type": CO2MeasureType.NON_PERFORMANCE}))
+    assert len(collection) == 1
+    assert len(collection.performance_measures) == 0
+    assert collection.nonperformance_measures.keys() == ["Test Measure 1"]
+
+
+def test_CO2ReductionMeasureCollection_sorted_after_add():
+    collection = PhAdorbCO2MeasureCollection()
+    for name, year in [("B", 2030), ("A", 2025)]:
+        collection.add_measure(
+            PhAdorbCO2ReductionMeasure(
+                measure_type=CO2MeasureType.PERFORMANCE,
+                name=name,
+                year=year,
+                cost=1000,
+                kg_CO2=100,
+                country_name="DE",
+                labor_fraction=0.5,
+            )
+        )
+    assert collection.keys() == ["A", "B"]
+
+    collection.add_measure(
+        PhAdorbCO2ReductionMeasure(
+            measure_type=CO2MeasureType.PERFORMANCE,
+            name="C",
+            year=2020,
+            cost=1000,
+            kg_CO2=100,
+            country_name="DE",
+            labor_fraction=0.5,
+        )
+    )
+    assert collection.keys() == ["C", "A", "B"]
+    assert [m.name for m in collection] == ["C", "A", "B"]
+
+
 def test_CO2ReductionMeasures_json_file():
     collection = PhAdorbCO2MeasureCollection()
     measure1 = PhAdorbCO2ReductionMeasure(
@@ -178,3 +236,69 @@ def test_CO2ReductionMeasures_json_file():
 
     # -- Clean-up
     file_path.unlink()
+
+
+def test_CO2ReductionMeasureCollection_sorted_after_year_edit():
+    collection = PhAdorbCO2MeasureCollection()
+    for name, year in [("A", 2025), ("B", 2030)]:
+        collection.add_measure(
+            PhAdorbCO2ReductionMeasure(
+                measure_type=CO2MeasureType.PERFORMANCE,
+                name=name,
+                year=year,
+                cost=1000,
+                kg_CO2=100,
+                country_name="DE",
+                labor_fraction=0.5,
+            )
+        )
+    assert collection.keys() == ["A", "B"]
+    assert collection.performance_measures.keys() == ["A", "B"]
+
+    collection.get_measure("A").year = 2040
+    assert collection.keys() == ["B", "A"]
+    assert [m.year for m in collection] == [2030, 2040]
+    assert collection.performance_measures.keys() == ["B", "A"]
+
+
+def test_CO2ReductionMeasureCollection_type_views_after_type_edit():
+    collection = PhAdorbCO2MeasureCollection()
+    measure = PhAdorbCO2ReductionMeasure(
+        measure_type=CO2MeasureType.PERFORMANCE,
+        name="Test Measure 1",
+        year=2023,
+        cost=1000,
+        kg_CO2=100,
+        country_name="DE",
+        labor_fraction=0.5,
+    )
+    collection.add_measure(measure)
+    assert len(collection.performance_measures) == 1
+
+    measure.measure_type = CO2MeasureType.NON_PERFORMANCE
+    assert len(collection.performance_measures) == 0
+    assert collection.nonperformance_measures.keys() == ["Test Measure 1"]
+
+
+def test_CO2ReductionMeasureCollection_share():
+    collection = PhAdorbCO2MeasureCollection()
+    for name, year in [("A", 2025), ("B", 2030)]:
+        collection.add_measure(
+            PhAdorbCO2ReductionMeasure(
+                measure_type=CO2MeasureType.PERFORMANCE,
+                name=name,
+                year=year,
+                cost=1000,
+                kg_CO2=100,
+                country_name="DE",
+                labor_fraction=0.5,
+            )
+        )
+    shared = collection.share()
+    assert shared.values()[0] is collection.values()[0]
+    assert shared.performance_measures.values()[0].shared
+
+    shared.get_measure("A").year = 2040
+    assert shared.keys() == ["B", "A"]
+    assert collection.keys() == ["A", "B"]
+    assert collection.get_measure("A").year == 2025
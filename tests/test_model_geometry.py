@@ -0,0 +1,132 @@
+import copy
+from pathlib import Path
+
+import numpy as np
+import pytest
+from honeybee_energy.properties.model import ModelEnergyProperties
+
+from ph_adorb.from_HBJSON import create_variant, read_HBJSON_file
+from ph_adorb.from_HBJSON.model_geometry import (
+    HBModelGeometryMismatchError,
+    HBModelRoomCountMismatchError,
+    get_HBModelGeometry_from_hbjson_dict,
+    get_PhAdorbConstructions_from_overlay,
+    get_PhAdorbEquipment_from_overlay,
+    get_PhAdorbVariant_from_overlay,
+)
+from ph_adorb.grid_region import PhAdorbGridRegion, write_CO2_factors_to_json_file
+from ph_adorb.variant import calc_variant_yearly_ADORB_costs_array
+
+HBJSON_FILE_PATH = Path(__file__).parent / "_test_input" / "example.hbjson"
+SQL_FILE_PATH = Path(__file__).parent / "_test_input" / "example_full_hourly.sql"
+
+
+def _load_example_hbjson() -> dict:
+    hbjson_dict = read_HBJSON_file.read_hb_json_from_file(HBJSON_FILE_PATH)
+    hbjson_dict["properties"]["revive"].setdefault("fuels", {})
+    return hbjson_dict
+
+
+def test_model_geometry_cache():
+    geometry = get_HBModelGeometry_from_hbjson_dict(_load_example_hbjson())
+    assert len(geometry.rooms) == 2
+    assert len(geometry.shade_paths) == 17
+    assert geometry.construction_areas_m2["Typ. Window"] > 0
+
+
+def test_overlay_matches_full_model():
+    hbjson_dict = _load_example_hbjson()
+    geometry = get_HBModelGeometry_from_hbjson_dict(hbjson_dict)
+    hb_model = read_HBJSON_file.convert_hbjson_dict_to_hb_model(_load_example_hbjson())
+
+    _, constructions, _, _, schedules, program_types, hvacs, _ = ModelEnergyProperties.load_properties_from_dict(
+        hbjson_dict
+    )
+    overlay_constructions = get_PhAdorbConstructions_from_overlay(geometry, constructions)
+    overlay_equipment = get_PhAdorbEquipment_from_overlay(geometry, hbjson_dict, schedules, program_types, hvacs)
+
+    assert overlay_constructions.values() == create_variant.get_PhAdorbConstructions_from_hb_model(hb_model).values()
+    assert overlay_equipment.values() == create_variant.get_PhAdorbEquipment_from_hb_model(hb_model).values()
+
+
+def test_equipment_extraction_counts_shared_equipment():
+    hb_model = read_HBJSON_file.convert_hbjson_dict_to_hb_model(_load_example_hbjson())
+    equipment = create_variant.get_PhAdorbEquipment_from_hb_model(hb_model)
+    assert equipment.get_equipment("rv2024_Residence_Lighting").quantity == 2
+    assert equipment.get_equipment("Photovoltaic Array 1").quantity == 6
+    assert equipment.get_equipment("Fridge_360W-LEVEL_01").quantity == 1
+
+
+def _load_example_hbjson_with_grid_region(_tmp_path: Path) -> dict:
+    """Return the example HBJSON with fuels, and a small (5 year) grid-region file which exists on this machine."""
+    from honeybee_revive.fuels import Fuel
+
+    hbjson_dict = _load_example_hbjson()
+    revive_dict = hbjson_dict["properties"]["revive"]
+    revive_dict["fuels"] = {
+        "ELECTRICITY": Fuel("ELECTRICITY", 0.17, 0.10, 100.0).to_dict(),
+        "NATURAL_GAS": Fuel("NATURAL_GAS", 0.05, 0.0, 200.0).to_dict(),
+    }
+    revive_dict["analysis_duration"] = 5
+
+    grid_region_dict = revive_dict["grid_region"]
+    grid_region_file = _tmp_path / f"{grid_region_dict['region_code']}.json"
+    rng = np.random.default_rng(0)
+    write_CO2_factors_to_json_file(
+        grid_region_file,
+        PhAdorbGridRegion(
+            region_code=grid_region_dict["region_code"],
+            region_name=grid_region_dict["region_name"],
+            description=grid_region_dict["description"],
+            hourly_CO2_factors={2023 + i: rng.uniform(100, 500, 8760).tolist() for i in range(5)},
+        ),
+    )
+    grid_region_dict["filepath"] = str(grid_region_file)
+    return hbjson_dict
+
+
+def test_overlay_variant_matches_full_HBJSON_path(tmp_path):
+    hbjson_dict = _load_example_hbjson_with_grid_region(tmp_path)
+    hb_model = read_HBJSON_file.convert_hbjson_dict_to_hb_model(copy.deepcopy(hbjson_dict))
+    full_variant = create_variant.get_PhAdorbVariant_from_hb_model(hb_model, SQL_FILE_PATH)
+
+    geometry = get_HBModelGeometry_from_hbjson_dict(copy.deepcopy(hbjson_dict))
+    overlay_variant = get_PhAdorbVariant_from_overlay(geometry, hbjson_dict, SQL_FILE_PATH)
+
+    assert overlay_variant == full_variant
+    np.testing.assert_allclose(
+        calc_variant_yearly_ADORB_costs_array(overlay_variant), calc_variant_yearly_ADORB_costs_array(full_variant)
+    )
+
+
+def test_overlay_with_a_different_number_of_rooms_raises():
+    hbjson_dict = _load_example_hbjson()
+    geometry = get_HBModelGeometry_from_hbjson_dict(hbjson_dict)
+    variant_dict = _load_example_hbjson()
+    variant_dict["rooms"] = variant_dict["rooms"][:1]
+
+    _, _, _, _, schedules, program_types, hvacs, _ = ModelEnergyProperties.load_properties_from_dict(variant_dict)
+    with pytest.raises(HBModelRoomCountMismatchError) as error:
+        get_PhAdorbEquipment_from_overlay(geometry, variant_dict, schedules, program_types, hvacs)
+    assert isinstance(error.value, HBModelGeometryMismatchError)
+    assert f"Expected {len(geometry.rooms)} rooms but got 1." in str(error.value)
+
+
+def test_shared_hvac_equipment_is_counted_once():
+    from honeybee_energy_revive.hvac.equipment import PhiusReviveHVACEquipment
+
+    erv = PhiusReviveHVACEquipment("ERV", 5_000.0, 0.4, 20)
+
+    # -- Both of the example's rooms are served by the one HVAC system
+    hb_model = read_HBJSON_file.convert_hbjson_dict_to_hb_model(_load_example_hbjson())
+    hvac_a, hvac_b = [room.properties.energy.hvac for room in hb_model.rooms]
+    assert hvac_a.identifier == hvac_b.identifier
+    hvac_a.properties.revive.add_equipment(erv)
+    assert create_variant.get_PhAdorbEquipment_from_hb_model(hb_model).get_equipment("ERV").quantity == 1
+
+    hbjson_dict = _load_example_hbjson()
+    geometry = get_HBModelGeometry_from_hbjson_dict(hbjson_dict)
+    _, _, _, _, schedules, program_types, hvacs, _ = ModelEnergyProperties.load_properties_from_dict(hbjson_dict)
+    hvacs[hvac_a.identifier].properties.revive.add_equipment(erv)
+    overlay_equipment = get_PhAdorbEquipment_from_overlay(geometry, hbjson_dict, schedules, program_types, hvacs)
+    assert overlay_equipment.get_equipment("ERV").quantity == 1
@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from ph_adorb.constructions import PhAdorbConstruction
+from ph_adorb.monte_carlo import (
+    MONTE_CARLO_PARAMETERS,
+    Fixed,
+    Normal,
+    Triangular,
+    Uniform,
+    UnknownParameterError,
+    calculate_annual_ADORB_costs_batch,
+    point_parameters,
+    run_monte_carlo,
+)
+from ph_adorb.variant import PhAdorbVariant, calc_variant_yearly_ADORB_costs_array
+from tests.variant_factory import example_variant_fields
+
+
+def _variant() -> PhAdorbVariant:
+    variant = PhAdorbVariant.from_trusted(**example_variant_fields(_grid_region_years=51))
+    variant.construction_collection.add_construction(
+        PhAdorbConstruction(
+            display_name="Wall",
+            identifier="Wall",
+            CO2_kg_per_m2=100,
+            cost_per_m2=50,
+            lifetime_years=30,
+            labor_fraction=0.4,
+            area_m2=100.0,
+        )
+    )
+    return variant
+
+
+def test_monte_carlo_without_uncertainty_matches_the_point_calculation():
+    variant = _variant()
+    result = run_monte_carlo(variant, {}, _num_samples=3)
+    for yearly_costs in result.yearly_costs:
+        np.testing.assert_allclose(yearly_costs, calc_variant_yearly_ADORB_costs_array(variant))
+
+
+def test_point_parameters_match_the_point_calculation():
+    variant = _variant()
+    parameters = point_parameters(variant)
+    assert list(parameters) == list(MONTE_CARLO_PARAMETERS)
+    assert all(values.shape == (1,) for values in parameters.values())
+    np.testing.assert_allclose(
+        calculate_annual_ADORB_costs_batch(variant, parameters)[0], calc_variant_yearly_ADORB_costs_array(variant)
+    )
+
+
+def test_monte_carlo_fixed_price_of_carbon_matches_the_point_calculation():
+    variant = _variant()
+    result = run_monte_carlo(variant, {"price_of_carbon": Fixed(0.5)}, _num_samples=2)
+    variant.price_of_carbon = 0.5
+    np.testing.assert_allclose(result.yearly_costs[0], calc_variant_yearly_ADORB_costs_array(variant))
+
+
+def test_monte_carlo_bands():
+    result = run_monte_carlo(
+        _variant(),
+        {
+            "price_of_carbon": Triangular(0.1, 0.25, 0.5),
+            "energy_discount_rate": Uniform(0.01, 0.03),
+            "electric_purchase_price_per_kwh": Normal(0.15, 0.02),
+        },
+        _num_samples=2_000,
+        _seed=1,
+    )
+    assert len(result) == 2_000
+    assert set(result.samples) == set(MONTE_CARLO_PARAMETERS)
+
+    p10, p50, p90 = result.cumulative_bands((10, 50, 90))
+    assert p10.shape == (50, 5)
+    assert (p10 <= p50).all() and (p50 <= p90).all()
+    assert p10[-1].sum() < p90[-1].sum()
+
+    df = result.bands_to_DataFrame(_cumulative=True)
+    assert df.shape == (150, 5)
+    assert df.loc[("P50", 49)].tolist() == pytest.approx(p50[-1].tolist())
+
+
+def test_monte_carlo_is_repeatable_with_a_seed():
+    distributions = {"gas_purchase_price_per_kwh": Uniform(0.05, 0.1)}
+    a = run_monte_carlo(_variant(), distributions, _num_samples=10, _seed=7)
+    b = run_monte_carlo(_variant(), distributions, _num_samples=10, _seed=7)
+    np.testing.assert_array_equal(a.yearly_costs, b.yearly_costs)
+
+
+def test_monte_carlo_unknown_parameter():
+    with pytest.raises(UnknownParameterError):
+        run_monte_carlo(_variant(), {"not_a_parameter": Fixed(1.0)}, _num_samples=1)
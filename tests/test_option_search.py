@@ -0,0 +1,141 @@
+import numpy as np
+import pytest
+
+from ph_adorb.constructions import PhAdorbConstruction
+from ph_adorb.measures import CO2MeasureType, PhAdorbCO2ReductionMeasure
+from ph_adorb.option_search import DesignOption, OptionSearch, OptionSearchError
+from ph_adorb.variant import PhAdorbVariant, calc_variant_yearly_ADORB_costs_array
+from tests.variant_factory import HOURS_PER_YEAR, example_variant_fields
+
+
+def _wall(_name: str, _cost_per_m2: float) -> PhAdorbConstruction:
+    return PhAdorbConstruction(
+        display_name=_name,
+        identifier=_name,
+        CO2_kg_per_m2=100,
+        cost_per_m2=_cost_per_m2,
+        lifetime_years=30,
+        labor_fraction=0.4,
+        area_m2=100.0,
+    )
+
+
+def _measure(_name: str, _cost: float) -> PhAdorbCO2ReductionMeasure:
+    return PhAdorbCO2ReductionMeasure(
+        measure_type=CO2MeasureType.PERFORMANCE,
+        name=_name,
+        year=5,
+        cost=_cost,
+        kg_CO2=None,
+        country_name="USA",
+        labor_fraction=0.5,
+    )
+
+
+@pytest.fixture(scope="module")
+def variant() -> PhAdorbVariant:
+    variant = PhAdorbVariant.from_trusted(**example_variant_fields(_grid_region_years=51))
+    variant.construction_collection.add_construction(_wall("Base Wall", 50.0))
+    return variant
+
+
+def _options(_num: int, _seed: int = 1) -> list[DesignOption]:
+    rng = np.random.default_rng(_seed)
+    options = [
+        DesignOption(
+            f"Measure {i}",
+            added_items=(_measure(f"Measure {i}", float(rng.uniform(1_000, 20_000))),),
+            hourly_electricity_kwh_delta=np.full(HOURS_PER_YEAR, -float(rng.uniform(0, 0.3))),
+            gas_kwh_delta=-float(rng.uniform(0, 2_000)),
+        )
+        for i in range(_num)
+    ]
+    options += [
+        DesignOption(
+            f"Wall {i}",
+            group="Wall",
+            added_items=(_wall(f"Wall {i}", 80.0 + 10 * i),),
+            removed_items=(_wall("Base Wall", 50.0),),
+            gas_kwh_delta=-2_000.0 * (i + 1),
+        )
+        for i in range(3)
+    ]
+    return options
+
+
+def _apply(_variant: PhAdorbVariant, _options: list[DesignOption]) -> PhAdorbVariant:
+    """Build the full Variant with the options applied, the slow way."""
+    hourly = np.array(_variant.hourly_purchased_electricity_kwh)
+    variant = _variant.clone(construction_collection=_variant.construction_collection.duplicate())
+    for option in _options:
+        if option.hourly_electricity_kwh_delta is not None:
+            hourly = hourly + option.hourly_electricity_kwh_delta
+        variant.total_purchased_gas_kwh += option.gas_kwh_delta
+        for item in option.removed_items:
+            variant.construction_collection._constructions.pop(item.display_name)
+        for item in option.added_items:
+            if isinstance(item, PhAdorbConstruction):
+                variant.construction_collection.add_construction(item)
+            else:
+                variant.measure_collection.add_measure(item)
+    return variant.clone(hourly_purchased_electricity_kwh=hourly)
+
+
+def test_option_set_scores_match_the_full_calculation(variant):
+    options = _options(3)
+    search = OptionSearch(variant, options)
+    result = search.evaluate(["Measure 0", "Measure 2", "Wall 1"])
+    chosen = [o for o in options if o.name in result.option_names]
+    np.testing.assert_allclose(
+        result.yearly_costs, calc_variant_yearly_ADORB_costs_array(_apply(variant, chosen)), rtol=1e-9, atol=1e-6
+    )
+
+
+@pytest.mark.parametrize("budget", [None, 25_000.0])
+def test_branch_and_bound_matches_exhaustive(variant, budget):
+    search = OptionSearch(variant, _options(8), _budget=budget)
+    exhaustive = search.search("exhaustive")
+    branch_and_bound = search.search("branch_and_bound")
+    greedy = search.search("greedy")
+
+    assert branch_and_bound.total_ADORB == pytest.approx(exhaustive.total_ADORB)
+    assert greedy.total_ADORB >= exhaustive.total_ADORB - 1e-6
+    assert budget is None or branch_and_bound.first_cost <= budget
+    assert sum(name.startswith("Wall") for name in branch_and_bound.option_names) <= 1
+
+
+def test_option_search_errors(variant):
+    options = _options(2)
+    with pytest.raises(OptionSearchError):
+        OptionSearch(variant, options + options[:1])
+    with pytest.raises(OptionSearchError):
+        OptionSearch(variant, options).evaluate(["Wall 0", "Wall 1"])
+    with pytest.raises(OptionSearchError):
+        OptionSearch(variant, options).search("random")
+
+
+def test_options_which_remove_the_same_item_are_alternatives(variant):
+    options = [
+        DesignOption(
+            "New Wall",
+            group="Wall",
+            added_items=(_wall("New Wall", 80.0),),
+            removed_items=(_wall("Base Wall", 50.0),),
+            gas_kwh_delta=-10_000.0,
+        ),
+        DesignOption(
+            "No Wall",
+            group="Demolition",
+            removed_items=(_wall("Base Wall", 50.0),),
+            gas_kwh_delta=-5_000.0,
+        ),
+    ]
+    search = OptionSearch(variant, options)
+    with pytest.raises(OptionSearchError) as error:
+        search.evaluate(name for name in ["New Wall", "No Wall"])
+    assert "['New Wall', 'No Wall']" in str(error.value)
+
+    # -- Each option on its own lowers the total ADORB, but they may not be chosen together
+    assert all(search.scores < 0)
+    for strategy in ("exhaustive", "greedy", "branch_and_bound"):
+        assert len(search.search(strategy).option_names) == 1
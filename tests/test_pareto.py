@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ph_adorb import adorb_cost
+from ph_adorb.constructions import PhAdorbConstruction
+from ph_adorb.monte_carlo import calc_variant_quantities
+from ph_adorb.pareto import (
+    calc_variant_total_ADORB_and_kgCO2,
+    explore_pareto_front,
+    pareto_front,
+)
+from ph_adorb.variant import PhAdorbVariant, calc_variant_yearly_ADORB_costs_array
+from tests.variant_factory import example_variant_fields
+
+
+def _brute_force_front(_costs: np.ndarray, _kgCO2: np.ndarray) -> set[int]:
+    front_ = set()
+    for i in range(len(_costs)):
+        dominated = any(
+            _costs[j] <= _costs[i] and _kgCO2[j] <= _kgCO2[i] and (_costs[j] < _costs[i] or _kgCO2[j] < _kgCO2[i])
+            for j in range(len(_costs))
+        )
+        if not dominated:
+            front_.add(i)
+    return front_
+
+
+def test_pareto_front_matches_brute_force():
+    rng = np.random.default_rng(7)
+    costs, kgCO2 = rng.integers(0, 30, 300).astype(float), rng.integers(0, 30, 300).astype(float)
+    front = pareto_front(costs, kgCO2)
+
+    assert np.all(np.diff(costs[front]) > 0)
+    assert np.all(np.diff(kgCO2[front]) < 0)
+    assert {(costs[i], kgCO2[i]) for i in front} == {(costs[i], kgCO2[i]) for i in _brute_force_front(costs, kgCO2)}
+
+
+def test_pareto_front_keeps_one_of_identical_points():
+    assert pareto_front(np.array([1.0, 1.0, 2.0]), np.array([5.0, 5.0, 1.0])).tolist() == [0, 2]
+    assert len(pareto_front(np.zeros(0), np.zeros(0))) == 0
+
+
+def _variant(_name: str, _wall_cost: float, _gas_kwh: float) -> PhAdorbVariant:
+    fields = example_variant_fields(_grid_region_years=2)
+    fields.update(name=_name, analysis_duration=2, total_purchased_gas_kwh=_gas_kwh)
+    variant = PhAdorbVariant.from_trusted(**fields)
+    variant.construction_collection.add_construction(
+        PhAdorbConstruction(
+            display_name="Wall",
+            identifier="Wall",
+            CO2_kg_per_m2=50.0,
+            cost_per_m2=_wall_cost,
+            lifetime_years=30,
+            labor_fraction=0.4,
+            area_m2=100.0,
+        )
+    )
+    return variant
+
+
+@pytest.fixture(scope="module")
+def variants() -> list[PhAdorbVariant]:
+    return [
+        _variant("Base", 50.0, 20_000.0),
+        _variant("Better", 80.0, 5_000.0),
+        _variant("Worse", 90.0, 25_000.0),
+        _variant("Cheap", 40.0, 30_000.0),
+    ]
+
+
+def test_metrics_match_the_variant_calculation(variants):
+    variant = variants[0]
+    totals, kgCO2 = calc_variant_total_ADORB_and_kgCO2(variant)
+    np.testing.assert_allclose(totals, calc_variant_yearly_ADORB_costs_array(variant).sum(axis=0))
+
+    quantities = calc_variant_quantities(variant)
+    assert kgCO2 == pytest.approx(quantities.operational_kgCO2.sum() + quantities.embodied_kgCO2.sum())
+    assert quantities.embodied_kgCO2.sum() > 0.0
+
+
+def test_explore_pareto_front(variants, tmp_path):
+    result = explore_pareto_front(variants)
+    assert len(result) == 4
+    assert "Worse" not in result.front_names
+    assert set(result.front_names) == {
+        result.names[i] for i in _brute_force_front(result.total_ADORB, result.cumulative_kgCO2)
+    }
+
+    df = result.to_DataFrame()
+    assert df.loc["Worse", "on_front"] == False  # noqa: E712
+    assert df["total_ADORB"].tolist() == pytest.approx(result.total_ADORB.tolist())
+
+    # -- The front CSV reads back, as in 'generate_ADORB_cost_graph', with the Variant names as the index
+    front_csv = tmp_path / "front.csv"
+    result.write_front_csv(front_csv)
+    front_df = pd.read_csv(front_csv, index_col=0)
+    assert front_df.index.tolist() == result.front_names
+    assert list(front_df.columns) == list(adorb_cost.ADORB_COLUMNS) + ["cumulative_kgCO2"]
+    assert front_df["cumulative_kgCO2"].tolist() == pytest.approx(result.cumulative_kgCO2[result.front].tolist())
+    adorb_df = front_df[list(adorb_cost.ADORB_COLUMNS)]
+    assert adorb_df.sum(axis=1).tolist() == pytest.approx(result.total_ADORB[result.front].tolist())
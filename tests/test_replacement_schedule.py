@@ -0,0 +1,55 @@
+import numpy as np
+from pytest import approx
+
+from ph_adorb.replacement_schedule import (
+    build_one_time_schedule,
+    build_replacement_schedule,
+    replacement_years,
+)
+
+
+def test_replacement_years():
+    item_index, year = replacement_years(np.array([20, 0, 30, 50]), 50)
+    assert item_index.tolist() == [0, 0, 0, 1, 2, 2, 3, 3]
+    assert year.tolist() == [0, 20, 40, 0, 0, 30, 0, 50]
+
+
+def test_replacement_years_matches_range():
+    duration = 50
+    lifetimes = [1, 7, 13, 25, 49, 50, 51, 0]
+    item_index, year = replacement_years(np.array(lifetimes), duration)
+    for i, lifetime in enumerate(lifetimes):
+        expected = list(range(0, duration + 1, lifetime or (duration + 1)))
+        assert year[item_index == i].tolist() == expected
+
+
+def test_build_replacement_schedule():
+    schedule = build_replacement_schedule(
+        ["A", "B"],
+        np.array([1000.0, 100.0]),
+        np.array([0.6, 1.0]),
+        np.array([20, 50]),
+        50,
+        _kg_CO2_per_USD=0.5,
+        _USD_per_kgCO2=0.25,
+    )
+    assert len(schedule) == 5
+    assert schedule.to_matrix().sum(axis=1).tolist() == [3, 2]
+
+    # -- The year-50 replacement of 'B' is outside of the 50-year analysis.
+    assert schedule.yearly_install_costs.shape == (50,)
+    assert schedule.yearly_install_costs[0] == approx(1100.0)
+    assert schedule.yearly_install_costs[20] == approx(1000.0)
+    assert schedule.yearly_install_costs.sum() == approx(3100.0)
+    assert schedule.yearly_embodied_kgCO2[0] == approx(1000 * 0.6 * 0.5 + 100 * 0.5)
+    assert schedule.yearly_embodied_CO2_costs[0] == approx(schedule.yearly_embodied_kgCO2[0] * 0.25)
+
+    yearly_costs = schedule.to_YearlyCosts()
+    assert [(c.description, c.year) for c in yearly_costs] == [("A", 0), ("A", 20), ("A", 40), ("B", 0), ("B", 50)]
+
+
+def test_build_one_time_schedule():
+    schedule = build_one_time_schedule(["M1", "M2"], np.array([500.0, 800.0]), np.array([5, 60]), 50, 1.0, 0.25)
+    assert schedule.yearly_install_costs[5] == approx(500.0)
+    assert schedule.yearly_install_costs.sum() == approx(500.0)
+    assert schedule.to_matrix().sum() == 1
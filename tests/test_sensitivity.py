@@ -0,0 +1,107 @@
+import numpy as np
+import pytest
+
+from ph_adorb.constructions import PhAdorbConstruction
+from ph_adorb.equipment import PhAdorbEquipment, PhAdorbEquipmentType
+from ph_adorb.measures import CO2MeasureType, PhAdorbCO2ReductionMeasure
+from ph_adorb.sensitivity import calc_variant_ADORB_sensitivities, plot_tornado
+from ph_adorb.variant import PhAdorbVariant, calc_variant_yearly_ADORB_costs_array
+from tests.variant_factory import example_variant_fields
+
+
+def _wall(_area_m2: float = 100.0) -> PhAdorbConstruction:
+    return PhAdorbConstruction(
+        display_name="Wall",
+        identifier="Wall",
+        CO2_kg_per_m2=100,
+        cost_per_m2=50,
+        lifetime_years=30,
+        labor_fraction=0.4,
+        area_m2=_area_m2,
+    )
+
+
+def _boiler(_cost: float = 5000.0) -> PhAdorbEquipment:
+    return PhAdorbEquipment(
+        name="Boiler", equipment_type=PhAdorbEquipmentType.MECHANICAL, cost=_cost, lifetime_years=15, labor_fraction=0.2
+    )
+
+
+def _retrofit(_cost: float = 20_000.0) -> PhAdorbCO2ReductionMeasure:
+    return PhAdorbCO2ReductionMeasure(
+        measure_type=CO2MeasureType.PERFORMANCE,
+        name="Retrofit",
+        year=10,
+        cost=_cost,
+        kg_CO2=None,
+        country_name="USA",
+        labor_fraction=0.5,
+    )
+
+
+def _variant() -> PhAdorbVariant:
+    variant = PhAdorbVariant.from_trusted(**example_variant_fields(_grid_region_years=51))
+    variant.construction_collection.add_construction(_wall())
+    variant.equipment_collection.add_equipment(_boiler())
+    variant.measure_collection.add_measure(_retrofit())
+    return variant
+
+
+@pytest.fixture(scope="module")
+def variant() -> PhAdorbVariant:
+    return _variant()
+
+
+@pytest.fixture(scope="module")
+def sensitivities(variant):
+    return calc_variant_ADORB_sensitivities(variant)
+
+
+def _yearly_difference(_variant: PhAdorbVariant, _changed: PhAdorbVariant) -> np.ndarray:
+    return calc_variant_yearly_ADORB_costs_array(_changed) - calc_variant_yearly_ADORB_costs_array(_variant)
+
+
+@pytest.mark.parametrize(
+    "name, change",
+    [
+        ("price_of_carbon", lambda v: v.clone(price_of_carbon=v.price_of_carbon + 1.0)),
+        ("peak_electric_usage_W", lambda v: v.clone(peak_electric_usage_W=v.peak_electric_usage_W + 1.0)),
+        ("total_purchased_gas_kwh", lambda v: v.clone(total_purchased_gas_kwh=v.total_purchased_gas_kwh + 1.0)),
+        ("total_sold_electricity_kwh", lambda v: v.clone(total_sold_electricity_kwh=v.total_sold_electricity_kwh + 1)),
+        (
+            "electric_purchase_price_per_kwh",
+            lambda v: v.clone(electricity=v.electricity.copy(update={"purchase_price_per_kwh": 1.15})),
+        ),
+        ("gas_annual_base_price", lambda v: v.clone(gas=v.gas.copy(update={"annual_base_price": 151.0}))),
+        (
+            "kg_CO2_per_USD",
+            lambda v: v.clone(national_emissions=v.national_emissions.copy(update={"kg_CO2_per_USD": 1.234})),
+        ),
+    ],
+)
+def test_scalar_sensitivities_match_a_unit_change(variant, sensitivities, name, change):
+    # -- ADORB is linear in each of these inputs, so a unit change gives the exact derivative.
+    np.testing.assert_allclose(
+        sensitivities.yearly_for(name), _yearly_difference(variant, change(variant)), rtol=1e-6, atol=1e-6
+    )
+
+
+def test_item_sensitivities_match_a_unit_change(variant, sensitivities):
+    changed = variant.clone()
+    changed.construction_collection.add_construction(_wall(_area_m2=100.0 + 1.0 / 50))  # -- +$1
+    changed.equipment_collection.add_equipment(_boiler(_cost=5001.0))
+    changed.measure_collection.add_measure(_retrofit(_cost=20_001.0))
+    expected = _yearly_difference(variant, changed)
+
+    items = ["Constructions: Wall", "Equipment: Boiler", "CO2 Measures: Retrofit"]
+    actual = sum(sensitivities.yearly_for(name) for name in items)
+    np.testing.assert_allclose(actual, expected, rtol=1e-6, atol=1e-6)
+    assert sensitivities.base_values[sensitivities.names.index("Equipment: Boiler")] == 5000.0
+
+
+def test_tornado(variant, sensitivities):
+    bars = sensitivities.tornado(_relative_change=0.1, _max_bars=5)
+    assert len(bars) == 5
+    assert [b.swing for b in bars] == sorted((b.swing for b in bars), reverse=True)
+    assert sensitivities.base_total == pytest.approx(calc_variant_yearly_ADORB_costs_array(variant).sum())
+    assert len(plot_tornado(bars).data) == 2
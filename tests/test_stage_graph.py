@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from ph_adorb.constructions import PhAdorbConstruction
+from ph_adorb.equipment import PhAdorbEquipment, PhAdorbEquipmentType
+from ph_adorb.stage_graph import Stage, StageGraph, StageGraphError
+from ph_adorb.variant import PhAdorbVariant, calc_variant_yearly_ADORB_costs_array
+from ph_adorb.variant_pipeline import PhAdorbVariantPipeline
+from tests.variant_factory import example_variant_fields
+
+
+def _computed(_graph: StageGraph) -> set[str]:
+    return {run.name for run in _graph.last_run if not run.cached}
+
+
+def test_stage_graph_only_reruns_downstream_stages():
+    graph = StageGraph(
+        [
+            Stage("total", ("a_plus_b", "c"), lambda x, y: x * y),
+            Stage("a_plus_b", ("a", "b"), lambda x, y: x + y),
+        ],
+        ["a", "b", "c"],
+    )
+    assert graph.run({"a": 1, "b": 2, "c": 3}) == {"a_plus_b": 3, "total": 9}
+    assert _computed(graph) == {"a_plus_b", "total"}
+
+    assert graph.run({"a": 1, "b": 2, "c": 4})["total"] == 12
+    assert _computed(graph) == {"total"}
+
+    graph.run({"a": 1, "b": 2, "c": 4})
+    assert _computed(graph) == set()
+    assert "a_plus_b" in graph.format_timings()
+
+
+def test_stage_graph_errors():
+    with pytest.raises(StageGraphError):
+        StageGraph([Stage("x", ("y",), abs), Stage("y", ("x",), abs)], [])
+    with pytest.raises(StageGraphError):
+        StageGraph([Stage("x", ("a",), abs)], ["a"]).run({})
+
+
+def _example_variant() -> PhAdorbVariant:
+    variant = PhAdorbVariant.from_trusted(**example_variant_fields(_grid_region_years=51))
+    variant.construction_collection.add_construction(
+        PhAdorbConstruction(
+            display_name="Wall",
+            identifier="Wall",
+            CO2_kg_per_m2=100,
+            cost_per_m2=50,
+            lifetime_years=30,
+            labor_fraction=0.4,
+            area_m2=100.0,
+        )
+    )
+    variant.equipment_collection.add_equipment(
+        PhAdorbEquipment(
+            name="Boiler",
+            equipment_type=PhAdorbEquipmentType.MECHANICAL,
+            cost=5000.0,
+            lifetime_years=15,
+            labor_fraction=0.2,
+        )
+    )
+    return variant
+
+
+def test_variant_pipeline_matches_direct_calculation():
+    variant = _example_variant()
+    pipeline = PhAdorbVariantPipeline()
+    np.testing.assert_allclose(pipeline.run(variant), calc_variant_yearly_ADORB_costs_array(variant))
+
+    variant.price_of_carbon = 0.5
+    np.testing.assert_allclose(pipeline.run(variant), calc_variant_yearly_ADORB_costs_array(variant))
+    assert _computed(pipeline.graph) == {"yearly_embodied_CO2_costs", "adorb_costs"}
+
+    variant.equipment_collection.add_equipment(
+        PhAdorbEquipment(
+            name="Boiler",
+            equipment_type=PhAdorbEquipmentType.MECHANICAL,
+            cost=6000.0,
+            lifetime_years=15,
+            labor_fraction=0.2,
+        )
+    )
+    np.testing.assert_allclose(pipeline.run(variant), calc_variant_yearly_ADORB_costs_array(variant))
+    assert "electric_CO2" not in _computed(pipeline.graph)
+    assert "cost_ledger" in _computed(pipeline.graph)
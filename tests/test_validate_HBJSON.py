@@ -0,0 +1,107 @@
+from pathlib import Path
+
+import pytest
+
+from ph_adorb.from_HBJSON import read_HBJSON_file
+from ph_adorb.from_HBJSON.validate_HBJSON import (
+    HBJSONValidationError,
+    validate_hbjson_dict,
+)
+
+HBJSON_FILE_PATH = Path(__file__).parent / "_test_input" / "example.hbjson"
+
+
+def _load_valid_example_hbjson(_tmp_path: Path) -> dict:
+    grid_region_file = _tmp_path / "grid_region.json"
+    grid_region_file.write_text("{}")
+
+    hbjson_dict = read_HBJSON_file.read_hb_json_from_file(HBJSON_FILE_PATH)
+    hbjson_dict["properties"]["revive"]["grid_region"]["filepath"] = str(grid_region_file)
+    hbjson_dict["properties"]["revive"]["fuels"] = {
+        fuel_type: {
+            "type": "Fuel",
+            "fuel_type": fuel_type,
+            "purchase_price_per_kwh": 0.1,
+            "sale_price_per_kwh": 0.1,
+            "annual_base_price": 100.0,
+        }
+        for fuel_type in ["ELECTRICITY", "NATURAL_GAS"]
+    }
+    return hbjson_dict
+
+
+def test_validate_example_hbjson_reports_all_problems():
+    hbjson_dict = read_HBJSON_file.read_hb_json_from_file(HBJSON_FILE_PATH)
+    report = validate_hbjson_dict(hbjson_dict)
+    assert not report.is_valid
+    assert len(report.errors) == 2
+    assert any("grid_region" in e for e in report.errors)
+    assert any("fuels" in e for e in report.errors)
+
+
+def test_validate_valid_hbjson(tmp_path):
+    report = validate_hbjson_dict(_load_valid_example_hbjson(tmp_path))
+    assert report.is_valid
+    report.raise_for_errors()
+
+
+def test_validate_hbjson_raises_with_every_error(tmp_path):
+    hbjson_dict = _load_valid_example_hbjson(tmp_path)
+    del hbjson_dict["properties"]["revive"]["fuels"]["NATURAL_GAS"]
+    del hbjson_dict["properties"]["revive"]["national_emissions_factors"]["CO2_MT"]
+    hbjson_dict["properties"]["energy"]["constructions"][0]["properties"].pop("revive")
+    first_measure = next(iter(hbjson_dict["properties"]["revive"]["co2_measures"].values()))
+    first_measure["measure_type"] = "NOT_A_TYPE"
+
+    with pytest.raises(HBJSONValidationError) as e:
+        validate_hbjson_dict(hbjson_dict).raise_for_errors()
+    assert len(e.value.errors) == 4
+
+
+def test_validate_hbjson_text_and_number_keys(tmp_path):
+    hbjson_dict = _load_valid_example_hbjson(tmp_path)
+    national_emissions = hbjson_dict["properties"]["revive"]["national_emissions_factors"]
+    national_emissions["country_name"] = None
+    national_emissions["kg_CO2_per_USD"] = "USA"
+    first_measure = next(iter(hbjson_dict["properties"]["revive"]["co2_measures"].values()))
+    first_measure["name"] = "A measure named with text"
+
+    report = validate_hbjson_dict(hbjson_dict)
+    assert report.errors == [
+        "Model national_emissions: is missing 'country_name'.",
+        "Model national_emissions: 'kg_CO2_per_USD' is not a number (got: 'USA').",
+    ]
+
+
+def test_validate_hbjson_equipment_costs(tmp_path):
+    hbjson_dict = _load_valid_example_hbjson(tmp_path)
+    room_energy_dict = hbjson_dict["rooms"][1]["properties"]["energy"]
+    room_energy_dict["process_loads"][0]["properties"]["revive"]["cost"] = "not-a-number"
+
+    report = validate_hbjson_dict(hbjson_dict)
+    assert len(report.errors) == 1
+    assert "'cost' is not a number" in report.errors[0]
+
+
+def test_validate_hbjson_hvac_equipment(tmp_path):
+    hbjson_dict = _load_valid_example_hbjson(tmp_path)
+    (hvac_dict,) = hbjson_dict["properties"]["energy"]["hvacs"]
+    hvac_dict["properties"] = {
+        "type": "AllAirSystemProperties",
+        "revive": {
+            "type": "AllAirSystemReviveProperties",
+            "equipment_collection": {
+                "type": "PhiusReviveHVACEquipmentCollection",
+                "equipment": [
+                    {"display_name": "ERV", "cost": 5000.0, "lifetime_years": 20, "labor_fraction": 0.4},
+                    {"display_name": "Boiler", "cost": "n/a", "lifetime_years": 25},
+                ],
+            },
+        },
+    }
+
+    report = validate_hbjson_dict(hbjson_dict)
+    assert sorted(report.errors) == [
+        "HVAC-Equipment 'Boiler': 'cost' is not a number (got: 'n/a').",
+        "HVAC-Equipment 'Boiler': is missing 'labor_fraction'.",
+    ]
@@ -1,7 +1,15 @@
+import numpy as np
 import pandas as pd
+import pytest
 
 from ph_adorb.grid_region import PhAdorbGridRegion
-from ph_adorb.variant import calc_annual_total_electric_cost, calc_annual_hourly_electric_CO2
+from ph_adorb.variant import (
+    PhAdorbVariant,
+    calc_annual_hourly_electric_CO2,
+    calc_annual_total_electric_cost,
+    calc_variant_yearly_ADORB_costs_array,
+)
+from tests.variant_factory import example_variant_fields
 
 
 def test_get_annual_electric_cost():
@@ -29,4 +37,148 @@ def test_get_hourly_electric_CO2():
     assert result == [0.0] * 89
 
 
+def test_variant_from_trusted_matches_validated():
+    fields = example_variant_fields(_grid_region_years=51)
+    trusted = PhAdorbVariant.from_trusted(**fields)
+    validated = PhAdorbVariant(**fields)
+    assert trusted == validated
+    assert trusted.grid_region is fields["grid_region"]
+    assert len(trusted.measure_collection) == 0
+    assert (calc_variant_yearly_ADORB_costs_array(trusted) == calc_variant_yearly_ADORB_costs_array(validated)).all()
+
+
+def test_variant_from_trusted_missing_fields():
+    fields = example_variant_fields(_grid_region_years=51)
+    del fields["gas"]
+    with pytest.raises(ValueError):
+        PhAdorbVariant.from_trusted(**fields)
+
+
+def test_variant_hourly_electricity_is_readonly_array():
+    fields = example_variant_fields(_grid_region_years=2)
+    hourly_kwh = list(fields["hourly_purchased_electricity_kwh"])
+    variant = PhAdorbVariant(**fields)
+
+    assert isinstance(variant.hourly_purchased_electricity_kwh, np.ndarray)
+    assert variant.hourly_purchased_electricity_kwh.dtype == np.float64
+    assert not variant.hourly_purchased_electricity_kwh.flags.writeable
+    with pytest.raises(ValueError):
+        variant.hourly_purchased_electricity_kwh[0] = 1.0
+    assert variant.total_purchased_electricity_kwh == pytest.approx(sum(hourly_kwh))
+
+
+def test_variant_hourly_electricity_json_round_trip():
+    variant = PhAdorbVariant(**example_variant_fields(_grid_region_years=2))
+    json_str = variant.json()
+    assert '"hourly_purchased_electricity_kwh": [' in json_str
+    assert PhAdorbVariant.parse_raw(json_str) == variant
+
+
+def test_variant_hourly_electricity_does_not_freeze_the_input_array():
+    fields = example_variant_fields(_grid_region_years=2)
+    fields["hourly_purchased_electricity_kwh"] = np.ones(10)
+    variant = PhAdorbVariant(**fields)
+    assert fields["hourly_purchased_electricity_kwh"].flags.writeable
+    assert variant.total_purchased_electricity_kwh == 10.0
+
+
 # TODO: Add tests for the remaining functions.
+
+
+def test_variant_clone_shares_the_heavy_members():
+    variant = PhAdorbVariant.from_trusted(**example_variant_fields(_grid_region_years=2))
+    clone = variant.clone(price_of_carbon=0.5, name="Clone")
+
+    assert clone.price_of_carbon == 0.5 and variant.price_of_carbon == 0.25
+    assert clone.name == "Clone"
+    assert clone.hourly_purchased_electricity_kwh is variant.hourly_purchased_electricity_kwh
+    assert clone.grid_region is variant.grid_region
+    assert clone.national_emissions is variant.national_emissions
+    assert clone.electricity == variant.electricity and clone.electricity is not variant.electricity
+    assert clone.construction_collection is not variant.construction_collection
+
+
+def test_variant_clone_collections_are_independent():
+    from ph_adorb.constructions import PhAdorbConstruction
+
+    variant = PhAdorbVariant.from_trusted(**example_variant_fields(_grid_region_years=2))
+    variant.construction_collection.add_construction(
+        PhAdorbConstruction(
+            display_name="Wall",
+            identifier="Wall",
+            CO2_kg_per_m2=100,
+            cost_per_m2=50,
+            lifetime_years=30,
+            labor_fraction=0.4,
+            area_m2=10.0,
+        )
+    )
+    clone = variant.clone()
+    assert clone.construction_collection.get_construction("Wall").area_m2 == 10.0
+    clone.construction_collection.set_constructions_ft2_quantities({"Wall": 1_000.0})
+
+    assert variant.construction_collection.get_construction("Wall").area_m2 == 10.0
+    assert variant.construction_collection.total_cost == pytest.approx(500.0)
+    assert clone.construction_collection.get_construction("Wall").area_m2 == pytest.approx(1_000.0 / 10.7639)
+
+
+def test_variant_clone_does_not_copy_the_overrides(monkeypatch):
+    from ph_adorb.constructions import PhAdorbConstructionCollection
+
+    variant = PhAdorbVariant.from_trusted(**example_variant_fields(_grid_region_years=2))
+    new_collection = PhAdorbConstructionCollection()
+    new_electricity = variant.electricity.copy(update={"purchase_price_per_kwh": 1.0})
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("An overridden field was copied.")
+
+    monkeypatch.setattr(PhAdorbConstructionCollection, "duplicate", _fail)
+    clone = variant.clone(construction_collection=new_collection, electricity=new_electricity)
+    assert clone.construction_collection is new_collection
+    assert clone.electricity is new_electricity
+    assert clone.gas == variant.gas and clone.gas is not variant.gas
+
+
+def test_variant_clone_unknown_field():
+    variant = PhAdorbVariant.from_trusted(**example_variant_fields(_grid_region_years=2))
+    with pytest.raises(ValueError):
+        variant.clone(not_a_field=1)
+
+
+def test_variant_clone_collections_are_copy_on_write():
+    from ph_adorb.constructions import PhAdorbConstruction
+    from ph_adorb.versioned_model import SharedModelError
+
+    variant = PhAdorbVariant.from_trusted(**example_variant_fields(_grid_region_years=2))
+    variant.construction_collection.add_construction(
+        PhAdorbConstruction(
+            display_name="Wall",
+            identifier="Wall",
+            CO2_kg_per_m2=100,
+            cost_per_m2=50,
+            lifetime_years=30,
+            labor_fraction=0.4,
+            area_m2=10.0,
+        )
+    )
+    wall = variant.construction_collection.values()[0]
+    arrays = variant.construction_collection.to_arrays()
+    clones = [variant.clone() for _ in range(3)]
+
+    # -- Until they are changed, all the clones share the (read-only) Constructions and cached arrays
+    assert all(c.construction_collection.values()[0] is wall for c in clones)
+    assert all(c.construction_collection.to_arrays() is arrays for c in clones)
+    with pytest.raises(SharedModelError):
+        wall.area_m2 = 20.0
+
+    # -- A clone's edit copies only that clone's Constructions
+    clones[0].construction_collection.get_construction("Wall").area_m2 = 20.0
+    assert clones[0].construction_collection.total_cost == pytest.approx(1_000.0)
+    assert variant.construction_collection.total_cost == pytest.approx(500.0)
+    assert clones[1].construction_collection.values()[0] is wall
+
+    # -- An edit of the original does not change the clones
+    variant.construction_collection.get_construction("Wall").area_m2 = 30.0
+    assert variant.construction_collection.total_cost == pytest.approx(1_500.0)
+    assert clones[1].construction_collection.total_cost == pytest.approx(500.0)
+    assert clones[0].construction_collection.total_cost == pytest.approx(1_000.0)
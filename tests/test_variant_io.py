@@ -0,0 +1,112 @@
+import multiprocessing
+
+import numpy as np
+import pytest
+
+from ph_adorb.constructions import PhAdorbConstruction
+from ph_adorb.equipment import PhAdorbEquipment, PhAdorbEquipmentType
+from ph_adorb.grid_region import write_CO2_factors_to_json_file
+from ph_adorb.measures import CO2MeasureType, PhAdorbCO2ReductionMeasure
+from ph_adorb.variant import PhAdorbVariant, calc_variant_yearly_ADORB_costs_array
+from ph_adorb.variant_io import (
+    VariantFormatError,
+    decode_variant,
+    encode_variant,
+    load_variant,
+    save_variant,
+)
+from tests.variant_factory import example_variant_fields
+
+
+def _variant() -> PhAdorbVariant:
+    fields = example_variant_fields(_grid_region_years=2)
+    fields["analysis_duration"] = 2
+    variant = PhAdorbVariant.from_trusted(**fields)
+    variant.construction_collection.add_construction(
+        PhAdorbConstruction(
+            display_name="Wall",
+            identifier="Wall-ID",
+            CO2_kg_per_m2=100,
+            cost_per_m2=50,
+            lifetime_years=30,
+            labor_fraction=0.4,
+            area_m2=100.0,
+        )
+    )
+    variant.equipment_collection.add_equipment(
+        PhAdorbEquipment(
+            name="Boiler",
+            equipment_type=PhAdorbEquipmentType.MECHANICAL,
+            cost=5000.0,
+            lifetime_years=15,
+            labor_fraction=0.2,
+            quantity=2,
+        )
+    )
+    for kg_CO2 in (None, 12.5):
+        variant.measure_collection.add_measure(
+            PhAdorbCO2ReductionMeasure(
+                measure_type=CO2MeasureType.PERFORMANCE,
+                name=f"Retrofit {kg_CO2}",
+                year=1,
+                cost=20_000.0,
+                kg_CO2=kg_CO2,
+                country_name="USA",
+                labor_fraction=0.5,
+            )
+        )
+    return variant
+
+
+def test_variant_round_trip_with_grid_region_by_reference():
+    variant = _variant()
+    data = encode_variant(variant)
+    restored = decode_variant(data, _grid_region={variant.grid_region.region_code: variant.grid_region})
+
+    assert restored == variant
+    assert restored.grid_region is variant.grid_region
+    assert restored.measure_collection.get_measure("Retrofit None").kg_CO2 is None
+    assert restored.measure_collection.get_measure("Retrofit 12.5").measure_type == CO2MeasureType.PERFORMANCE
+    assert not restored.hourly_purchased_electricity_kwh.flags.writeable
+    np.testing.assert_array_equal(
+        calc_variant_yearly_ADORB_costs_array(restored), calc_variant_yearly_ADORB_costs_array(variant)
+    )
+    assert len(data) < 8_760 * 8 + 20_000  # -- The raw hourly array, plus a little overhead
+
+
+def test_variant_round_trip_with_embedded_grid_region(tmp_path):
+    variant = _variant()
+    save_variant(tmp_path / "variant.npz", variant, _embed_grid_region=True)
+    restored = load_variant(tmp_path / "variant.npz")
+    assert restored.grid_region == variant.grid_region
+    assert restored == variant
+
+
+def test_variant_grid_region_loaded_from_its_file(tmp_path):
+    variant = _variant()
+    write_CO2_factors_to_json_file(tmp_path / "grid.json", variant.grid_region)
+    save_variant(tmp_path / "variant.npz", variant, _grid_region_file=tmp_path / "grid.json")
+    assert load_variant(tmp_path / "variant.npz").grid_region == variant.grid_region
+
+
+def test_variant_missing_grid_region():
+    variant = _variant()
+    with pytest.raises(VariantFormatError):
+        decode_variant(encode_variant(variant))
+
+
+# -- Each worker process loads the (shared) grid-regions only once.
+_WORKER_GRID_REGIONS = {}
+
+
+def _total_ADORB_cost(_data: bytes) -> float:
+    variant = decode_variant(_data, _grid_region=_WORKER_GRID_REGIONS)
+    return float(calc_variant_yearly_ADORB_costs_array(variant).sum())
+
+
+def test_variant_bytes_can_be_sent_to_worker_processes():
+    variant = _variant()
+    _WORKER_GRID_REGIONS[variant.grid_region.region_code] = variant.grid_region
+    with multiprocessing.get_context("fork").Pool(2) as pool:
+        totals = pool.map(_total_ADORB_cost, [encode_variant(variant)] * 2)
+    assert totals == [pytest.approx(float(calc_variant_yearly_ADORB_costs_array(variant).sum()))] * 2
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from ph_adorb.constructions import PhAdorbConstruction
+from ph_adorb.equipment import PhAdorbEquipment, PhAdorbEquipmentType
+from ph_adorb.measures import CO2MeasureType, PhAdorbCO2ReductionMeasure
+from ph_adorb.variant import PhAdorbVariant, calc_variant_yearly_ADORB_costs_array
+from ph_adorb.variant_result import ItemDelta, ItemDeltaError, PhAdorbVariantResult
+from tests.variant_factory import example_variant_fields
+
+
+def _wall(_cost_per_m2: float = 50.0, _lifetime_years: int = 30) -> PhAdorbConstruction:
+    return PhAdorbConstruction(
+        display_name="Wall",
+        identifier="Wall",
+        CO2_kg_per_m2=100,
+        cost_per_m2=_cost_per_m2,
+        lifetime_years=_lifetime_years,
+        labor_fraction=0.4,
+        area_m2=100.0,
+    )
+
+
+def _boiler() -> PhAdorbEquipment:
+    return PhAdorbEquipment(
+        name="Boiler",
+        equipment_type=PhAdorbEquipmentType.MECHANICAL,
+        cost=5000.0,
+        lifetime_years=15,
+        labor_fraction=0.2,
+        quantity=2,
+    )
+
+
+def _measure() -> PhAdorbCO2ReductionMeasure:
+    return PhAdorbCO2ReductionMeasure(
+        measure_type=CO2MeasureType.PERFORMANCE,
+        name="Retrofit",
+        year=10,
+        cost=20_000.0,
+        kg_CO2=None,
+        country_name="USA",
+        labor_fraction=0.5,
+    )
+
+
+def _variant() -> PhAdorbVariant:
+    variant = PhAdorbVariant.from_trusted(**example_variant_fields(_grid_region_years=51))
+    variant.construction_collection.add_construction(_wall())
+    return variant
+
+
+def test_variant_result_matches_full_calculation():
+    variant = _variant()
+    result = PhAdorbVariantResult.from_variant(variant)
+    np.testing.assert_allclose(result.yearly_costs, calc_variant_yearly_ADORB_costs_array(variant))
+    with pytest.raises(ValueError):
+        result.yearly_costs[0, 0] = 1.0
+
+
+def test_variant_result_changed_construction():
+    variant = _variant()
+    result = PhAdorbVariantResult.from_variant(variant)
+
+    new_wall = _wall(_cost_per_m2=80.0, _lifetime_years=20)
+    result.apply(ItemDelta.changed(_wall(), new_wall))
+    variant.construction_collection.add_construction(new_wall)
+    np.testing.assert_allclose(result.yearly_costs, calc_variant_yearly_ADORB_costs_array(variant), atol=1e-6)
+
+
+def test_variant_result_added_and_removed_items():
+    variant = _variant()
+    result = PhAdorbVariantResult.from_variant(variant)
+
+    result.apply(ItemDelta.added(_boiler()))
+    result.apply(ItemDelta.added(_measure()))
+    variant.equipment_collection.add_equipment(_boiler())
+    variant.measure_collection.add_measure(_measure())
+    np.testing.assert_allclose(result.yearly_costs, calc_variant_yearly_ADORB_costs_array(variant), atol=1e-6)
+
+    before = PhAdorbVariantResult.from_variant(_variant())
+    result.apply(ItemDelta.removed(_boiler()))
+    result.apply(ItemDelta.removed(_measure()))
+    np.testing.assert_allclose(result.yearly_costs, before.yearly_costs, atol=1e-6)
+
+
+def test_item_delta_errors():
+    with pytest.raises(ItemDeltaError):
+        ItemDelta()
+    with pytest.raises(ItemDeltaError):
+        ItemDelta.changed(_wall(), _boiler())
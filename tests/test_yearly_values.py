@@ -0,0 +1,32 @@
+import dataclasses
+
+import numpy as np
+import pytest
+
+from ph_adorb.yearly_values import YearlyCost, YearlyKgCO2, YearlyPresentValueFactor
+
+
+def test_yearly_cost_is_frozen_and_slotted():
+    yearly_cost = YearlyCost(100.0, 1, "Test")
+    assert not hasattr(yearly_cost, "__dict__")
+    assert hash(yearly_cost) == hash(YearlyCost(100.0, 1, "Test"))
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        yearly_cost.cost = 200.0  # type: ignore
+
+
+def test_yearly_cost_from_arrays():
+    yearly_costs = YearlyCost.from_arrays(np.array([1.0, 2.0]), np.array([0, 20]), ["Wall", "Wall"])
+    assert yearly_costs == [YearlyCost(1.0, 0, "Wall"), YearlyCost(2.0, 20, "Wall")]
+    assert type(yearly_costs[0].cost) is float
+    assert type(yearly_costs[0].year) is int
+    assert yearly_costs[0].description is yearly_costs[1].description
+
+
+def test_yearly_kgCO2_from_arrays_single_description():
+    yearly_kgCO2s = YearlyKgCO2.from_arrays([1.0, 2.0], [0, 1], "Roof")
+    assert [_.description for _ in yearly_kgCO2s] == ["Roof", "Roof"]
+
+
+def test_yearly_pv_factor_from_arrays():
+    factors = YearlyPresentValueFactor.from_arrays([1.02, 1.0404], [1, 2])
+    assert factors[1] == YearlyPresentValueFactor(1.0404, 2)
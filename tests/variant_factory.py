@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.10 -*-
+
+"""Example PhAdorbVariant data, shared by the tests and the benchmarks."""
+
+import random
+
+from ph_adorb.fuel import PhAdorbFuel, PhAdorbFuelType
+from ph_adorb.grid_region import PhAdorbGridRegion
+from ph_adorb.national_emissions import PhAdorbNationalEmissions
+
+HOURS_PER_YEAR = 8760
+GRID_REGION_YEARS = 89
+
+
+def example_variant_fields(_grid_region_years: int = GRID_REGION_YEARS) -> dict:
+    """Return the (already validated) data needed to build a typical PhAdorbVariant."""
+    random.seed(1)
+    return {
+        "name": "Example Variant",
+        "total_purchased_gas_kwh": 12_000.0,
+        "hourly_purchased_electricity_kwh": [random.uniform(0, 3) for _ in range(HOURS_PER_YEAR)],
+        "total_sold_electricity_kwh": 500.0,
+        "peak_electric_usage_W": 9_000.0,
+        "electricity": PhAdorbFuel(
+            fuel_type=PhAdorbFuelType.ELECTRICITY,
+            purchase_price_per_kwh=0.15,
+            sale_price_per_kwh=0.05,
+            annual_base_price=200.0,
+        ),
+        "gas": PhAdorbFuel(
+            fuel_type=PhAdorbFuelType.NATURAL_GAS,
+            purchase_price_per_kwh=0.08,
+            sale_price_per_kwh=0.0,
+            annual_base_price=150.0,
+        ),
+        "grid_region": PhAdorbGridRegion(
+            region_code="EXAMPLE",
+            region_name="Example",
+            description="Example",
+            hourly_CO2_factors={
+                2023 + i: [random.uniform(100, 500) for _ in range(HOURS_PER_YEAR)] for i in range(_grid_region_years)
+            },
+        ),
+        "national_emissions": PhAdorbNationalEmissions(
+            country_name="USA", us_trading_rank=0, GDP_million_USD=1.0, CO2_MT=1.0, kg_CO2_per_USD=0.234
+        ),
+        "analysis_duration": 50,
+        "envelope_labor_cost_fraction": 0.4,
+    }